@@ -0,0 +1,92 @@
+"""Snapshot the landing pages behind every parser's test_cases.
+
+    python -m benchmarks.corpus [--out benchmarks/corpus] [--refresh]
+
+Needs the live S3 credentials and api.unpaywall.org. Pages are stored
+exactly as served (gzipped) under the same keys, so benchmarks.standins can
+play them back:
+
+    <out>/landing-pages/<S3 key>    publisher pages, by doi_to_lp_key
+    <out>/repo-pages/<page id>      repository pages
+    <out>/manifest.json             which parser each page belongs to
+"""
+import argparse
+import json
+import os
+
+import requests
+
+from benchmarks.standins import LANDING_PAGES_DIR, REPO_PAGES_DIR
+from exceptions import S3FileNotFoundError
+from publisher.parsers import publisher_parsers
+from repository.controller import REPO_PAGE_ENDPOINT
+from repository.parsers.parser import RepositoryParser
+from util.s3 import S3_LANDING_PAGE_BUCKET, doi_to_lp_key, get_body
+
+MANIFEST = 'manifest.json'
+
+
+def test_case_pages():
+    publisher = [{'doi': case['doi'], 'parser': cls.parser_name}
+                 for cls in publisher_parsers()
+                 for case in cls.test_cases]
+    repository = [{'page_id': case['page-id'], 'parser': cls.parser_name}
+                  for cls in RepositoryParser.__subclasses__()
+                  for case in cls.test_cases]
+    return publisher, repository
+
+
+def load_manifest(corpus_dir):
+    with open(os.path.join(corpus_dir, MANIFEST)) as f:
+        return json.load(f)
+
+
+def save(path, contents):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(f'{path}.tmp', 'wb') as f:
+        f.write(contents)
+    os.replace(f'{path}.tmp', path)
+
+
+def snapshot(out, refresh=False):
+    publisher, repository = test_case_pages()
+    manifest = {'publisher': [], 'repository': []}
+
+    for page in publisher:
+        key = doi_to_lp_key(page['doi'])
+        path = os.path.join(out, LANDING_PAGES_DIR, key)
+        if refresh or not os.path.exists(path):
+            try:
+                save(path, get_body(S3_LANDING_PAGE_BUCKET, key))
+            except S3FileNotFoundError:
+                print(f'No landing page for {page["doi"]}')
+                continue
+        manifest['publisher'].append({**page, 'key': key})
+
+    for page in repository:
+        path = os.path.join(out, REPO_PAGES_DIR, page['page_id'])
+        if refresh or not os.path.exists(path):
+            r = requests.get(f'{REPO_PAGE_ENDPOINT}{page["page_id"]}')
+            if r.status_code != 200:
+                print(f'No repository page for {page["page_id"]}')
+                continue
+            save(path, r.content)
+        manifest['repository'].append(page)
+
+    save(os.path.join(out, MANIFEST),
+         json.dumps(manifest, indent=1).encode())
+    print(f'{len(manifest["publisher"])} publisher and '
+          f'{len(manifest["repository"])} repository pages in {out}')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--out', default='benchmarks/corpus')
+    parser.add_argument('--refresh', action='store_true',
+                        help='fetch pages again even if already saved')
+    args = parser.parse_args()
+    snapshot(args.out, args.refresh)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+"""Time the fallback abstract/corresponding-author passes as pages grow.
+
+Builds synthetic landing pages with n article sections and n author
+blocks, runs fallback_parse_abstract and fallback_mark_corresponding_authors
+on each, and prints time per KB of HTML. With linear passes the per-KB
+time stays roughly flat as n grows, and the fitted exponent is close to 1.
+
+    python -m benchmarks.fallback_scaling
+"""
+import math
+import time
+
+from bs4 import BeautifulSoup
+
+from publisher.parsers.generic import GenericPublisherParser
+
+SIZES = [250, 500, 1000, 2000, 4000]
+REPEATS = 3
+
+
+def make_page(n):
+    authors = ''.join(
+        f'<div class="author-block"><span class="author-name">Author{i} '
+        f'Surname{i}</span><div class="author-details"><span>Institute {i}'
+        f'</span><a href="mailto:author{i}@example.org">email</a></div></div>'
+        for i in range(n))
+    sections = ''.join(
+        f'<div class="section" id="s{i}"><div class="section-body">'
+        f'<p class="para">Section {i} text.</p></div></div>'
+        for i in range(n))
+    abstract = ('<section class="article-abstract"><h2 class="title">Abstract'
+                '</h2><div class="abstract-body"><p>'
+                + 'This page has a long abstract paragraph. ' * 5
+                + '</p></div></section>')
+    return (f'<html><body><div class="article"><div class="authors">{authors}'
+            f'</div>{sections}{abstract}</div></body></html>')
+
+
+def time_page(html):
+    soup = BeautifulSoup(html, 'lxml')
+    parser = GenericPublisherParser(soup)
+    authors = [{'name': 'Author1 Surname1', 'is_corresponding': None}]
+    best = float('inf')
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        parser.fallback_parse_abstract()
+        parser.fallback_mark_corresponding_authors(authors)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    results = []
+    print(f'{"n":>6} {"KB":>8} {"ms":>9} {"us/KB":>8}')
+    for n in SIZES:
+        html = make_page(n)
+        kb = len(html) / 1024
+        elapsed = time_page(html)
+        results.append((kb, elapsed))
+        print(f'{n:>6} {kb:>8.0f} {elapsed * 1000:>9.1f} '
+              f'{elapsed * 1e6 / kb:>8.1f}')
+
+    (kb_first, t_first), (kb_last, t_last) = results[0], results[-1]
+    exponent = math.log(t_last / t_first) / math.log(kb_last / kb_first)
+    print(f'time ~ size^{exponent:.2f}')
+
+
+if __name__ == '__main__':
+    main()
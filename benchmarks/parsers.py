@@ -0,0 +1,207 @@
+"""Benchmark each parser and the endpoints on the offline corpus.
+
+    python -m benchmarks.parsers [--corpus benchmarks/corpus] [--repeat 3]
+        [--baseline benchmarks/baseline.json] [--save-baseline]
+        [--tolerance 0.25]
+
+Pages come from benchmarks.standins serving a snapshot taken with
+benchmarks.corpus, so no network is needed. Rows:
+
+    publisher/<parser>      parse_publisher_page on that parser's pages
+    repository/<parser>     /parse-repository on that parser's pages
+    /parse-publisher        the endpoint end to end, cache bypassed
+    /parse-publisher cached the endpoint answering from Redis
+
+For each row it reports throughput (pages/sec), p50/p99 latency and peak
+traced memory, and compares them with the baseline. The exit status is 1
+if any row regressed by more than the tolerance. Baselines are only
+comparable between runs on the same machine.
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+import time
+import tracemalloc
+from collections import defaultdict
+
+from benchmarks.standins import LANDING_PAGES_DIR, StandIns
+
+# (metric, True if bigger is better, differences below this never count)
+METRICS = [
+    ('pages_per_sec', True, 0),
+    ('p50_ms', False, 1),
+    ('p99_ms', False, 2),
+    ('peak_mb', False, 1),
+]
+
+
+def percentile(values, p):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * p / 100))]
+
+
+def quietly(call):
+    """Run call, ignoring its output and errors (a failed parse still counts)."""
+    def run():
+        try:
+            call()
+        except Exception:
+            pass
+    return run
+
+
+def measure(calls, repeat):
+    """Time every call repeat times, then trace memory over one more pass."""
+    latencies = []
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for call in calls:
+            call_start = time.perf_counter()
+            call()
+            latencies.append(time.perf_counter() - call_start)
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    for call in calls:
+        call()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        'pages': len(calls),
+        'pages_per_sec': len(latencies) / elapsed,
+        'p50_ms': percentile(latencies, 50) * 1000,
+        'p99_ms': percentile(latencies, 99) * 1000,
+        'peak_mb': peak / 2 ** 20,
+    }
+
+
+def benchmark_rows(corpus_dir, manifest):
+    """(name, calls) for every row; imports the app, so call after setup."""
+    from publisher.pipeline import parse_publisher_page
+    from util.landing_page import read_landing_page
+    from util.s3 import is_pdf
+    from views import app
+    import sentry_sdk
+
+    # app.py reports to production Sentry; the corpus has pages that fail
+    # on purpose.
+    sentry_sdk.init()
+    client = app.test_client()
+    rows = []
+
+    by_parser = defaultdict(list)
+    for page in manifest['publisher']:
+        path = os.path.join(corpus_dir, LANDING_PAGES_DIR, page['key'])
+        with open(path, 'rb') as f:
+            lp_contents = read_landing_page([f.read()])
+        if not is_pdf(lp_contents):
+            by_parser[page['parser']].append(quietly(
+                lambda doi=page['doi'], lp=lp_contents:
+                parse_publisher_page(doi, lp)))
+    rows.extend((f'publisher/{parser}', calls)
+                for parser, calls in sorted(by_parser.items()))
+
+    by_parser = defaultdict(list)
+    for page in manifest['repository']:
+        by_parser[page['parser']].append(quietly(
+            lambda page_id=page['page_id']:
+            client.get(f'/parse-repository?page-id={page_id}')))
+    rows.extend((f'repository/{parser}', calls)
+                for parser, calls in sorted(by_parser.items()))
+
+    dois = [page['doi'] for page in manifest['publisher']]
+    rows.append(('/parse-publisher', [quietly(
+        lambda doi=doi: client.get(f'/parse-publisher?doi={doi}&check_cache=f'))
+        for doi in dois]))
+    cached = [quietly(lambda doi=doi: client.get(f'/parse-publisher?doi={doi}'))
+              for doi in dois]
+    for call in cached:
+        call()
+    rows.append(('/parse-publisher cached', cached))
+    return rows
+
+
+def compare(results, baseline, tolerance):
+    """Names of the (row, metric) pairs that got worse than tolerance allows."""
+    regressions = []
+    for name, row in results.items():
+        base = baseline.get(name)
+        if not base:
+            continue
+        for metric, bigger_is_better, noise in METRICS:
+            change = row[metric] - base[metric]
+            if bigger_is_better:
+                change = -change
+            if change > noise and change > tolerance * base[metric]:
+                regressions.append(f'{name} {metric}')
+    return regressions
+
+
+def print_table(results, baseline):
+    print(f'{"row":<45} {"pages":>5} {"pages/s":>9} {"vs base":>8} '
+          f'{"p50 ms":>8} {"p99 ms":>8} {"peak MB":>8}')
+    for name, row in results.items():
+        base = baseline.get(name)
+        delta = (f'{row["pages_per_sec"] / base["pages_per_sec"] - 1:+.0%}'
+                 if base else '')
+        print(f'{name:<45} {row["pages"]:>5} {row["pages_per_sec"]:>9.1f} '
+              f'{delta:>8} {row["p50_ms"]:>8.1f} {row["p99_ms"]:>8.1f} '
+              f'{row["peak_mb"]:>8.1f}')
+
+
+def run(corpus_dir, repeat):
+    with StandIns(corpus_dir) as stand_ins:
+        os.environ.update(stand_ins.env())
+        # Measure the S3 and Redis round trips, not the in-process caches.
+        os.environ['LANDING_PAGE_MEMORY_CACHE_BYTES'] = '0'
+        os.environ['RESPONSE_MEMORY_CACHE_BYTES'] = '0'
+
+        from benchmarks.corpus import load_manifest
+        manifest = load_manifest(corpus_dir)
+
+        results = {}
+        # Parsers print and log tracebacks freely; keep the report readable.
+        with contextlib.redirect_stdout(io.StringIO()), \
+                contextlib.redirect_stderr(io.StringIO()):
+            for name, calls in benchmark_rows(corpus_dir, manifest):
+                if calls:
+                    results[name] = measure(calls, repeat)
+        return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--corpus', default='benchmarks/corpus')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--baseline', default='benchmarks/baseline.json')
+    parser.add_argument('--save-baseline', action='store_true',
+                        help='store this run as the new baseline')
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help='allowed relative slowdown before failing')
+    args = parser.parse_args()
+
+    results = run(args.corpus, args.repeat)
+
+    baseline = {}
+    if os.path.exists(args.baseline) and not args.save_baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+    print_table(results, baseline)
+
+    if args.save_baseline:
+        with open(args.baseline, 'w') as f:
+            json.dump(results, f, indent=1, sort_keys=True)
+        print(f'Saved baseline to {args.baseline}')
+        return
+
+    if regressions := compare(results, baseline, args.tolerance):
+        print('Regressed: ' + ', '.join(regressions))
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
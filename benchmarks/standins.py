@@ -0,0 +1,224 @@
+"""Local stand-ins for S3, Redis and the repository page archive.
+
+Both serve a corpus written by benchmarks.corpus and speak the real wire
+protocols, so the app's own boto3 and redis clients are used unchanged and
+every process started with env() pointed at them sees the same data:
+
+    python -m benchmarks.standins benchmarks/corpus
+
+prints the environment to export before starting the app or the tests.
+Every bucket serves the corpus's landing-pages directory.
+"""
+import hashlib
+import os
+import socketserver
+import sys
+import threading
+import time
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import unquote, urlparse
+
+from util.redis_lock import RELEASE_SCRIPT
+
+LANDING_PAGES_DIR = 'landing-pages'
+REPO_PAGES_DIR = 'repo-pages'
+REPO_PAGE_PATH = '/repo_page/'
+
+NO_SUCH_KEY = (b'<?xml version="1.0" encoding="UTF-8"?>\n<Error><Code>'
+               b'NoSuchKey</Code><Message>The specified key does not exist.'
+               b'</Message></Error>')
+
+
+class S3Handler(BaseHTTPRequestHandler):
+    """Path-style GetObject/HeadObject, plus GET /repo_page/<id>."""
+
+    def do_GET(self):
+        self.respond(send_body=True)
+
+    def do_HEAD(self):
+        self.respond(send_body=False)
+
+    def respond(self, send_body):
+        path = urlparse(self.path).path
+        if path.startswith(REPO_PAGE_PATH):
+            filename = os.path.join(self.server.root, REPO_PAGES_DIR,
+                                    unquote(path[len(REPO_PAGE_PATH):]))
+        else:
+            _, _, key = unquote(path).lstrip('/').partition('/')
+            filename = os.path.join(self.server.root, LANDING_PAGES_DIR, key)
+
+        inside_root = os.path.realpath(filename).startswith(
+            os.path.realpath(self.server.root) + os.sep)
+        if not inside_root or not os.path.isfile(filename):
+            self.send_response(404)
+            self.send_header('Content-Type', 'application/xml')
+            self.send_header('Content-Length', str(len(NO_SUCH_KEY)))
+            self.end_headers()
+            if send_body:
+                self.wfile.write(NO_SUCH_KEY)
+            return
+
+        with open(filename, 'rb') as f:
+            body = f.read()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/octet-stream')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('ETag', f'"{hashlib.md5(body).hexdigest()}"')
+        self.send_header('Last-Modified',
+                         formatdate(os.path.getmtime(filename), usegmt=True))
+        self.end_headers()
+        if send_body:
+            self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class RedisHandler(socketserver.StreamRequestHandler):
+    """The handful of commands parseland sends, in RESP2 or RESP3.
+
+    EVAL only runs util.redis_lock's release script.
+    """
+
+    def handle(self):
+        protocol = 2
+        while True:
+            try:
+                command = self.read_command()
+            except (ConnectionError, ValueError):
+                return
+            if command is None:
+                return
+            if command and command[0].upper() == b'HELLO':
+                protocol = int(command[1]) if len(command) > 1 else protocol
+                reply = b'%1\r\n' if protocol == 3 else b'*2\r\n'
+                reply += b'$5\r\nproto\r\n:%d\r\n' % protocol
+            else:
+                reply = self.server.execute(command, protocol)
+            self.wfile.write(reply)
+            self.wfile.flush()
+
+    def read_command(self):
+        line = self.rfile.readline()
+        if not line:
+            return None
+        if not line.startswith(b'*'):
+            return line.split()
+        args = []
+        for _ in range(int(line[1:])):
+            length = int(self.rfile.readline()[1:])
+            args.append(self.rfile.read(length + 2)[:-2])
+        return args
+
+
+class RedisServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, address):
+        super().__init__(address, RedisHandler)
+        self.data = {}
+        self.lock = threading.Lock()
+
+    def lookup(self, key):
+        value, expires = self.data.get(key, (None, None))
+        if expires is not None and expires < time.monotonic():
+            del self.data[key]
+            return None
+        return value
+
+    def execute(self, command, protocol=2):
+        name = command[0].upper() if command else b''
+        args = command[1:]
+        with self.lock:
+            if name == b'PING':
+                return b'+PONG\r\n'
+            if name in (b'CLIENT', b'SELECT'):
+                return b'+OK\r\n'
+            if name == b'GET':
+                return bulk(self.lookup(args[0]), protocol)
+            if name == b'MGET':
+                values = [bulk(self.lookup(key), protocol) for key in args]
+                return b'*%d\r\n' % len(values) + b''.join(values)
+            if name == b'SET':
+                expires = None
+                options = [arg.upper() for arg in args[2:]]
+                if b'NX' in options and self.lookup(args[0]) is not None:
+                    return bulk(None, protocol)
+                if b'EX' in options:
+                    expires = time.monotonic() + int(
+                        args[2 + options.index(b'EX') + 1])
+                if b'PX' in options:
+                    expires = time.monotonic() + int(
+                        args[2 + options.index(b'PX') + 1]) / 1000
+                self.data[args[0]] = (args[1], expires)
+                return b'+OK\r\n'
+            if name == b'DEL':
+                return b':%d\r\n' % sum(
+                    self.data.pop(key, None) is not None for key in args)
+            if name == b'EVAL' and args[0].decode() == RELEASE_SCRIPT:
+                key, token = args[2], args[3]
+                released = self.lookup(key) == token
+                if released:
+                    del self.data[key]
+                return b':%d\r\n' % released
+            if name in (b'FLUSHDB', b'FLUSHALL'):
+                self.data.clear()
+                return b'+OK\r\n'
+        return b'-ERR unknown command\r\n'
+
+
+def bulk(value, protocol=2):
+    if value is None:
+        return b'_\r\n' if protocol == 3 else b'$-1\r\n'
+    return b'$%d\r\n%s\r\n' % (len(value), value)
+
+
+class StandIns:
+    """Start both stand-ins on free local ports; use as a context manager."""
+
+    def __init__(self, corpus_dir):
+        self.s3 = ThreadingHTTPServer(('127.0.0.1', 0), S3Handler)
+        self.s3.daemon_threads = True
+        self.s3.root = corpus_dir
+        self.redis = RedisServer(('127.0.0.1', 0))
+
+    def __enter__(self):
+        for server in (self.s3, self.redis):
+            threading.Thread(target=server.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc_info):
+        for server in (self.s3, self.redis):
+            server.shutdown()
+            server.server_close()
+
+    def env(self):
+        """Environment that points the app at the stand-ins."""
+        s3_url = f'http://127.0.0.1:{self.s3.server_address[1]}'
+        return {
+            'AWS_S3_ENDPOINT_URL': s3_url,
+            'AWS_S3_LANDING_PAGE_BUCKET': 'landing-pages',
+            'AWS_ACCESS_KEY_ID': 'local',
+            'AWS_SECRET_ACCESS_KEY': 'local',
+            'AWS_DEFAULT_REGION': 'us-east-1',
+            'REDISCLOUD_URL': f'redis://127.0.0.1:{self.redis.server_address[1]}',
+            'REPO_PAGE_ENDPOINT': f'{s3_url}{REPO_PAGE_PATH}',
+        }
+
+
+def main():
+    corpus_dir = sys.argv[1] if len(sys.argv) > 1 else 'benchmarks/corpus'
+    with StandIns(corpus_dir) as stand_ins:
+        for name, value in stand_ins.env().items():
+            print(f'export {name}={value}')
+        print('Serving; Ctrl-C to stop.', file=sys.stderr)
+        try:
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,115 @@
+"""Measure how long a fresh worker takes to start and how much memory it uses.
+
+    python -m benchmarks.startup [--corpus benchmarks/corpus] [--repeat 5]
+
+Each run starts a new interpreter, as a gunicorn worker would without
+preloading, pointed at benchmarks.standins. Rows:
+
+    import views              importing the app
+    + first /parse-oa         then answering one /parse-oa request
+    + first /parse-publisher  then one /parse-publisher request
+
+Requests bypass the cache. For each row it reports the median seconds since
+the import started and the median peak RSS of the process so far. The
+requests show where work deferred from import time ends up.
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import resource
+import statistics
+import subprocess
+import sys
+import time
+
+from benchmarks.standins import LANDING_PAGES_DIR, StandIns
+
+STAGES = ['import views', '+ first /parse-oa', '+ first /parse-publisher']
+
+
+def rss_mb():
+    """Peak RSS of this process so far."""
+    # ru_maxrss is in kilobytes on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def worker(doi):
+    """Run in the child: time each stage and print the results as JSON."""
+    results = []
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()), \
+            contextlib.redirect_stderr(io.StringIO()):
+        from views import app
+        results.append((time.perf_counter() - start, rss_mb()))
+
+        import sentry_sdk
+        # app.py reports to production Sentry
+        sentry_sdk.init()
+        client = app.test_client()
+        client.get(f'/parse-oa?doi={doi}&check_cache=f')
+        results.append((time.perf_counter() - start, rss_mb()))
+        client.get(f'/parse-publisher?doi={doi}&check_cache=f')
+        results.append((time.perf_counter() - start, rss_mb()))
+    print(json.dumps(results))
+
+
+def parseable_dois(corpus_dir):
+    """DOIs of the corpus's landing pages that reach the parsers."""
+    from benchmarks.corpus import load_manifest
+    from publisher.utils import check_bad_landing_page, \
+        check_landing_page_bytes
+    from util.landing_page import read_landing_page
+    from util.parsed_page import ParsedPage
+
+    for page in load_manifest(corpus_dir)['publisher']:
+        path = os.path.join(corpus_dir, LANDING_PAGES_DIR, page['key'])
+        with open(path, 'rb') as f:
+            lp_contents = read_landing_page([f.read()])
+        try:
+            check_landing_page_bytes(lp_contents)
+        except Exception:
+            continue
+        if not check_bad_landing_page(
+                ParsedPage.from_bytes(lp_contents).signals):
+            yield page['doi']
+
+
+def run(corpus_dir, repeat):
+    doi = next(parseable_dois(corpus_dir))
+
+    runs = []
+    with StandIns(corpus_dir) as stand_ins:
+        env = dict(os.environ, **stand_ins.env())
+        for _ in range(repeat):
+            output = subprocess.run(
+                [sys.executable, '-m', 'benchmarks.startup', '--worker', doi],
+                env=env, check=True, capture_output=True, text=True).stdout
+            runs.append(json.loads(output.splitlines()[-1]))
+
+    return {stage: {
+        'seconds': statistics.median(run[i][0] for run in runs),
+        'rss_mb': statistics.median(run[i][1] for run in runs),
+    } for i, stage in enumerate(STAGES)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--corpus', default='benchmarks/corpus')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--worker', metavar='DOI', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        worker(args.worker)
+        return
+
+    results = run(args.corpus, args.repeat)
+    print(f'{"stage":<28} {"seconds":>8} {"RSS MB":>8}')
+    for stage, row in results.items():
+        print(f'{stage:<28} {row["seconds"]:>8.2f} {row["rss_mb"]:>8.1f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,129 @@
+"""Compare gunicorn workers with and without preloading.
+
+    python -m benchmarks.workers [--corpus benchmarks/corpus] [--workers 4]
+        [--requests 40]
+
+Starts gunicorn with gunicorn.conf.py against benchmarks.standins, once
+with GUNICORN_PRELOAD=true and once with false. Once every worker is ready
+it sends some /parse-publisher requests, then reads each process's
+/proc/<pid>/smaps_rollup, so it only runs on Linux. Columns:
+
+    boot s        from launch until every worker is ready
+    worker s      median time from fork until a worker could serve
+    RSS, PSS, private MB
+                  median per worker. PSS splits each shared page between
+                  the processes sharing it, so it stays well below RSS
+                  while the preloaded pages are still shared.
+    total PSS MB  master and workers together, the memory actually used
+"""
+import argparse
+import os
+import re
+import socket
+import statistics
+import subprocess
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+
+from benchmarks.standins import StandIns
+from benchmarks.startup import parseable_dois
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+READY = re.compile(r'Worker ready in ([\d.]+)s \(pid: (\d+)\)')
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def memory_mb(pid):
+    """RSS, PSS and private memory of pid, in MB."""
+    kb = {}
+    with open(f'/proc/{pid}/smaps_rollup') as f:
+        for line in f:
+            name, _, value = line.partition(':')
+            if value.strip().endswith('kB'):
+                kb[name] = int(value.split()[0])
+    return {'rss': kb['Rss'] / 1024, 'pss': kb['Pss'] / 1024,
+            'private': (kb['Private_Clean'] + kb['Private_Dirty']) / 1024}
+
+
+def get(url):
+    try:
+        urllib.request.urlopen(url).read()
+    except urllib.error.HTTPError:
+        pass
+
+
+def measure(env, workers, dois, requests):
+    port = free_port()
+    start = time.monotonic()
+    server = subprocess.Popen(
+        [sys.executable, '-m', 'gunicorn', '-c', 'gunicorn.conf.py',
+         '-w', str(workers), '-b', f'127.0.0.1:{port}', 'views:app'],
+        cwd=REPO_DIR, env=env, stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE, text=True)
+    try:
+        ready = {}
+        for line in server.stderr:
+            if match := READY.search(line):
+                ready[int(match.group(2))] = float(match.group(1))
+                if len(ready) == workers:
+                    break
+        else:
+            raise RuntimeError('gunicorn exited before its workers were ready')
+        boot = time.monotonic() - start
+        # keep reading, so the server never blocks on a full pipe
+        threading.Thread(target=server.stderr.read, daemon=True).start()
+
+        for i in range(requests):
+            get(f'http://127.0.0.1:{port}/parse-publisher?'
+                f'doi={dois[i % len(dois)]}&check_cache=f')
+
+        per_worker = [memory_mb(pid) for pid in ready]
+        master = memory_mb(server.pid)
+    finally:
+        server.terminate()
+        server.wait()
+
+    row = {'boot_s': boot, 'worker_s': statistics.median(ready.values())}
+    for name in ('rss', 'pss', 'private'):
+        row[f'{name}_mb'] = statistics.median(m[name] for m in per_worker)
+    row['total_pss_mb'] = master['pss'] + sum(m['pss'] for m in per_worker)
+    return row
+
+
+def run(corpus_dir, workers, requests):
+    dois = list(parseable_dois(corpus_dir))
+    results = {}
+    with StandIns(corpus_dir) as stand_ins:
+        for mode, preload in (('preload', 'true'), ('no preload', 'false')):
+            env = dict(os.environ, **stand_ins.env(),
+                       GUNICORN_PRELOAD=preload)
+            results[mode] = measure(env, workers, dois, requests)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--corpus', default='benchmarks/corpus')
+    parser.add_argument('--workers', type=int, default=4)
+    parser.add_argument('--requests', type=int, default=40)
+    args = parser.parse_args()
+
+    results = run(args.corpus, args.workers, args.requests)
+    print(f'{"mode":<12} {"boot s":>7} {"worker s":>9} {"RSS MB":>7} '
+          f'{"PSS MB":>7} {"private MB":>11} {"total PSS MB":>13}')
+    for mode, row in results.items():
+        print(f'{mode:<12} {row["boot_s"]:>7.2f} {row["worker_s"]:>9.2f} '
+              f'{row["rss_mb"]:>7.1f} {row["pss_mb"]:>7.1f} '
+              f'{row["private_mb"]:>11.1f} {row["total_pss_mb"]:>13.1f}')
+
+
+if __name__ == '__main__':
+    main()
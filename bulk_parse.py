@@ -0,0 +1,192 @@
+"""Parse a local copy of the landing page bucket without the HTTP server.
+
+Input is a directory, a tar archive or a manifest file (one path per line)
+of gzipped landing pages named by util.s3.doi_to_lp_key. Each page goes
+through the same pipeline as /parse-publisher and the results are written
+as sharded JSONL or Parquet files.
+
+Inputs are processed in a fixed order and a checkpoint is written whenever
+a shard is closed, so an interrupted run picks up at the first unwritten
+shard when started again with the same arguments:
+
+    python bulk_parse.py /data/landing-pages --out /data/parsed --workers 16
+"""
+import argparse
+import json
+import os
+import tarfile
+from multiprocessing import Pool
+from urllib.parse import unquote
+
+from publisher.pipeline import parse_publisher_page, pdf_parser_url, \
+    error_result
+from util.landing_page import read_landing_page
+from util.s3 import is_pdf
+
+CHECKPOINT_FILE = 'checkpoint.json'
+
+
+def key_to_doi(name):
+    name = os.path.basename(name)
+    if name.endswith('.gz'):
+        name = name[:-len('.gz')]
+    return unquote(name)
+
+
+def iter_directory(path):
+    for root, dirs, files in os.walk(path):
+        dirs.sort()
+        for name in sorted(files):
+            yield key_to_doi(name), os.path.join(root, name)
+
+
+def iter_manifest(path):
+    with open(path) as f:
+        for line in f:
+            if line := line.strip():
+                yield key_to_doi(line), line
+
+
+def iter_tar(path):
+    with tarfile.open(path, 'r:*') as tar:
+        for member in tar:
+            if member.isfile():
+                yield key_to_doi(member.name), tar.extractfile(member).read()
+
+
+def iter_inputs(path):
+    """Yield (doi, source) pairs; source is a file path or the gzipped bytes."""
+    if os.path.isdir(path):
+        return iter_directory(path)
+    if tarfile.is_tarfile(path):
+        return iter_tar(path)
+    return iter_manifest(path)
+
+
+def parse_one(task):
+    doi, source = task
+    try:
+        if isinstance(source, str):
+            with open(source, 'rb') as f:
+                source = f.read()
+        lp_contents = read_landing_page([source])
+        if is_pdf(lp_contents):
+            return {"doi": doi, "status": 302,
+                    "location": pdf_parser_url(doi)}
+        return {"doi": doi, "status": 200,
+                **parse_publisher_page(doi, lp_contents)}
+    except Exception as e:
+        return error_result(doi, e)
+
+
+class ShardWriter:
+    """Writes results to numbered shards, publishing each with an atomic rename."""
+
+    def __init__(self, out_dir, fmt, shard_size, shard_index=0):
+        self.out_dir = out_dir
+        self.fmt = fmt
+        self.shard_size = shard_size
+        self.shard_index = shard_index
+        self.rows = []
+
+    def shard_path(self, index):
+        return os.path.join(self.out_dir, f'part-{index:05d}.{self.fmt}')
+
+    def add(self, result):
+        self.rows.append(result)
+        return len(self.rows) >= self.shard_size
+
+    def flush(self):
+        if not self.rows:
+            return
+        path = self.shard_path(self.shard_index)
+        tmp_path = path + '.tmp'
+        if self.fmt == 'parquet':
+            import pandas as pd
+            pd.DataFrame([{
+                'doi': row['doi'],
+                'status': row['status'],
+                'parser': row.get('metadata', {}).get('parser'),
+                'error': row.get('error'),
+                'result': json.dumps(row),
+            } for row in self.rows]).to_parquet(tmp_path, index=False,
+                                                engine='pyarrow')
+        else:
+            with open(tmp_path, 'w') as f:
+                for row in self.rows:
+                    f.write(json.dumps(row) + '\n')
+        os.replace(tmp_path, path)
+        self.shard_index += 1
+        self.rows = []
+
+
+def load_checkpoint(out_dir):
+    path = os.path.join(out_dir, CHECKPOINT_FILE)
+    if not os.path.exists(path):
+        return {'inputs_done': 0, 'next_shard': 0}
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_checkpoint(out_dir, inputs_done, next_shard):
+    path = os.path.join(out_dir, CHECKPOINT_FILE)
+    with open(path + '.tmp', 'w') as f:
+        json.dump({'inputs_done': inputs_done, 'next_shard': next_shard}, f)
+    os.replace(path + '.tmp', path)
+
+
+def skip(iterable, n):
+    for i, item in enumerate(iterable):
+        if i >= n:
+            yield item
+
+
+def run(input_path, out_dir, fmt='jsonl', shard_size=100_000, workers=None,
+        chunksize=64):
+    os.makedirs(out_dir, exist_ok=True)
+    checkpoint = load_checkpoint(out_dir)
+    inputs_done = checkpoint['inputs_done']
+    writer = ShardWriter(out_dir, fmt, shard_size, checkpoint['next_shard'])
+    if inputs_done:
+        print(f'Resuming after {inputs_done} inputs at shard '
+              f'{writer.shard_index}')
+
+    tasks = skip(iter_inputs(input_path), inputs_done)
+    with Pool(processes=workers) as pool:
+        # imap keeps input order, so a checkpoint is just a count of inputs
+        for result in pool.imap(parse_one, tasks, chunksize=chunksize):
+            inputs_done += 1
+            if writer.add(result):
+                writer.flush()
+                save_checkpoint(out_dir, inputs_done, writer.shard_index)
+                print(f'{inputs_done} pages parsed')
+    writer.flush()
+    save_checkpoint(out_dir, inputs_done, writer.shard_index)
+    print(f'Done: {inputs_done} pages parsed')
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    arg_parser.add_argument('input',
+                            help='directory, tar archive or manifest file')
+    arg_parser.add_argument('--out', required=True,
+                            help='output directory for shards and checkpoint')
+    arg_parser.add_argument('--format', choices=['jsonl', 'parquet'],
+                            default='jsonl')
+    arg_parser.add_argument('--shard-size', type=int, default=100_000)
+    arg_parser.add_argument('--workers', type=int, default=os.cpu_count())
+    arg_parser.add_argument('--chunksize', type=int, default=64)
+    args = arg_parser.parse_args()
+    if args.format == 'parquet':
+        # fail now rather than after the first shard has been parsed
+        try:
+            import pandas  # noqa: F401
+            import pyarrow  # noqa: F401
+        except ImportError as e:
+            arg_parser.error(f'--format parquet needs pandas and pyarrow: {e}')
+    run(args.input, args.out, args.format, args.shard_size, args.workers,
+        args.chunksize)
+
+
+if __name__ == '__main__':
+    main()
@@ -25,6 +25,13 @@ class S3FileNotFoundError(APIError):
     description = "Source file not found on S3. Nothing to parse."
 
 
+class InvalidRequestError(APIError):
+    """Error when the request body or parameters are malformed."""
+
+    code = 400
+    description = "Invalid request."
+
+
 class BadLandingPageError(APIError):
     code = 400
     description = "Bad landing page contents. No data available to parse."
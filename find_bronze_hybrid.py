@@ -1,40 +1,14 @@
 from typing import Optional
 import re
 
-from find_shared import get_base_url_from_soup, find_publisher
-
-
-def check_access_type(page_content: str, soup) -> Optional[str]:
-    """
-    Check if article has bronze or hybrid access.
-    Returns 'bronze', 'hybrid', or None.
-
-    Args:
-        page_content: HTML content
-        soup: BeautifulSoup object of the page
-
-    Returns:
-        str: 'bronze', 'hybrid', or None if neither
-    """
-    # Check publisher-specific patterns first
-    if publisher_access := check_publisher_patterns(page_content, soup):
-        return publisher_access
-
-    # Check bronze patterns
-    if check_bronze_patterns(page_content, soup):
-        return 'bronze'
-
-    # Check hybrid patterns
-    if check_hybrid_patterns(page_content, soup):
-        return 'hybrid'
-
-    return None
-
-
-def check_bronze_patterns(page_content: str, soup) -> bool:
-    """Check if page matches any bronze access patterns."""
-    url = get_base_url_from_soup(soup)
-    bronze_url_patterns = [
+from find_shared import find_publisher
+from util.metrics import timed_function
+from util.parsed_page import ParsedPage
+
+# (url substring, page pattern) pairs, compiled once at import
+BRONZE_URL_PATTERNS = [
+    (url_pattern, re.compile(html_pattern, re.IGNORECASE | re.DOTALL))
+    for url_pattern, html_pattern in [
         ('sciencedirect.com/', '<div class="OpenAccessLabel">open archive</div>'),
         ('sciencedirect.com/', r'<span[^>]*class="[^"]*pdf-download-label[^"]*"[^>]*>Download PDF</span>'),
         ('onlinelibrary.wiley.com', '<div[^>]*class="doi-access"[^>]*>Free Access</div>'),
@@ -46,18 +20,11 @@ def check_bronze_patterns(page_content: str, soup) -> bool:
         ('degruyter.com/', '<span>Free Access</span>'),
         ('degruyter.com/', 'data-accessrestricted="false"'),
     ]
+]
 
-    for url_pattern, html_pattern in bronze_url_patterns:
-        if url_pattern in url.lower():
-            if re.findall(html_pattern, page_content, re.IGNORECASE | re.DOTALL):
-                return True
-    return False
-
-
-def check_hybrid_patterns(page_content: str, soup) -> bool:
-    """Check if page matches any hybrid access patterns."""
-    url = get_base_url_from_soup(soup)
-    hybrid_url_patterns = [
+HYBRID_URL_PATTERNS = [
+    (url_pattern, re.compile(html_pattern, re.IGNORECASE | re.DOTALL))
+    for url_pattern, html_pattern in [
         ('projecteuclid.org/', '<strong>Full-text: Open access</strong>'),
         ('sciencedirect.com/', '<div class="OpenAccessLabel">open access</div>'),
         ('journals.ametsoc.org/', r'src="/templates/jsp/_style2/_ams/images/access_free\.gif"'),
@@ -67,19 +34,11 @@ def check_hybrid_patterns(page_content: str, soup) -> bool:
         ('iospress.com', r'<img[^>]*src="[^"]*/img/openaccess_icon.png[^"]*"[^>]*>'),
         ('cambridge.org/', r'<span[^>]*class="open-access"[^>]*>Open access</span>'),
     ]
+]
 
-    for url_pattern, html_pattern in hybrid_url_patterns:
-        if url_pattern in url.lower():
-            if re.findall(html_pattern, page_content, re.IGNORECASE | re.DOTALL):
-                return True
-    return False
-
-
-def check_publisher_patterns(page_content: str, soup) -> Optional[str]:
-    """Check publisher-specific patterns."""
-    publisher = find_publisher(page_content, soup)
-    print(f"Publisher: {publisher}")
-    publisher_patterns = [
+PUBLISHER_ACCESS_PATTERNS = [
+    (pub, re.compile(pattern, re.IGNORECASE | re.DOTALL), access_type)
+    for pub, pattern, access_type in [
         # Bronze patterns
         ("New England Journal of Medicine", '<meta content="yes" name="evt-free"', "bronze"),
         ("Massachusetts Medical Society", '<meta content="yes" name="evt-free"', "bronze"),
@@ -93,9 +52,63 @@ def check_publisher_patterns(page_content: str, soup) -> Optional[str]:
         ("IEEE", r'"openAccessFlag":"yes"', "hybrid"),
         ("Wiley", r'<div[^>]*class="doi-access"[^>]*>Open Access</div>', "hybrid")
     ]
+]
 
-    for pub, pattern, access_type in publisher_patterns:
+
+@timed_function('check_access_type')
+def check_access_type(page: ParsedPage) -> Optional[str]:
+    """
+    Check if article has bronze or hybrid access.
+    Returns 'bronze', 'hybrid', or None.
+
+    Args:
+        page: ParsedPage of the landing page
+
+    Returns:
+        str: 'bronze', 'hybrid', or None if neither
+    """
+    page_content, soup, signals = page.html, page.soup, page.signals
+
+    # Check publisher-specific patterns first
+    if publisher_access := check_publisher_patterns(page_content, soup, signals):
+        return publisher_access
+
+    # Check bronze patterns
+    if check_bronze_patterns(page_content, signals):
+        return 'bronze'
+
+    # Check hybrid patterns
+    if check_hybrid_patterns(page_content, signals):
+        return 'hybrid'
+
+    return None
+
+
+def check_bronze_patterns(page_content: str, signals) -> bool:
+    """Check if page matches any bronze access patterns."""
+    return _matches_url_patterns(BRONZE_URL_PATTERNS, page_content, signals)
+
+
+def check_hybrid_patterns(page_content: str, signals) -> bool:
+    """Check if page matches any hybrid access patterns."""
+    return _matches_url_patterns(HYBRID_URL_PATTERNS, page_content, signals)
+
+
+def _matches_url_patterns(url_patterns, page_content, signals):
+    url = signals.base_url.lower()
+    for url_pattern, html_pattern in url_patterns:
+        if url_pattern in url:
+            if html_pattern.search(page_content):
+                return True
+    return False
+
+
+def check_publisher_patterns(page_content: str, soup, signals) -> Optional[str]:
+    """Check publisher-specific patterns."""
+    publisher = find_publisher(page_content, soup, signals)
+    print(f"Publisher: {publisher}")
+    for pub, pattern, access_type in PUBLISHER_ACCESS_PATTERNS:
         if publisher and publisher.lower() in pub.lower():
-            if re.findall(pattern, page_content, re.IGNORECASE | re.DOTALL):
+            if pattern.search(page_content):
                 return access_type
     return None
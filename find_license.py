@@ -1,10 +1,12 @@
-from bs4 import BeautifulSoup
 import re
 from urllib.parse import urlparse
 from typing import Optional
 import logging
 
-from find_shared import get_base_url_from_soup
+from util.metrics import timed_function
+from util.page_signals import PageSignals
+from util.parsed_page import ParsedPage
+from util.patterns import any_pattern
 
 logger = logging.getLogger(__name__)
 
@@ -50,40 +52,82 @@ TEXT_PATTERNS = [
     r'This is an Open Access article distributed under (.*?) license',
 ]
 
+# Compiled once; the combined pattern rules out most pages in one scan
+TEXT_PATTERNS_RE = [re.compile(pattern, re.IGNORECASE) for pattern in TEXT_PATTERNS]
+ANY_TEXT_PATTERN = any_pattern(TEXT_PATTERNS, re.IGNORECASE)
+LICENSE_PATTERNS_RE = {
+    normalized_license: any_pattern(patterns, re.IGNORECASE)
+    for normalized_license, patterns in LICENSE_PATTERNS.items()
+}
+CC_URL_RE = re.compile(r'creativecommons\.org/licenses/([a-z-]+)', re.IGNORECASE)
+CC_URL_LOWER_RE = re.compile(r'creativecommons\.org/licenses/([a-z-]+)')
 
-def find_license_in_html(page_content: str) -> Optional[str]:
-    """Find license information in HTML content using BeautifulSoup."""
+# Publisher-specific license indicators: (hostname pattern, page pattern, license)
+PUBLISHER_LICENSE_PATTERNS = [
+    (re.compile(url_pattern, re.IGNORECASE), re.compile(text_pattern, re.IGNORECASE), license_type)
+    for url_pattern, text_pattern, license_type in [
+        (r'sciencedirect\.com/', r'<div class="OpenAccessLabel">open access</div>', 'unspecified-oa'),
+        (r'projecteuclid\.org/', r'<strong>Full-text: Open access</strong>', 'unspecified-oa'),
+        (r'journals\.ametsoc\.org/', r'src="/templates/jsp/_style2/_ams/images/access_free\.gif"', 'unspecified-oa'),
+        (r'cambridge\.org/', r'<span[^>]*class="open-access"[^>]*>Open access</span>', 'unspecified-oa'),
+        (r'degruyter\.com/', r'<span>Open Access</span>', 'unspecified-oa'),
+    ]
+]
+TANDFONLINE_FULL_RE = re.compile(r'^https?://(?:www\.)?tandfonline\.com/doi/full/(10\..+)', re.IGNORECASE)
+RUPRESS_VOLUME_RE = re.compile(r'rupress\.org/jcb/[^/]+/(\d+)')
+
+# Publishers known to have unreliable license info
+UNTRUSTED_LICENSE_HOSTS = (
+    'indianjournalofmarketing.com',
+    'rnajournal.cshlp.org',
+    'press.umich.edu',
+    'genome.cshlp.org',
+    'medlit.ru',
+    'journals.eco-vector.com',
+    'alife-robotics.co.jp',
+    'molbiolcell.org',
+    'jcog.com.tr',
+    'aimsciences.org',
+    'berghahnjournals.com',
+    'ojs.ual.es',
+)
+
+
+@timed_function('find_license')
+def find_license_in_html(page: ParsedPage) -> Optional[str]:
+    """Find license information in an already parsed landing page."""
     try:
-        soup = BeautifulSoup(page_content, 'html.parser')
+        signals = page.signals
 
         # Check if we should trust this publisher
-        if not _trust_publisher_license(soup):
+        if not _trust_publisher_license(signals):
             logger.info("Publisher not trusted for license information")
             return None
 
         # Get the potential text that might contain license info
-        license_text = page_potential_license_text(page_content)
+        license_text = page_potential_license_text(page)
         if not license_text:
             return None
 
         # First look for Creative Commons license URLs
-        cc_url_match = re.search(r'creativecommons\.org/licenses/([a-z-]+)', license_text, re.IGNORECASE)
+        cc_url_match = CC_URL_RE.search(license_text)
         if cc_url_match:
             license_code = cc_url_match.group(1)
             if license_code:
                 return license_code
 
         # Then look for license text patterns
-        for pattern in TEXT_PATTERNS:
-            matches = re.findall(pattern, license_text, re.IGNORECASE)
-            if matches:
-                normalized_license = find_normalized_license(matches[0])
-                if normalized_license:
-                    return normalized_license
-                return "unspecified-oa"
+        if ANY_TEXT_PATTERN.search(license_text):
+            for pattern in TEXT_PATTERNS_RE:
+                matches = pattern.findall(license_text)
+                if matches:
+                    normalized_license = find_normalized_license(matches[0])
+                    if normalized_license:
+                        return normalized_license
+                    return "unspecified-oa"
 
         # Check for specific publisher license patterns
-        publisher_license = check_publisher_specific_licenses(soup, license_text)
+        publisher_license = check_publisher_specific_licenses(signals, license_text)
         if publisher_license:
             return publisher_license
 
@@ -94,30 +138,21 @@ def find_license_in_html(page_content: str) -> Optional[str]:
         return None
 
 
-def check_publisher_specific_licenses(soup: BeautifulSoup, license_text: str) -> Optional[str]:
+def check_publisher_specific_licenses(signals: PageSignals, license_text: str) -> Optional[str]:
     """Check for publisher-specific license indicators."""
-    base_url = get_base_url_from_soup(soup)
+    base_url = signals.base_url
     if not base_url:
         return None
 
     hostname = urlparse(base_url).hostname or ''
 
-    # Publisher-specific patterns
-    publisher_patterns = [
-        (r'sciencedirect\.com/', r'<div class="OpenAccessLabel">open access</div>', 'unspecified-oa'),
-        (r'projecteuclid\.org/', r'<strong>Full-text: Open access</strong>', 'unspecified-oa'),
-        (r'journals\.ametsoc\.org/', r'src="/templates/jsp/_style2/_ams/images/access_free\.gif"', 'unspecified-oa'),
-        (r'cambridge\.org/', r'<span[^>]*class="open-access"[^>]*>Open access</span>', 'unspecified-oa'),
-        (r'degruyter\.com/', r'<span>Open Access</span>', 'unspecified-oa'),
-    ]
-
-    for url_pattern, text_pattern, license_type in publisher_patterns:
-        if re.search(url_pattern, hostname, re.IGNORECASE):
-            if re.search(text_pattern, license_text, re.IGNORECASE):
+    for url_pattern, text_pattern, license_type in PUBLISHER_LICENSE_PATTERNS:
+        if url_pattern.search(hostname):
+            if text_pattern.search(license_text):
                 return license_type
 
     # Special handling for T&F license tab
-    if re.match(r'^https?://(?:www\.)?tandfonline\.com/doi/full/(10\..+)', base_url, re.IGNORECASE):
+    if TANDFONLINE_FULL_RE.match(base_url):
         tf_license = check_tandfonline_license(base_url)
         if tf_license:
             return tf_license
@@ -128,7 +163,7 @@ def check_publisher_specific_licenses(soup: BeautifulSoup, license_text: str) ->
 def check_tandfonline_license(url: str) -> Optional[str]:
     """Check T&F license tab for license info."""
     try:
-        if url_match := re.match(r'^https?://(?:www\.)?tandfonline\.com/doi/full/(10\..+)', url, re.IGNORECASE):
+        if url_match := TANDFONLINE_FULL_RE.match(url):
             license_tab_url = f'https://www.tandfonline.com/action/showCopyRight?doi={url_match.group(1)}'
             logger.info(f'Checking T&F license tab: {license_tab_url}')
 
@@ -140,11 +175,9 @@ def check_tandfonline_license(url: str) -> Optional[str]:
         return None
 
 
-def page_potential_license_text(page: str) -> Optional[str]:
+def page_potential_license_text(page: ParsedPage) -> Optional[str]:
     """Get text that might contain license info using BeautifulSoup."""
     try:
-        soup = BeautifulSoup(page, 'html.parser')
-
         # Additional sections to remove that might have false positives
         selectors_to_remove = [
             "div.view-pnas-featured",
@@ -163,9 +196,7 @@ def page_potential_license_text(page: str) -> Optional[str]:
             "div.table-of-content",
         ]
 
-        for selector in selectors_to_remove:
-            for element in soup.select(selector):
-                element.decompose()
+        soup = page.soup_without(selectors_to_remove)
 
         # Get specific sections that often contain license info
         license_sections = []
@@ -211,11 +242,11 @@ def page_potential_license_text(page: str) -> Optional[str]:
         if body:
             return body.get_text(' ', strip=True)
 
-        return page
+        return page.html
 
     except Exception as e:
         logger.error(f"Error parsing HTML: {str(e)}")
-        return page
+        return page.html
 
 
 def find_normalized_license(text: str) -> Optional[str]:
@@ -231,31 +262,31 @@ def find_normalized_license(text: str) -> Optional[str]:
     text = text.lower().strip()
 
     # Check for Creative Commons URL pattern first
-    cc_url_match = re.search(r'creativecommons\.org/licenses/([a-z-]+)', text)
+    cc_url_match = CC_URL_LOWER_RE.search(text)
     if cc_url_match:
         license_code = cc_url_match.group(1)
         if license_code in LICENSE_PATTERNS:
             return license_code
 
     # Check each license pattern
-    for normalized_license, patterns in LICENSE_PATTERNS.items():
-        if any(re.search(pattern, text, re.IGNORECASE) for pattern in patterns):
+    for normalized_license, pattern in LICENSE_PATTERNS_RE.items():
+        if pattern.search(text):
             return normalized_license
 
     return None
 
 
-def _trust_publisher_license(soup: BeautifulSoup) -> bool:
+def _trust_publisher_license(signals: PageSignals) -> bool:
     """
     Check if publisher's license info should be trusted.
 
     Args:
-        soup: BeautifulSoup object
+        signals: PageSignals of the page
 
     Returns:
         bool: Whether to trust the publisher
     """
-    base_url = get_base_url_from_soup(soup)
+    base_url = signals.base_url
     if not base_url:
         return True
 
@@ -263,28 +294,12 @@ def _trust_publisher_license(soup: BeautifulSoup) -> bool:
     if not hostname:
         return True
 
-    # Publishers known to have unreliable license info
-    untrusted_hosts = {
-        'indianjournalofmarketing.com',
-        'rnajournal.cshlp.org',
-        'press.umich.edu',
-        'genome.cshlp.org',
-        'medlit.ru',
-        'journals.eco-vector.com',
-        'alife-robotics.co.jp',
-        'molbiolcell.org',
-        'jcog.com.tr',
-        'aimsciences.org',
-        'berghahnjournals.com',
-        'ojs.ual.es',
-    }
-
     # Special case for rupress.org
     if hostname.endswith('rupress.org'):
-        volume_match = re.findall(r'rupress\.org/jcb/[^/]+/(\d+)', base_url)
+        volume_match = RUPRESS_VOLUME_RE.findall(base_url)
         try:
             return bool(volume_match and int(volume_match[0]) < 217)
         except ValueError:
             return False
 
-    return not any(hostname.endswith(host) for host in untrusted_hosts)
+    return not hostname.endswith(UNTRUSTED_LICENSE_HOSTS)
@@ -1,16 +1,33 @@
+from concurrent import futures
 from dataclasses import dataclass
 from urllib.parse import urljoin, urlparse
 import logging
 import re
 import os
+import time
 from base64 import b64decode
 
 import requests
 
-from find_shared import get_base_url_from_soup
+from pdf import verdicts
+from util.metrics import timed_function
+from util.patterns import HostRules, any_pattern, any_word
+
 
 logger = logging.getLogger(__name__)
 
+# Overall time find_pdf_link spends validating candidates, in seconds
+PDF_VALIDATION_DEADLINE = float(os.getenv('PDF_VALIDATION_DEADLINE', 15))
+# Candidates of one page checked at once. Each check may be a Zyte call, so
+# lower-priority links only start once a better one has failed.
+PDF_VALIDATION_CONCURRENCY = int(os.getenv('PDF_VALIDATION_CONCURRENCY', 2))
+VALIDATION_POOL = futures.ThreadPoolExecutor(
+    max_workers=int(os.getenv('PDF_VALIDATION_WORKERS', 16)),
+    thread_name_prefix='pdf-validation')
+
+ZYTE_API_URL = os.getenv('ZYTE_API_URL', 'https://api.zyte.com/v1/extract')
+ZYTE_TIMEOUT = float(os.getenv('ZYTE_TIMEOUT', 20))
+
 
 @dataclass
 class PdfLink:
@@ -20,88 +37,120 @@ class PdfLink:
     error: str = None
 
 
-def find_pdf_link(soup):
-    """find a single potential PDF link in BeautifulSoup object, prioritizing meta tags."""
+@timed_function('find_pdf_link')
+def find_pdf_link(page):
+    """find a single potential PDF link in a ParsedPage, prioritizing meta tags."""
     try:
-        base_url = get_base_url_from_soup(soup)
-        print(f"Base URL: {base_url}")
-
-        # try meta tags first
-        meta_pdf = get_pdf_from_meta(soup)
-        if meta_pdf:
-            print(f"Meta PDF: {meta_pdf}")
-            if base_url:
-                meta_pdf.href = urljoin(base_url, meta_pdf.href)
-                meta_pdf.href = transform_pdf_url(meta_pdf.href)
-            if is_valid_pdf_link(meta_pdf.href):
-                if validate_pdf(meta_pdf):
-                    return meta_pdf
-        else:
-            print(f"No meta PDF")
-
-        # try JavaScript next
-        js_pdf = get_pdf_from_javascript(str(soup))
-        if js_pdf:
-            print(f"JS PDF: {js_pdf}")
-            if base_url:
-                js_pdf.href = urljoin(base_url, js_pdf.href)
-                js_pdf.href = transform_pdf_url(js_pdf.href)
-            if is_valid_pdf_link(js_pdf.href):
-                if validate_pdf(js_pdf):
-                    return js_pdf
-        else:
-            print(f"No JS PDF")
-
-        # try content links
-        for link in get_pdf_links_from_content(soup):
-            if base_url:
-                link.href = urljoin(base_url, link.href)
-                link.href = transform_pdf_url(link.href)
-            if is_valid_pdf_link(link.href):
-                if validate_pdf(link):
-                    return link
-        print(f"No content PDF")
-
-        for button_link in get_pdf_links_from_buttons(soup):
-            if base_url:
-                button_link.href = urljoin(base_url, button_link.href)
-                button_link.href = transform_pdf_url(button_link.href)
-            if is_valid_pdf_link(button_link.href):
-                if validate_pdf(button_link):
-                    return button_link
-
+        return best_valid_pdf_link(pdf_link_candidates(page))
     except Exception as e:
         logger.error(f"Error finding PDF link: {str(e)}")
 
     return None
 
 
-def get_pdf_from_meta(soup):
+def pdf_link_candidates(page):
+    """Absolute PDF link candidates: meta tags, then JavaScript, content and buttons."""
+    soup = page.soup
+    base_url = page.signals.base_url
+    print(f"Base URL: {base_url}")
+
+    links = []
+
+    meta_pdf = get_pdf_from_meta(page.signals)
+    if meta_pdf:
+        print(f"Meta PDF: {meta_pdf}")
+        links.append(meta_pdf)
+    else:
+        print(f"No meta PDF")
+
+    js_pdf = get_pdf_from_javascript(str(soup))
+    if js_pdf:
+        print(f"JS PDF: {js_pdf}")
+        links.append(js_pdf)
+    else:
+        print(f"No JS PDF")
+
+    links.extend(get_pdf_links_from_content(soup))
+    links.extend(get_pdf_links_from_buttons(soup))
+
+    candidates = []
+    seen = set()
+    for link in links:
+        if base_url:
+            link.href = urljoin(base_url, link.href)
+            link.href = transform_pdf_url(link.href)
+        if link.href not in seen and is_valid_pdf_link(link.href):
+            seen.add(link.href)
+            candidates.append(link)
+    return candidates
+
+
+def best_valid_pdf_link(candidates, deadline=PDF_VALIDATION_DEADLINE):
+    """Validate candidates in order and return the first valid one.
+
+    Up to PDF_VALIDATION_CONCURRENCY candidates are checked at once; the
+    next one starts when an earlier check fails, and the rest are cancelled
+    once one is valid. Waits at most deadline seconds in total. A candidate
+    still being checked at the deadline is treated like one whose check
+    failed.
+    """
+    if not candidates:
+        return None
+
+    expires = time.monotonic() + deadline
+    pending = [VALIDATION_POOL.submit(validate_pdf, link)
+               for link in candidates[:PDF_VALIDATION_CONCURRENCY]]
+    try:
+        for i, link in enumerate(candidates):
+            try:
+                valid = pending[i].result(
+                    timeout=max(0, expires - time.monotonic()))
+            except futures.TimeoutError:
+                logger.warning(f"PDF link ({link.href}) not validated before the deadline.")
+                valid = is_trusted_fallback(link.href)
+            if valid:
+                return link
+            if (next_i := i + PDF_VALIDATION_CONCURRENCY) < len(candidates):
+                pending.append(VALIDATION_POOL.submit(validate_pdf,
+                                                      candidates[next_i]))
+    finally:
+        for future in pending:
+            future.cancel()
+
+    return None
+
+
+def get_pdf_from_meta(signals):
     """Extract PDF link from meta tags."""
-    for meta in soup.find_all('meta'):
-        if meta.get('name') == 'citation_pdf_url' or meta.get('property') == 'citation_pdf_url':
-            if 'content' in meta.attrs:
+    for meta in signals.metas:
+        if meta.name == 'citation_pdf_url' or meta.property == 'citation_pdf_url':
+            if meta.content is not None:
                 return PdfLink(
-                    href=meta['content'],
+                    href=meta.content,
                     anchor="<meta citation_pdf_url>",
                     source="meta"
                 )
     return None
 
 
+JS_PDF_PATTERNS = [
+    re.compile(r'"pdfUrl":"(.*?)"'),
+    re.compile(r'"exportPdfDownloadUrl": ?"(.*?)"'),
+    re.compile(r'"downloadPdfUrl":"(.*?)"'),
+    re.compile(r'"fullTextPdfUrl":"(.*?)"'),
+]
+JS_PDF_ANY = any_pattern(pattern.pattern for pattern in JS_PDF_PATTERNS)
+
+
 def get_pdf_from_javascript(html_content):
     """Extract PDF link from JavaScript variables."""
-    patterns = [
-        r'"pdfUrl":"(.*?)"',
-        r'"exportPdfDownloadUrl": ?"(.*?)"',
-        r'"downloadPdfUrl":"(.*?)"',
-        r'"fullTextPdfUrl":"(.*?)"'
-    ]
+    if not JS_PDF_ANY.search(html_content):
+        return None
 
-    for pattern in patterns:
-        matches = re.findall(pattern, html_content)
-        if matches:
-            href = matches[0]
+    for pattern in JS_PDF_PATTERNS:
+        match = pattern.search(html_content)
+        if match:
+            href = match.group(1)
             if '\\u' in href:
                 try:
                     href = href.encode().decode('unicode-escape')
@@ -109,14 +158,18 @@ def get_pdf_from_javascript(html_content):
                     continue
             return PdfLink(
                 href=href,
-                anchor=pattern.split('"')[1],
+                anchor=pattern.pattern.split('"')[1],
                 source="javascript"
             )
     return None
 
 
 def get_pdf_links_from_content(soup):
-    """Extract PDF links from BeautifulSoup content."""
+    """Extract PDF links from BeautifulSoup content.
+
+    Links inside bad sections are skipped rather than decomposing those
+    sections, so the shared soup is left intact for the other detectors.
+    """
     pdf_links = []
 
     bad_sections = [
@@ -129,10 +182,12 @@ def get_pdf_links_from_content(soup):
         "section#article-references",
     ]
 
-    for section in soup.select(', '.join(bad_sections)):
-        section.decompose()
+    bad_section_tags = set(map(id, soup.select(', '.join(bad_sections))))
 
     for link in soup.find_all('a', href=True):
+        if any(id(parent) in bad_section_tags for parent in link.parents):
+            continue
+
         href = link['href']
 
         if has_bad_pattern(href):
@@ -152,12 +207,15 @@ def get_pdf_links_from_content(soup):
     return pdf_links
 
 
+BUTTON_PDF_RE = re.compile(r"(https?:\/\/[^\s'\"]+\.pdf)")
+
+
 def get_pdf_links_from_buttons(soup):
     """Extract PDF links from button elements."""
     pdf_links = []
     for button in soup.find_all('button', {'onclick': True}):
         onclick = button['onclick']
-        match = re.search(r"(https?:\/\/[^\s'\"]+\.pdf)", onclick)
+        match = BUTTON_PDF_RE.search(onclick)
         if match:
             href = match.group(1)
             anchor_text = button.get_text().strip() or '<button>'
@@ -170,6 +228,37 @@ def get_pdf_links_from_buttons(soup):
 
 
 
+PDF_QUERY_INDICATORS = any_word([
+    'download=',
+    'format=pdf',
+    'type=pdf',
+    'mimeType=pdf',
+    '/pdf/',
+    'action=download'
+])
+PDF_ANCHOR_DOWNLOAD_INDICATORS = any_word([
+    "download",
+    "télécharger",
+    "get",
+    "view",
+    "access",
+    "full text"
+])
+DOWNLOAD_WORDS = any_word(["download", "télécharger"])
+PDF_ICON_CLASSES = any_word([
+    "fa-file-pdf",
+    "fa-pdf",
+    "pdf-icon",
+    "icon-pdf"
+])
+PARENT_PDF_CLASSES = any_word([
+    "pdf-download",
+    "download-pdf",
+    "pdf-options",
+    "pdf-container"
+])
+
+
 def is_pdf_link(link):
     """Check if link is likely a PDF download with stricter validation."""
     href = link['href'].lower()
@@ -185,30 +274,15 @@ def is_pdf_link(link):
         return True
 
     # Check PDF indicators in query parameters
-    if 'pdf' in href and any(param in href for param in [
-        'download=',
-        'format=pdf',
-        'type=pdf',
-        'mimeType=pdf',
-        '/pdf/',
-        'action=download'
-    ]):
+    if 'pdf' in href and PDF_QUERY_INDICATORS.search(href):
         return True
 
     # If "PDF" is in anchor text, require additional download indicators
     if "pdf" in anchor_text:
-        download_indicators = [
-            "download",
-            "télécharger",
-            "get",
-            "view",
-            "access",
-            "full text"
-        ]
-        return any(indicator in anchor_text for indicator in download_indicators)
+        return bool(PDF_ANCHOR_DOWNLOAD_INDICATORS.search(anchor_text))
 
     # Check for download buttons/links with PDF context
-    if any(text in anchor_text for text in ["download", "télécharger"]):
+    if DOWNLOAD_WORDS.search(anchor_text):
         # Must have PDF context either in href or nearby elements
         has_pdf_context = (
                 'pdf' in href or
@@ -219,176 +293,178 @@ def is_pdf_link(link):
         return has_pdf_context and "citation" not in anchor_text
 
     # Check for PDF-specific icons
-    pdf_icons = [
-        "fa-file-pdf",
-        "fa-pdf",
-        "pdf-icon",
-        "icon-pdf"
-    ]
-    if any(cls in ' '.join(link.get('class', [])) for cls in pdf_icons):
+    if PDF_ICON_CLASSES.search(' '.join(link.get('class', []))):
         return True
 
     # Check parent elements for PDF context
-    parent_pdf_classes = [
-        "pdf-download",
-        "download-pdf",
-        "pdf-options",
-        "pdf-container"
-    ]
     for parent in link.parents:
-        if any(cls in ' '.join(parent.get('class', [])) for cls in parent_pdf_classes):
+        if PARENT_PDF_CLASSES.search(' '.join(parent.get('class', []))):
             return True
 
     return False
 
 
+BAD_HREF_PATTERNS = any_word([
+    # Supplementary materials
+    '/suppl_file/',
+    'supplementary+file',
+    '_supplement',
+    '/Appendix',
+    'supinfo.pdf',
+    'supplementary-materials',
+
+    # Navigation/UI elements
+    '/faq',
+    'figures',
+    '_toc_',
+    'download_statistics',
+
+    # Archives/compressed files
+    '.zip',
+    '.tar.',
+    '.gz',
+
+    # Sample/example content
+    '/samples/',
+    'example.pdf',
+
+    # Purchase/subscription
+    'showsubscriptions',
+    'price-lists',
+    'libraryrequestform',
+    'pricing.pdf',
+
+    # Administrative
+    'content_policy.pdf',
+    'BookTOC.pdf',
+    'BookBackMatter.pdf',
+    'Deposit_Agreement',
+    'ethicspolicy.pdf',
+    'TermsOfUse.pdf',
+    'license_agreement.pdf',
+    'authors_guide.pdf',
+
+    # Other
+    'first-page.pdf',
+    'preview.pdf'
+])
+
+
 def has_bad_pattern(href):
     """Check if URL contains patterns indicating it's not a valid PDF link."""
-    bad_patterns = [
-        # Supplementary materials
-        '/suppl_file/',
-        'supplementary+file',
-        '_supplement',
-        '/Appendix',
-        'supinfo.pdf',
-        'supplementary-materials',
-
-        # Navigation/UI elements
-        '/faq',
-        'figures',
-        '_toc_',
-        'download_statistics',
-
-        # Archives/compressed files
-        '.zip',
-        '.tar.',
-        '.gz',
-
-        # Sample/example content
-        '/samples/',
-        'example.pdf',
-
-        # Purchase/subscription
-        'showsubscriptions',
-        'price-lists',
-        'libraryrequestform',
-        'pricing.pdf',
-
-        # Administrative
-        'content_policy.pdf',
-        'BookTOC.pdf',
-        'BookBackMatter.pdf',
-        'Deposit_Agreement',
-        'ethicspolicy.pdf',
-        'TermsOfUse.pdf',
-        'license_agreement.pdf',
-        'authors_guide.pdf',
-
-        # Other
-        'first-page.pdf',
-        'preview.pdf'
-    ]
-    return any(pattern in href.lower() for pattern in bad_patterns)
+    return bool(BAD_HREF_PATTERNS.search(href.lower()))
+
+
+BAD_ANCHOR_WORDS = any_word([
+    # Supplementary content
+    'supplement',
+    'appendix',
+    'supporting information',
+    'additional files',
+
+    # Figures/media
+    'figure',
+    'table',
+    'video',
+    'image',
+
+    # Administrative
+    'faq',
+    'help',
+    'checklist',
+    'guidelines',
+    'instructions',
+    'policy',
+    'agreement',
+    'terms',
+
+    # Navigation
+    'abstract',
+    'toc',
+    'contents',
+    'index',
+
+    # Statistics
+    'download statistics',
+    'citation statistics',
+    'metrics',
+
+    # Other
+    'purchase',
+    'subscribe',
+    'preview'
+])
 
 
 def has_bad_anchor_word(anchor_text):
     """Check if anchor text contains words indicating it's not a valid PDF link."""
-    bad_words = [
-        # Supplementary content
-        'supplement',
-        'appendix',
-        'supporting information',
-        'additional files',
-
-        # Figures/media
-        'figure',
-        'table',
-        'video',
-        'image',
-
-        # Administrative
-        'faq',
-        'help',
-        'checklist',
-        'guidelines',
-        'instructions',
-        'policy',
-        'agreement',
-        'terms',
-
-        # Navigation
-        'abstract',
-        'toc',
-        'contents',
-        'index',
-
-        # Statistics
-        'download statistics',
-        'citation statistics',
-        'metrics',
-
-        # Other
-        'purchase',
-        'subscribe',
-        'preview'
-    ]
-    return any(word in anchor_text.lower() for word in bad_words)
+    return bool(BAD_ANCHOR_WORDS.search(anchor_text.lower()))
 
 
-def transform_pdf_url(url):
-    """Transform PDF URLs based on publisher-specific patterns."""
-    if not url:
-        return url
+def _replace(old, new):
+    return lambda url: url.replace(old, new)
 
-    # Recyt
-    if re.match(r'https?://recyt\.fecyt\.es/index\.php/EPI/article/view/', url):
-        url = url.replace('/article/view/', '/article/download/')
 
+# Publisher-specific rewrites, keyed by hostname
+PDF_URL_REWRITES = HostRules([
+    # Recyt
+    (['recyt.fecyt.es'], r'https?://recyt\.fecyt\.es/index\.php/EPI/article/view/',
+     _replace('/article/view/', '/article/download/')),
     # MIT Press Journals and Chicago
-    if (re.match(r'https?://(www.)?mitpressjournals\.org/doi/full/10\.+', url) or
-            re.match(r'https?://(www.)?journals\.uchicago\.edu/doi/full/10\.+', url)):
-        url = url.replace('/doi/full/', '/doi/pdf/')
-
+    (['mitpressjournals.org'], r'https?://(www.)?mitpressjournals\.org/doi/full/10\.+',
+     _replace('/doi/full/', '/doi/pdf/')),
+    (['journals.uchicago.edu'], r'https?://(www.)?journals\.uchicago\.edu/doi/full/10\.+',
+     _replace('/doi/full/', '/doi/pdf/')),
     # ASCO
-    if re.match(r'https?://(www.)?ascopubs\.org/doi/full/10\.+', url):
-        url = url.replace('/doi/full/', '/doi/pdfdirect/')
-
+    (['ascopubs.org'], r'https?://(www.)?ascopubs\.org/doi/full/10\.+',
+     _replace('/doi/full/', '/doi/pdfdirect/')),
     # AHA Journals
-    if re.match(r'https?://(www\.)?ahajournals\.org/doi/reader/10\..+', url):
-        url = url.replace('/doi/reader/', '/doi/pdf/')
-
+    (['ahajournals.org'], r'https?://(www\.)?ahajournals\.org/doi/reader/10\..+',
+     _replace('/doi/reader/', '/doi/pdf/')),
     # SAGE
-    if re.match(r'https?://(www\.)?journals.sagepub.com/doi/reader/10\..+', url):
-        url = url.replace('/doi/reader/', '/doi/pdf/')
-
+    (['journals.sagepub.com'], r'https?://(www\.)?journals.sagepub.com/doi/reader/10\..+',
+     _replace('/doi/reader/', '/doi/pdf/')),
     # Taylor & Francis
-    if re.match(r'https?://(www\.)?tandfonline.com/doi/epdf/10\..+', url):
-        url = url.replace('/doi/epdf/', '/doi/pdf/')
-
+    (['tandfonline.com'], r'https?://(www\.)?tandfonline.com/doi/epdf/10\..+',
+     _replace('/doi/epdf/', '/doi/pdf/')),
     # American Journal of Roentgenology
-    if re.match(r'https?://(www\.)?ajronline.org/doi/epdf/10\..+', url):
-        url = url.replace('/doi/epdf/', '/doi/pdf/')
-
+    (['ajronline.org'], r'https?://(www\.)?ajronline.org/doi/epdf/10\..+',
+     _replace('/doi/epdf/', '/doi/pdf/')),
     # ACS Publications
-    if re.match(r'https?://(www\.)?pubs.acs.org/doi/epdf/10\..+', url):
-        url = url.replace('/doi/epdf/', '/doi/pdf/')
-
+    (['pubs.acs.org'], r'https?://(www\.)?pubs.acs.org/doi/epdf/10\..+',
+     _replace('/doi/epdf/', '/doi/pdf/')),
     # Royal Society Publishing
-    if re.match(r'https?://(www\.)?royalsocietypublishing.org/doi/epdf/10\..+', url):
-        url = url.replace('/doi/epdf/', '/doi/pdf/')
-
+    (['royalsocietypublishing.org'], r'https?://(www\.)?royalsocietypublishing.org/doi/epdf/10\..+',
+     _replace('/doi/epdf/', '/doi/pdf/')),
     # Wiley
-    if re.match(r'https?://(www\.)?onlinelibrary.wiley.com/doi/epdf/10\..+', url):
-        url = url.replace('/epdf/', '/pdfdirect/')
-    url = re.sub(r'(onlinelibrary\.wiley\.com/doi/)pdf(/.+)', r'\1pdfdirect\2', url)
-
+    (['onlinelibrary.wiley.com'], r'https?://(www\.)?onlinelibrary.wiley.com/doi/epdf/10\..+',
+     _replace('/epdf/', '/pdfdirect/')),
     # Healio
-    if re.match(r'https?://(journals\.)?healio.com/doi/epdf/10\..+', url):
-        url = url.replace('/doi/epdf/', '/doi/pdf/')
-
+    (['healio.com', 'journals.healio.com'], r'https?://(journals\.)?healio.com/doi/epdf/10\..+',
+     _replace('/doi/epdf/', '/doi/pdf/')),
     # RSNA
-    if re.match(r'https?://(pubs\.)?rsna.org/doi/epdf/10\..+', url):
-        url = url.replace('/doi/epdf/', '/doi/pdf/')
+    (['rsna.org', 'pubs.rsna.org'], r'https?://(pubs\.)?rsna.org/doi/epdf/10\..+',
+     _replace('/doi/epdf/', '/doi/pdf/')),
+])
+
+# Rewrites that match anywhere in the URL, each guarded by a substring check
+WILEY_PDF_RE = re.compile(r'(onlinelibrary\.wiley\.com/doi/)pdf(/.+)')
+SCIENCEDIRECT_MD5_RE = re.compile(
+    r'(science)direct.com/science/article/pii/(.*?)/pdf\?md5=.*?-main\.pdf$')
+IEEE_STAMP_RE = re.compile(r'(ieeexplore\.ieee\.org/stamp/stamp\.jsp\?tp=&arnumber=\d+)')
+JSTOR_RE = re.compile(r'(jstor\.org/stable/)(.*?)$')
+
+
+def transform_pdf_url(url):
+    """Transform PDF URLs based on publisher-specific patterns."""
+    if not url:
+        return url
+
+    url = PDF_URL_REWRITES.apply(url)
+
+    # Wiley
+    if 'onlinelibrary.wiley.com/doi/pdf' in url:
+        url = WILEY_PDF_RE.sub(r'\1pdfdirect\2', url)
 
     # General epdf to pdf conversion
     if '/epdf/' in url:
@@ -397,36 +473,37 @@ def transform_pdf_url(url):
     # Science Direct
     if url.startswith('https://www.sciencedirect.com/science/article/pii/'):
         url = url.replace('/article/pii/', '/article/am/pii/')
-    url = re.sub(r'(science)direct.com/science/article/pii/(.*?)/pdf\?md5=.*?-main\.pdf$',
-                 r'\1direct.com/science/article/pii/\2/pdfft', url)
+    if 'direct.com/science/article/pii/' in url:
+        url = SCIENCEDIRECT_MD5_RE.sub(r'\1direct.com/science/article/pii/\2/pdfft', url)
 
     # Nature
     if '/articles/' in url and url.endswith('.pdf'):
         url = url.replace('.pdf', '_reference.pdf')
 
     # IEEE
-    url = re.sub(r'(ieeexplore\.ieee\.org/stamp/stamp\.jsp\?tp=&arnumber=\d+)',
-                 r'\1&tag=1', url)
+    if 'ieeexplore.ieee.org/stamp/stamp.jsp' in url:
+        url = IEEE_STAMP_RE.sub(r'\1&tag=1', url)
 
     # JSTOR
-    url = re.sub(r'(jstor\.org/stable/)(.*?)$',
-                 r'\1pdfplus/\2.pdf', url)
+    if 'jstor.org/stable/' in url:
+        url = JSTOR_RE.sub(r'\1pdfplus/\2.pdf', url)
 
     return url
 
 
+BAD_PDF_DOMAINS = any_word([
+    'exlibrisgroup.com',
+    'citeseerx.ist.psu.edu',
+    'deepdyve.com',
+    'researchgate.net',
+    'academia.edu'
+])
+
+
 def is_valid_pdf_link(url):
     """Check if PDF link is valid."""
-    bad_domains = [
-        'exlibrisgroup.com',
-        'citeseerx.ist.psu.edu',
-        'deepdyve.com',
-        'researchgate.net',
-        'academia.edu'
-    ]
-
     parsed_url = urlparse(url)
-    if any(domain in parsed_url.netloc.lower() for domain in bad_domains):
+    if BAD_PDF_DOMAINS.search(parsed_url.netloc.lower()):
         return False
 
     if 'temporary' in url.lower() or 'temp' in url.lower():
@@ -438,6 +515,24 @@ def is_valid_pdf_link(url):
     return True
 
 
+TRUSTED_DIRECT_PATTERNS = any_word([
+    'onlinelibrary.wiley.com/pdfdirect',
+    'onlinelibrary.wiley.com/doi/pdfdirect',
+    '/article/download/',
+    '/index.php/',
+    '/download/'
+])
+
+TRUSTED_FALLBACK_PATTERNS = any_pattern([
+    r'onlinelibrary\.wiley\.com/doi/pdfdirect/',
+    r'science\.org/doi/pdf/',
+    r'springer\.com/content/pdf/',
+    r'tandfonline\.com/doi/pdf/'
+])
+
+BLOCKED_STATUS_CODES = {401, 403, 429}
+
+
 def validate_pdf(pdf_link):
     """Validate PDF link using Zyte API, status code, and content type."""
     if not pdf_link:
@@ -446,49 +541,57 @@ def validate_pdf(pdf_link):
     href = pdf_link.href.lower()
 
     # Special cases that can be directly trusted
-    trusted_direct_patterns = [
-        'onlinelibrary.wiley.com/pdfdirect',
-        'onlinelibrary.wiley.com/doi/pdfdirect',
-        '/article/download/',
-        '/index.php/',
-        '/download/'
-    ]
-    if any(pattern in href for pattern in trusted_direct_patterns):
+    if TRUSTED_DIRECT_PATTERNS.search(href):
         return True
 
+    verdict = verdicts.get(href)
+    if verdict is None:
+        verdict = check_pdf_url(href)
+        verdicts.set(href, verdict)
+
+    if verdict == verdicts.VALID:
+        return True
+    if verdict == verdicts.NOT_PDF:
+        logger.warning(f"PDF link ({pdf_link.href}) does not appear to be a valid PDF.")
+        return False
+
+    # Fallback to trusted patterns if we couldn't check the link
+    return is_trusted_fallback(pdf_link.href)
+
+
+def check_pdf_url(url):
+    """Fetch url and return a verdict, or None if the check itself failed."""
     try:
         # Use HEAD request to check the link
-        response = requests.head(href, allow_redirects=True, timeout=5)
+        response = requests.head(url, allow_redirects=True, timeout=5)
 
         # Validate content type
         content_type = response.headers.get('Content-Type', '').lower()
         if 'application/pdf' in content_type:
-            return True
+            return verdicts.VALID
 
         # Validate content start (fallback to GET if necessary)
-        with requests.get(href, stream=True, timeout=10, headers={'User-Agent': 'Mozilla/5.0'}) as get_response:
+        with requests.get(url, stream=True, timeout=10, headers={'User-Agent': 'Mozilla/5.0'}) as get_response:
+            if get_response.status_code in BLOCKED_STATUS_CODES:
+                logger.warning(f"Blocked from checking PDF link ({url}): {get_response.status_code}")
+                return verdicts.BLOCKED
             get_response.raise_for_status()  # Raise an exception for non-2xx responses
             content_start = get_response.raw.read(5)
             if content_start == b'%PDF-':
-                return True
+                return verdicts.VALID
 
-        if validate_with_zyte_api(href):
-            return True
+        if validate_with_zyte_api(url):
+            return verdicts.VALID
 
-        logger.warning(f"PDF link ({pdf_link.href}) does not appear to be a valid PDF.")
-        return False
+        return verdicts.NOT_PDF
 
     except Exception as e:
         logger.error(f"Error validating PDF link: {str(e)}")
+        return None
 
-    # Fallback to trusted patterns if Zyte validation fails
-    trusted_fallback_patterns = [
-        r'onlinelibrary\.wiley\.com/doi/pdfdirect/',
-        r'science\.org/doi/pdf/',
-        r'springer\.com/content/pdf/',
-        r'tandfonline\.com/doi/pdf/'
-    ]
-    return any(re.search(pattern, pdf_link.href) for pattern in trusted_fallback_patterns)
+
+def is_trusted_fallback(href):
+    return bool(TRUSTED_FALLBACK_PATTERNS.search(href))
 
 
 def validate_with_zyte_api(url):
@@ -496,12 +599,13 @@ def validate_with_zyte_api(url):
     print("Validating PDF link with Zyte API.")
     zyte_api_key = os.getenv("ZYTE_API_KEY")
     api_response = requests.post(
-        "https://api.zyte.com/v1/extract",
+        ZYTE_API_URL,
         auth=(zyte_api_key, ""),
         json={
             "url": url,
             "httpResponseBody": True
         },
+        timeout=ZYTE_TIMEOUT,
     )
     http_response_body: bytes = b64decode(api_response.json()["httpResponseBody"])
     if http_response_body.startswith(b'%PDF'):
@@ -0,0 +1,47 @@
+"""gunicorn settings, see the Procfile.
+
+By default the app is imported and warmed up once in the master, then the
+workers are forked from it. Their copies of the parsers, dispatch index and
+compiled patterns stay shared with the master instead of each worker
+building its own. Set GUNICORN_PRELOAD=false to import in every worker.
+
+S3 and Redis clients are created per process on first use (util.lazy), so
+workers never share the master's connections.
+"""
+import gc
+import os
+import time
+
+from prometheus_client import multiprocess
+
+preload_app = os.getenv('GUNICORN_PRELOAD', 'true').lower() not in (
+    'false', '0')
+
+
+def when_ready(server):
+    if not preload_app:
+        return
+    from publisher.pipeline import warm_up
+
+    start = time.monotonic()
+    warm_up()
+    # Freezing keeps the collector from writing to the objects the workers
+    # share, which would copy their pages into every worker.
+    gc.collect()
+    gc.freeze()
+    server.log.info('Warmed up in %.2fs', time.monotonic() - start)
+
+
+def post_fork(server, worker):
+    worker.forked_at = time.monotonic()
+
+
+def child_exit(server, worker):
+    # Drop the dead worker's live gauges from the samples util.metrics merges
+    if os.getenv('PROMETHEUS_MULTIPROC_DIR'):
+        multiprocess.mark_process_dead(worker.pid)
+
+
+def post_worker_init(worker):
+    worker.log.info('Worker ready in %.2fs (pid: %s)',
+                    time.monotonic() - worker.forked_at, worker.pid)
@@ -1,22 +1,6 @@
-import gzip
-from threading import Lock
-
-import os
-from urllib.parse import quote
-
-import boto3
-import botocore
-
-from exceptions import S3FileNotFoundError
 from publisher.parsers.grobid import GrobidParser
 from publisher.utils import normalize_doi
-
-S3_LOCK = Lock()
-S3_PDF_BUCKET_NAME = os.getenv('AWS_S3_PDF_BUCKET')
-session = boto3.session.Session()
-
-S3 = session.client('s3', aws_access_key_id=os.getenv('AWS_ACCESS_KEY_ID'),
-                    aws_secret_access_key=os.getenv('AWS_SECRET_ACCESS_KEY'))
+from util.s3 import get_pdf
 
 
 class PDFController:
@@ -27,17 +11,4 @@ class PDFController:
         self.parser = GrobidParser(self.pdf)
 
     def get_pdf_contents(self):
-        key = f'{quote(self.doi, safe="")}.pdf'
-        with S3_LOCK:
-            try:
-                obj_details = S3.get_object(Bucket=S3_PDF_BUCKET_NAME, Key=key)
-                body = obj_details['Body'].read()
-                if body[:3] == b'\x1f\x8b\x08':
-                    body = gzip.decompress(body)
-                return body
-            except botocore.exceptions.ClientError as e:
-                if e.response['Error']['Code'] in {"404", "NoSuchKey"}:
-                    raise S3FileNotFoundError()
-                else:
-                    raise e
-
+        return get_pdf(self.doi)
@@ -0,0 +1,104 @@
+import json
+import threading
+import time
+from base64 import b64encode
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests_cache
+
+import find_pdf
+from find_pdf import PdfLink, best_valid_pdf_link
+from pdf import verdicts
+
+
+class StandIn(BaseHTTPRequestHandler):
+    """Local stand-in for publisher sites and the Zyte API."""
+
+    def do_HEAD(self):
+        self.respond(send_body=False)
+
+    def do_GET(self):
+        self.respond(send_body=True)
+
+    def do_POST(self):
+        body = json.dumps({'httpResponseBody': b64encode(b'<html>').decode()})
+        self.send(200, 'application/json', body.encode(), True)
+
+    def respond(self, send_body):
+        if self.path.startswith('/slow'):
+            time.sleep(1)
+        if self.path.endswith('/blocked.pdf'):
+            self.send(403, 'text/html', b'<html>denied</html>', send_body)
+        elif self.path.endswith('/landing'):
+            self.send(200, 'text/html', b'<html>landing page</html>', send_body)
+        else:
+            self.send(200, 'application/pdf', b'%PDF-1.4', send_body)
+
+    def send(self, status, content_type, body, send_body):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if send_body:
+            self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stand_in(monkeypatch):
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StandIn)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    url = f'http://127.0.0.1:{server.server_port}'
+    monkeypatch.setattr(find_pdf, 'ZYTE_API_URL', f'{url}/zyte')
+    # no verdict cache, so every test validates its links
+    monkeypatch.setattr(verdicts, 'redis_conn', lambda: None)
+    with requests_cache.disabled():
+        yield url
+    server.shutdown()
+
+
+def links(*hrefs):
+    return [PdfLink(href=href, anchor='pdf') for href in hrefs]
+
+
+def test_first_valid_candidate_wins(stand_in):
+    candidates = links(f'{stand_in}/landing', f'{stand_in}/slow/paper.pdf',
+                       f'{stand_in}/paper.pdf')
+    assert best_valid_pdf_link(candidates).href == f'{stand_in}/slow/paper.pdf'
+
+
+def test_blocked_candidate_is_skipped(stand_in):
+    candidates = links(f'{stand_in}/blocked.pdf', f'{stand_in}/paper.pdf')
+    assert best_valid_pdf_link(candidates).href == f'{stand_in}/paper.pdf'
+
+
+def test_deadline(stand_in):
+    candidates = links(f'{stand_in}/slow/paper.pdf', f'{stand_in}/paper.pdf')
+    start = time.monotonic()
+    best = best_valid_pdf_link(candidates, deadline=0.5)
+    assert time.monotonic() - start < 1
+    assert best.href == f'{stand_in}/paper.pdf'
+
+
+def test_no_valid_candidates(stand_in):
+    assert best_valid_pdf_link(links(f'{stand_in}/landing')) is None
+    assert best_valid_pdf_link([]) is None
+
+
+def test_later_candidates_wait_for_earlier_ones(stand_in, monkeypatch):
+    checked = []
+    validate_pdf = find_pdf.validate_pdf
+
+    def record(link):
+        checked.append(link.href)
+        return validate_pdf(link)
+
+    monkeypatch.setattr(find_pdf, 'validate_pdf', record)
+    candidates = links(f'{stand_in}/paper.pdf', f'{stand_in}/landing',
+                       f'{stand_in}/other.pdf', f'{stand_in}/third.pdf')
+    assert best_valid_pdf_link(candidates).href == f'{stand_in}/paper.pdf'
+    assert len(checked) <= find_pdf.PDF_VALIDATION_CONCURRENCY
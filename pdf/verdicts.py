@@ -0,0 +1,61 @@
+import os
+
+import redis
+
+from util.lazy import per_process
+from util.patterns import url_host
+
+VALID = 'valid'
+NOT_PDF = 'not-pdf'
+BLOCKED = 'blocked'
+
+# Verdicts about a URL are stable; a host that blocks us may relent sooner.
+URL_VERDICT_TTL = int(os.getenv('PDF_URL_VERDICT_TTL', 7 * 24 * 60 * 60))
+HOST_VERDICT_TTL = int(os.getenv('PDF_HOST_VERDICT_TTL', 60 * 60))
+
+
+@per_process
+def redis_conn():
+    """Client for the verdict cache, or None if no Redis is configured."""
+    if url := os.getenv('REDISCLOUD_URL'):
+        return redis.Redis.from_url(url)
+    return None
+
+
+def url_key(url):
+    return f'pdf-verdict:url:{url}'
+
+
+def host_key(url):
+    return f'pdf-verdict:host:{url_host(url)}'
+
+
+def get(url):
+    """Cached verdict for url, or for its host if the host blocks us.
+
+    Redis is only a cache here, so errors count as a miss.
+    """
+    if (conn := redis_conn()) is None:
+        return None
+    try:
+        url_verdict, host_verdict = conn.mget(url_key(url), host_key(url))
+    except redis.RedisError:
+        return None
+    if url_verdict is not None:
+        return url_verdict.decode()
+    if host_verdict is not None:
+        return host_verdict.decode()
+    return None
+
+
+def set(url, verdict):
+    """Remember a verdict: valid/not-PDF per URL, blocked per host."""
+    if (conn := redis_conn()) is None:
+        return
+    try:
+        if verdict == BLOCKED:
+            conn.set(host_key(url), BLOCKED, ex=HOST_VERDICT_TTL)
+        elif verdict in (VALID, NOT_PDF):
+            conn.set(url_key(url), verdict, ex=URL_VERDICT_TTL)
+    except redis.RedisError:
+        pass
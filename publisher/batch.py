@@ -0,0 +1,96 @@
+import itertools
+import os
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, \
+    wait, FIRST_COMPLETED
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import get_context
+from threading import Lock
+
+from publisher.pipeline import parse_publisher_page, pdf_parser_url, \
+    error_result
+from util.lazy import per_process
+from util.s3 import make_s3, get_landing_page, is_pdf
+
+MAX_DOIS = int(os.getenv('PARSE_BATCH_MAX_DOIS', '1000'))
+FETCH_CONCURRENCY = int(os.getenv('PARSE_BATCH_FETCH_CONCURRENCY', '32'))
+PARSE_WORKERS = int(os.getenv('PARSE_BATCH_WORKERS', os.cpu_count() or 1))
+# Fetches and parses running at once. A DOI is only fetched once another
+# finishes, so pages waiting for a parse worker can't pile up.
+MAX_IN_FLIGHT = FETCH_CONCURRENCY + PARSE_WORKERS
+
+_fetch_pool = ThreadPoolExecutor(max_workers=FETCH_CONCURRENCY,
+                                 thread_name_prefix='lp-fetch')
+_parse_pool = None
+_parse_pool_lock = Lock()
+
+
+@per_process
+def fetch_s3():
+    """S3 client shared by the fetch threads, one connection each."""
+    return make_s3(max_pool_connections=FETCH_CONCURRENCY)
+
+
+def parse_pool():
+    """Worker processes for the CPU-bound parse, started on first use."""
+    global _parse_pool
+    with _parse_pool_lock:
+        if _parse_pool is None:
+            _parse_pool = ProcessPoolExecutor(max_workers=PARSE_WORKERS,
+                                              mp_context=get_context('spawn'))
+        return _parse_pool
+
+
+def reset_parse_pool():
+    global _parse_pool
+    with _parse_pool_lock:
+        if _parse_pool is not None:
+            _parse_pool.shutdown(wait=False)
+        _parse_pool = None
+
+
+def iter_batch_results(dois):
+    """Yield one /parse-publisher result per DOI, in completion order.
+
+    Landing pages are fetched concurrently on a thread pool sharing one S3
+    client; each fetched page is parsed in a worker process. At most
+    MAX_IN_FLIGHT DOIs are being fetched or parsed at a time. Errors are
+    returned inline so one bad DOI doesn't fail the batch.
+    """
+    s3 = fetch_s3()
+    dois = iter(dois)
+    pending = {}
+
+    def fetch_more():
+        for doi in itertools.islice(dois, MAX_IN_FLIGHT - len(pending)):
+            pending[_fetch_pool.submit(get_landing_page, doi, s3)] = (
+                'fetch', doi)
+
+    try:
+        fetch_more()
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                stage, doi = pending.pop(future)
+                try:
+                    result = future.result()
+                except BrokenProcessPool as e:
+                    reset_parse_pool()
+                    yield error_result(doi, e)
+                    continue
+                except Exception as e:
+                    yield error_result(doi, e)
+                    continue
+
+                if stage == 'parse':
+                    yield {"doi": doi, "status": 200, **result}
+                elif is_pdf(result):
+                    yield {"doi": doi, "status": 302,
+                           "location": pdf_parser_url(doi)}
+                else:
+                    parse_future = parse_pool().submit(parse_publisher_page,
+                                                       doi, result)
+                    pending[parse_future] = ('parse', doi)
+            fetch_more()
+    finally:
+        for future in pending:
+            future.cancel()
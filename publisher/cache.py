@@ -1,19 +1,227 @@
 import json
-from datetime import datetime, timezone
+import threading
+import time
+import zlib
+from concurrent import futures
 
 import redis
 import os
 
+from exceptions import APIError, BadLandingPageError, ParserNotFoundError, \
+    S3FileNotFoundError
+from publisher.utils import normalize_doi
+from util import metrics, redis_lock
+from util.lazy import per_process
+from util.memory_cache import MemoryCache
+from util.s3 import landing_page_validator
 
-REDIS_CONN = redis.Redis.from_url(os.getenv('REDISCLOUD_URL'))
+# Part of every key, so deploying new parsers invalidates old results.
+PARSER_VERSION = os.getenv('PARSER_VERSION') or os.getenv(
+    'HEROKU_SLUG_COMMIT', 'dev')
+CACHE_TTL = int(os.getenv('PARSE_CACHE_TTL', 7 * 24 * 60 * 60))
 
+# Errors that are remembered like responses, and for how long. A missing
+# landing page is stored without a validator and trusted until it expires;
+# the others are checked against the landing page like responses are.
+NEGATIVE_TTLS = {
+    S3FileNotFoundError: int(os.getenv('MISSING_PAGE_CACHE_TTL', 60 * 60)),
+    ParserNotFoundError: int(os.getenv('NO_PARSER_CACHE_TTL',
+                                       24 * 60 * 60)),
+    BadLandingPageError: int(os.getenv('BAD_PAGE_CACHE_TTL', 6 * 60 * 60)),
+}
+NEGATIVE_ERRORS = {cls.__name__: cls for cls in NEGATIVE_TTLS}
 
-def set(doi, last_modified, response):
-    obj = json.dumps([datetime.now(timezone.utc), last_modified, response], default=str)
-    REDIS_CONN.set(doi, obj)
+# First tier, in front of Redis. Entries here are trusted without checking
+# S3 until they expire, so keep the TTL short.
+MEMORY = MemoryCache(
+    'responses',
+    max_bytes=int(os.getenv('RESPONSE_MEMORY_CACHE_BYTES', 32 * 1024 * 1024)),
+    ttl=int(os.getenv('RESPONSE_MEMORY_CACHE_TTL', 60)))
 
+# Concurrent misses for one key share a single parse: threads in this process
+# wait on the leader's future, other workers poll Redis while the leader
+# holds the key's lock. Waiters give up after COALESCE_WAIT and parse the
+# page themselves.
+COALESCE_WAIT = float(os.getenv('PARSE_COALESCE_WAIT', 10))
+LOCK_TTL = int(os.getenv('PARSE_LOCK_TTL', 30))
+POLL_INTERVAL = 0.05
 
-def get(doi):
-    return REDIS_CONN.get(doi)
+_in_flight = {}
+_in_flight_lock = threading.Lock()
 
 
+@per_process
+def redis_conn():
+    return redis.Redis.from_url(os.getenv('REDISCLOUD_URL'))
+
+
+def cache_key(doi, namespace='parse-publisher'):
+    return f'{namespace}:{PARSER_VERSION}:{normalize_doi(doi).lower()}'
+
+
+def projected(namespace, fields):
+    """Namespace for responses limited to fields, None meaning all of them."""
+    if fields is None:
+        return namespace
+    return f'{namespace}[{",".join(sorted(fields))}]'
+
+
+def encode(validator, response, error=None):
+    return zlib.compress(json.dumps([validator, response, error]).encode())
+
+
+def decode(value):
+    validator, response, error = json.loads(zlib.decompress(value))
+    return validator, response, error
+
+
+@metrics.timed_function('redis_set')
+def set(doi, validator, response, namespace='parse-publisher'):
+    """Cache response for doi, tagged with the landing page's S3 validator."""
+    redis_conn().set(cache_key(doi, namespace), encode(validator, response),
+                   ex=CACHE_TTL)
+
+
+@metrics.timed_function('redis_set')
+def set_error(doi, validator, error, namespace='parse-publisher'):
+    """Remember that doi failed with error, one of NEGATIVE_TTLS."""
+    redis_conn().set(
+        cache_key(doi, namespace),
+        encode(validator, None,
+               [type(error).__name__, [str(arg) for arg in error.args]]),
+        ex=NEGATIVE_TTLS[type(error)])
+
+
+@metrics.timed_function('redis_get')
+def fetch(key):
+    return redis_conn().get(key)
+
+
+def get(doi, validator, namespace='parse-publisher'):
+    """Cached response for doi, or None if missing or the landing page changed.
+
+    Raises the cached error if doi failed last time.
+    """
+    return cached_response(fetch(cache_key(doi, namespace)), validator)
+
+
+def cached_response(value, validator):
+    if value is None:
+        return None
+    try:
+        cached_validator, response, error = decode(value)
+    except (zlib.error, ValueError):
+        return None
+    if cached_validator != validator:
+        return None
+    if error:
+        name, args = error
+        raise NEGATIVE_ERRORS[name](*args)
+    return response
+
+
+@metrics.timed_function('cache_lookup')
+def lookup(doi, namespace='parse-publisher'):
+    """Check the in-process tier, then Redis.
+
+    Returns (response, validator). response is None on a miss, and validator
+    is what store should tag the fresh response with (None after a memory hit).
+    Raises the cached error if doi failed last time.
+    """
+    key = cache_key(doi, namespace)
+    response = MEMORY.get(key)
+    if response is not None:
+        return response, None
+    value = fetch(key)
+    # only missing landing pages are stored without a validator
+    cached_response(value, None)
+    try:
+        validator = landing_page_validator(doi)
+    except S3FileNotFoundError as e:
+        set_error(doi, None, e, namespace)
+        raise
+    response = cached_response(value, validator)
+    if response is not None:
+        MEMORY.set(key, response)
+    return response, validator
+
+
+@metrics.timed_function('cache_store')
+def store(doi, validator, response, namespace='parse-publisher'):
+    MEMORY.set(cache_key(doi, namespace), response)
+    set(doi, validator, response, namespace)
+
+
+def coalesced(doi, validator, compute, namespace='parse-publisher'):
+    """compute() the response for a cache miss on doi, and store it.
+
+    Concurrent misses for the same doi wait for the first one instead of
+    computing it again. An exception raised by the leader is raised for the
+    threads waiting on it as well, and stored if it is one of NEGATIVE_TTLS.
+    None results are returned but not stored.
+    """
+    key = cache_key(doi, namespace)
+    with _in_flight_lock:
+        future = _in_flight.get(key)
+        leader = future is None
+        if leader:
+            future = _in_flight[key] = futures.Future()
+
+    if not leader:
+        try:
+            with metrics.timed('coalesce_wait'):
+                return future.result(timeout=COALESCE_WAIT)
+        except futures.TimeoutError:
+            return compute_and_store(doi, validator, compute, namespace)
+
+    try:
+        response = lead(key, doi, validator, compute, namespace)
+    except Exception as e:
+        future.set_exception(e)
+        raise
+    else:
+        future.set_result(response)
+        return response
+    finally:
+        with _in_flight_lock:
+            del _in_flight[key]
+
+
+def lead(key, doi, validator, compute, namespace):
+    lock = f'lock:{key}'
+    if token := redis_lock.acquire(redis_conn(), lock, LOCK_TTL):
+        try:
+            return compute_and_store(doi, validator, compute, namespace)
+        finally:
+            redis_lock.release(redis_conn(), lock, token)
+
+    with metrics.timed('coalesce_wait'):
+        response = wait_for_worker(key, lock, validator)
+    if response is not None:
+        MEMORY.set(key, response)
+        return response
+    return compute_and_store(doi, validator, compute, namespace)
+
+
+def wait_for_worker(key, lock, validator):
+    """Response stored by the worker holding lock, or None if it gives up."""
+    deadline = time.monotonic() + COALESCE_WAIT
+    while time.monotonic() < deadline:
+        time.sleep(POLL_INTERVAL)
+        value, locked = redis_conn().mget(key, lock)
+        response = cached_response(value, validator)
+        if response is not None or locked is None:
+            return response
+    return None
+
+
+def compute_and_store(doi, validator, compute, namespace):
+    try:
+        response = compute()
+    except APIError as e:
+        if type(e) in NEGATIVE_TTLS:
+            set_error(doi, validator, e, namespace)
+        raise
+    if response is not None:
+        store(doi, validator, response, namespace)
+    return response
@@ -1,69 +1,110 @@
+import functools
 import traceback
 
-from bs4 import BeautifulSoup
-
 from exceptions import ParserNotFoundError
-from publisher.parsers.generic import GenericPublisherParser
-from publisher.parsers.parser import PublisherParser
+from publisher.dispatch import DispatchIndex
+from publisher.parsers import publisher_parsers
 from publisher.utils import normalize_doi
-from util.s3 import make_s3
+from util.html_prune import prune_html
+from util.metrics import timed
+from util.parsed_page import ParsedPage
+
 
-_s3 = make_s3()
+@functools.lru_cache(maxsize=None)
+def dispatch_index():
+    return DispatchIndex(publisher_parsers())
 
 
 class PublisherController:
     def __init__(self, html, doi):
         self.doi = normalize_doi(doi)
-        self.parsers = PublisherParser.__subclasses__()
-        self.soup = BeautifulSoup(html, "lxml")
+        self.parsers = publisher_parsers()
+        # the page as stored, for text searches that must see script bodies
+        self.html = html
+        with timed('prune_html'):
+            pruned, self.payloads = prune_html(html)
+        # the body is only parsed once the parsers are tried
+        self.page = ParsedPage(pruned)
+        self.signals = self.page.signals
+        self.memo = {}
+        self._checked = {}
+        self._tried = set()
 
-    def best_parser_msg(self):
-        both_conditions_parsers = []
-        authors_found_parsers = []
+    @property
+    def soup(self):
+        return self.page.soup
 
-        def has_affs(parsed):
-            if not parsed['authors']:
-                return False
-            return any([author['affiliations'] if isinstance(parsed['authors'][0], dict) else author.affiliations for author in parsed['authors']])
+    @staticmethod
+    def has_affs(parsed):
+        if not parsed['authors']:
+            return False
+        return any([author['affiliations'] if isinstance(parsed['authors'][0], dict) else author.affiliations for author in parsed['authors']])
 
-        for cls in self.parsers:
-            parser = cls(self.soup)
+    def check_parser(self, cls):
+        """Return (parser, authors_found, pub_specific_parser), evaluated once per parser class."""
+        if cls not in self._checked:
+            parser = cls(self.soup, self.signals, self.payloads, self.memo)
             authors_found = False
             pub_specific_parser = False
             try:
-                authors_found = parser.authors_found()
-                pub_specific_parser = parser.is_publisher_specific_parser()
+                with timed('authors_found', cls.parser_name):
+                    authors_found = parser.authors_found()
+                with timed('is_publisher_specific_parser', cls.parser_name):
+                    pub_specific_parser = parser.is_publisher_specific_parser()
             except Exception as e:
                 print(f'Error with parser {cls.parser_name} parser: {e}')
+            self._checked[cls] = (parser, authors_found, pub_specific_parser)
+        return self._checked[cls]
 
-            if authors_found:
-                if pub_specific_parser:
-                    both_conditions_parsers.append(parser)
-                else:
-                    authors_found_parsers.append(parser)
-
-        for parser in both_conditions_parsers:
-            try:
-                parsed = parser.parse()
-                if has_affs(parsed):
-                    return parser, parsed
-            except Exception as e:
-                print(f'Exception with DOI: {self.doi}')
-                traceback.print_exc()
+    def first_with_affs(self, parsers):
+        for parser in parsers:
+            if type(parser) in self._tried:
                 continue
-
-        for parser in authors_found_parsers:
+            self._tried.add(type(parser))
             try:
-                parsed = parser.parse()
-                if has_affs(parsed):
+                with timed('parse', parser.parser_name):
+                    parsed = parser.parse()
+                if self.has_affs(parsed):
                     return parser, parsed
             except Exception as e:
                 print(f'Exception with DOI: {self.doi}')
                 traceback.print_exc()
                 continue
+        return None
+
+    def best_parser_msg(self):
+        # try the few parsers whose declared signals match the page first
+        candidates = dispatch_index().candidates(self.signals)
+        if result := self.first_with_affs(
+                [parser for parser, authors_found, pub_specific_parser in
+                 map(self.check_parser, candidates)
+                 if authors_found and pub_specific_parser]):
+            return result
+
+        # fall back to every parser
+        both_conditions_parsers = []
+        authors_found_parsers = []
+
+        for cls in self.parsers:
+            parser, authors_found, pub_specific_parser = self.check_parser(cls)
+
+            if authors_found:
+                if pub_specific_parser:
+                    both_conditions_parsers.append(parser)
+                else:
+                    authors_found_parsers.append(parser)
+
+        if result := self.first_with_affs(both_conditions_parsers):
+            return result
+
+        if result := self.first_with_affs(authors_found_parsers):
+            return result
 
-        generic_parser = GenericPublisherParser(self.soup)
+        # imported late, so publisher_parsers() keeps the package's order
+        from publisher.parsers.generic import GenericPublisherParser
+        generic_parser, _, _ = self.check_parser(GenericPublisherParser)
         if generic_parser.authors_found():
-            return generic_parser, generic_parser.parse()
+            with timed('parse', generic_parser.parser_name):
+                return generic_parser, generic_parser.parse()
 
         raise ParserNotFoundError(f"Parser not found for {self.doi}")
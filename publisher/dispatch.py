@@ -0,0 +1,56 @@
+from collections import defaultdict
+
+from publisher.parsers.parser import PublisherParser
+
+# kinds compared case-insensitively, mirroring the PublisherParser helpers
+CASE_INSENSITIVE_KINDS = {'citation_publishers', 'citation_journal_titles'}
+
+
+def signal_values(signals):
+    """The page values each signal kind is matched against."""
+    return {
+        'canonical_domains': signals.canonical_url,
+        'og_url_domains': signals.meta('og:url'),
+        'og_site_names': signals.meta('og:site_name'),
+        'citation_publishers': signals.meta('citation_publisher', ('name',)),
+        'citation_journal_titles': signals.meta('citation_journal_title',
+                                                ('name',)),
+    }
+
+
+class DispatchIndex:
+    """Maps declared page signals to the parsers that claim them.
+
+    Parsers with their own is_publisher_specific_parser may match pages on
+    more than their declared signals, so they are always candidates.
+    """
+
+    KINDS = ('canonical_domains', 'og_url_domains', 'og_site_names',
+             'citation_publishers', 'citation_journal_titles')
+
+    def __init__(self, parsers):
+        self.parsers = list(parsers)
+        self.order = {cls: i for i, cls in enumerate(self.parsers)}
+        self.needles = defaultdict(list)
+        self.custom = {cls for cls in self.parsers if
+                       cls.is_publisher_specific_parser is not
+                       PublisherParser.is_publisher_specific_parser}
+        for cls in self.parsers:
+            for kind in self.KINDS:
+                for needle in getattr(cls, kind, ()):
+                    if kind in CASE_INSENSITIVE_KINDS:
+                        needle = needle.lower()
+                    self.needles[kind].append((needle, cls))
+
+    def candidates(self, signals):
+        """Parsers that may be specific to the page, in registry order."""
+        matched = set(self.custom)
+        for kind, value in signal_values(signals).items():
+            if not value:
+                continue
+            if kind in CASE_INSENSITIVE_KINDS:
+                value = value.lower()
+            for needle, cls in self.needles[kind]:
+                if needle in value:
+                    matched.add(cls)
+        return sorted(matched, key=self.order.get)
@@ -1,9 +1,29 @@
+import functools
 from importlib import import_module
 from pathlib import Path
 from pkgutil import iter_modules
 
-# iterate through the modules in the current package
+from publisher.parsers.parser import PublisherParser
+
 package_dir = Path(__file__).resolve().parent
-for (_, module_name, _) in iter_modules([str(package_dir)]):
-    # import the module
-    module = import_module(f"{__name__}.{module_name}")
+
+# GrobidParser reads PDFs for pdf.controller and isn't a publisher parser.
+NOT_PUBLISHER_PARSERS = {'grobid'}
+
+
+@functools.lru_cache(maxsize=None)
+def load_parsers():
+    """Import every parser module in the package, on first use.
+
+    Importing the package alone loads none of them, so endpoints that don't
+    parse publisher pages start without them.
+    """
+    for (_, module_name, _) in iter_modules([str(package_dir)]):
+        if module_name not in NOT_PUBLISHER_PARSERS:
+            import_module(f"{__name__}.{module_name}")
+
+
+def publisher_parsers():
+    """Every PublisherParser subclass, in the order they were defined."""
+    load_parsers()
+    return PublisherParser.__subclasses__()
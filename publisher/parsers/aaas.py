@@ -8,9 +8,7 @@ class AAAS(PublisherParser):
         return bool(self.soup.select('div[property=author]'))
 
     parser_name = "aaas"
-
-    def is_publisher_specific_parser(self):
-        return self.domain_in_canonical_link('science.org')
+    canonical_domains = ('science.org',)
 
     def parse_authors(self):
         author_tags = self.soup.select('div[property=author]:has(span)')
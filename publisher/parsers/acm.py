@@ -5,9 +5,7 @@ from publisher.parsers.parser import PublisherParser
 
 class AssociationForComputingMachinery(PublisherParser):
     parser_name = "association_for_computing_machineinery"
-
-    def is_publisher_specific_parser(self):
-        return self.domain_in_meta_og_url('acm.org')
+    og_url_domains = ('acm.org',)
 
     def authors_found(self):
         return bool(self.soup.select('span[class*="author-info"]'))
@@ -5,9 +5,10 @@ from publisher.parsers.parser import PublisherParser
 
 class ACS(PublisherParser):
     parser_name = "acs"
+    og_url_domains = (".acs.org",)
 
     def is_publisher_specific_parser(self):
-        if "Request forbidden by administrative rules" in str(self.soup):
+        if "Request forbidden by administrative rules" in self.html:
             raise UnusualTrafficError(f"Page blocked within parser {self.parser_name}")
         return self.domain_in_meta_og_url(".acs.org")
 
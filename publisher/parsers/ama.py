@@ -4,15 +4,14 @@ from publisher.parsers.parser import PublisherParser
 
 class AMA(PublisherParser):
     parser_name = "american_medical_association"
-
-    def is_publisher_specific_parser(self):
-        return self.domain_in_canonical_link('jamanetwork.com')
+    canonical_domains = ('jamanetwork.com',)
 
     def authors_found(self):
         return bool(self.soup.select('span.wi-fullname'))
 
     def parse(self):
-        generic = GenericPublisherParser(self.soup)
+        generic = GenericPublisherParser(self.soup, self.signals,
+                                         self.payloads, self.memo)
         msg = generic.parse()
         if corresponding_tag := self.soup.select_one('p.authorInfoSection'):
             corr_text = corresponding_tag.text
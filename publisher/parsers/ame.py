@@ -6,9 +6,7 @@ from publisher.parsers.parser import PublisherParser
 
 class AMEPublishing(PublisherParser):
     parser_name = "ame_publishing"
-
-    def is_publisher_specific_parser(self):
-        return self.substr_in_citation_publisher('AME ')
+    citation_publishers = ('AME ',)
 
     def authors_found(self):
         return bool(self.soup.select('p.authors'))
@@ -4,9 +4,7 @@ from publisher.parsers.parser import PublisherParser
 
 class AOM(PublisherParser):
     parser_name = "academy_of_management"
-
-    def is_publisher_specific_parser(self):
-        return self.domain_in_meta_og_url("aom.org")
+    og_url_domains = ("aom.org",)
 
     def authors_found(self):
         return self.soup.find("div", class_="loa-wrapper")
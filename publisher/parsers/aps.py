@@ -4,11 +4,7 @@ from publisher.parsers.parser import PublisherParser
 
 class APS(PublisherParser):
     parser_name = "aps"
-
-    def is_publisher_specific_parser(self):
-        return self.domain_in_meta_og_url(
-            "journals.aps.org") or self.domain_in_meta_og_url(
-            'journals.physiology.org')
+    og_url_domains = ('journals.aps.org', 'journals.physiology.org')
 
     def authors_found(self):
         return bool(self.soup.select(
@@ -7,9 +7,7 @@ from publisher.parsers.utils import name_in_text
 
 class APSPhysics(PublisherParser):
     parser_name = "aps_physics"
-
-    def is_publisher_specific_parser(self):
-        return self.domain_in_meta_og_url('physics.aps.org')
+    og_url_domains = ('physics.aps.org',)
 
     def authors_found(self):
         return bool(self.soup.select('.author div'))
@@ -4,9 +4,7 @@ from publisher.parsers.utils import strip_seq
 
 class AcousticalSocietyOfAmerica(PublisherParser):
     parser_name = "acoustical_society_of_america"
-
-    def is_publisher_specific_parser(self):
-        return self.domain_in_meta_og_url('asa.scitation')
+    og_url_domains = ('asa.scitation',)
 
     def authors_found(self):
         return bool(self.soup.select('.entryAuthor .contrib-author'))
@@ -4,9 +4,7 @@ from publisher.parsers.utils import strip_suffix
 
 class AmericanSocietyOfCivilEngineers(PublisherParser):
     parser_name = "american_society_of_civil_engineers"
-
-    def is_publisher_specific_parser(self):
-        return self.domain_in_meta_og_url('ascelibrary.org')
+    og_url_domains = ('ascelibrary.org',)
 
     def authors_found(self):
         return bool(self.soup.select('.author-block'))
@@ -4,9 +4,7 @@ from publisher.parsers.utils import is_h_tag
 
 class AmericanSocietyOfHematology(PublisherParser):
     parser_name = "american_society_of_hematology"
-
-    def is_publisher_specific_parser(self):
-        return self.domain_in_meta_og_url('ashpublications.org')
+    og_url_domains = ('ashpublications.org',)
 
     def authors_found(self):
         return bool(self.soup.select('.al-author-name'))
@@ -3,9 +3,7 @@ from publisher.parsers.parser import PublisherParser
 
 class TheAstronomicalJournal(PublisherParser):
     parser_name = "the_astronomical_journal"
-
-    def is_publisher_specific_parser(self):
-        return self.substr_in_citation_journal_title('Astronomical Journal')
+    citation_journal_titles = ('Astronomical Journal',)
 
     def authors_found(self):
         return bool(self.soup.select('li.author'))
@@ -3,9 +3,7 @@ from publisher.parsers.parser import PublisherParser
 
 class ASM(PublisherParser):
     parser_name = "american_science_for_microbiology"
-
-    def is_publisher_specific_parser(self):
-        return self.domain_in_meta_og_url('journals.asm.org')
+    og_url_domains = ('journals.asm.org',)
 
     def authors_found(self):
         return bool(self.soup.select("[property=author]"))
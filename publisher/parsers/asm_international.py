@@ -6,9 +6,7 @@ from publisher.parsers.utils import is_h_tag
 
 class ASMInternational(PublisherParser):
     parser_name = "asm_international"
-
-    def is_publisher_specific_parser(self):
-        return self.domain_in_meta_og_url('astm.org') or self.domain_in_meta_og_url('asme.org')
+    og_url_domains = ('astm.org', 'asme.org')
 
     def authors_found(self):
         return bool(self.soup.find(lambda tag: is_h_tag(tag) and 'Author Information' in tag.text) or self.soup.select('.al-author-name'))
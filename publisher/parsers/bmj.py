@@ -5,9 +5,7 @@ from publisher.parsers.utils import name_in_text
 
 class BMJ(PublisherParser):
     parser_name = "bmj"
-
-    def is_publisher_specific_parser(self):
-        return self.domain_in_meta_og_url("bmj.com")
+    og_url_domains = ("bmj.com",)
 
     def authors_found(self):
         return self.soup.find("ol",
@@ -3,9 +3,7 @@ from publisher.parsers.parser import PublisherParser
 
 class Brill(PublisherParser):
     parser_name = "brill"
-
-    def is_publisher_specific_parser(self):
-        return self.domain_in_meta_og_url('brill.com')
+    og_url_domains = ('brill.com',)
 
     def authors_found(self):
         return bool(self.soup.select('div.contributor-line'))
@@ -3,6 +3,7 @@ from publisher.parsers.parser import PublisherParser
 
 class CadmusPress(PublisherParser):
     parser_name = "cadmus_press"
+    citation_publishers = ('The Association for Research in Vision and Ophthalmology',)
 
     def is_publisher_specific_parser(self):
         if publisher_meta := self.soup.select_one('meta[name=citation_publisher]'):
@@ -3,9 +3,7 @@ from publisher.parsers.parser import PublisherParser
 
 class CAIRN(PublisherParser):
     parser_name = "cairn"
-
-    def is_publisher_specific_parser(self):
-        return self.domain_in_meta_og_url('cairn.info')
+    og_url_domains = ('cairn.info',)
 
     def authors_found(self):
         return bool(self.soup.select('div.auteur'))
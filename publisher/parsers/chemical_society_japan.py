@@ -5,9 +5,7 @@ from publisher.parsers.parser import PublisherParser
 
 class CSJ(PublisherParser):
     parser_name = "chemical_society_of_japan"
-
-    def is_publisher_specific_parser(self):
-        return self.domain_in_meta_og_url('journal.csj.jp')
+    og_url_domains = ('journal.csj.jp',)
 
     def authors_found(self):
         return bool(self.soup.select('[class*=ContribAuthor]'))
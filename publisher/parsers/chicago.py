@@ -3,6 +3,8 @@ from publisher.parsers.parser import PublisherParser
 
 class Chicago(PublisherParser):
     parser_name = "university_of_chicago"
+    og_url_domains = ('journals.uchicago.edu',)
+    citation_publishers = ('Theory of Computing',)
 
     def is_publisher_specific_parser(self):
         if self.domain_in_meta_og_url('journals.uchicago.edu'):
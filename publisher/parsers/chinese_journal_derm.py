@@ -3,9 +3,7 @@ from publisher.parsers.parser import PublisherParser
 
 class ChineseJournalOfDermatology(PublisherParser):
     parser_name = "chinese_journal_of_dermatology"
-
-    def is_publisher_specific_parser(self):
-        return self.substr_in_citation_journal_title('中华皮肤科杂志')
+    citation_journal_titles = ('中华皮肤科杂志',)
 
     def authors_found(self):
         return bool(
@@ -10,9 +10,7 @@ from publisher.parsers.utils import strip_prefix, cleanup_raw_name
 
 class CSIRO(PublisherParser):
     parser_name = "csiro_publishing"
-
-    def is_publisher_specific_parser(self):
-        return self.domain_in_meta_og_url('publish.csiro.au')
+    og_url_domains = ('publish.csiro.au',)
 
     def authors_found(self):
         return bool(self.soup.select('.editors'))
@@ -6,9 +6,7 @@ from publisher.parsers.parser import PublisherParser
 
 class CUP(PublisherParser):
     parser_name = "cambridge university press"
-
-    def is_publisher_specific_parser(self):
-        return self.domain_in_meta_og_url("cambridge.org")
+    og_url_domains = ("cambridge.org",)
 
     def authors_found(self):
         return self.soup.find("div", class_="author")
@@ -3,9 +3,7 @@ from publisher.parsers.parser import PublisherParser
 
 class DeGruyter(PublisherParser):
     parser_name = "de_gruyter"
-
-    def is_publisher_specific_parser(self):
-        return self.domain_in_meta_og_url('degruyter.com')
+    og_url_domains = ('degruyter.com',)
 
     def authors_found(self):
         return bool(self.soup.select('span.contributor'))
@@ -1,5 +1,3 @@
-import json
-
 from publisher.parsers.parser import PublisherParser
 
 
@@ -14,9 +12,7 @@ class DeGruyterOpen(PublisherParser):
         return bool(self.soup.select('div[class*=author-popup]'))
 
     def parse_json(self):
-        if json_tag := self.soup.select_one('script#__NEXT_DATA__'):
-            return json.loads(json_tag.text)
-        return {}
+        return self.next_data() or {}
 
     @staticmethod
     def parse_authors(j):
@@ -7,9 +7,7 @@ from publisher.parsers.parser import PublisherParser
 
 class Dove(PublisherParser):
     parser_name = "dove_press"
-
-    def is_publisher_specific_parser(self):
-        return self.domain_in_meta_og_url('dovepress.com')
+    og_url_domains = ('dovepress.com',)
 
     def authors_found(self):
         return bool(self.soup.select('div.article-inner_html > p'))
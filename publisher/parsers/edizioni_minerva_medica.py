@@ -7,9 +7,7 @@ from publisher.parsers.parser import PublisherParser
 
 class EMM(PublisherParser):
     parser_name = "edizioni_minerva_medica"
-
-    def is_publisher_specific_parser(self):
-        return self.domain_in_canonical_link('minervamedica.it')
+    canonical_domains = ('minervamedica.it',)
 
     def authors_found(self):
         return bool(self.soup.select('h4 + p'))
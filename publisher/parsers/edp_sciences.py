@@ -3,6 +3,7 @@ from publisher.parsers.parser import PublisherParser
 
 class EDPSciences(PublisherParser):
     parser_name = "edp_sciences"
+    citation_publishers = ("EDP Sciences",)
 
     def is_publisher_specific_parser(self):
         for meta_citation_url in self.soup.find_all(
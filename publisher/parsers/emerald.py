@@ -4,9 +4,7 @@ from publisher.parsers.parser import PublisherParser
 
 class Emerald(PublisherParser):
     parser_name = "emerald"
-
-    def is_publisher_specific_parser(self):
-        return self.domain_in_canonical_link("emerald.com")
+    canonical_domains = ("emerald.com",)
 
     def authors_found(self):
         return self.soup.find("span", class_="m:contributor-display")
@@ -7,9 +7,7 @@ from publisher.parsers.utils import strip_prefix, cleanup_raw_name
 
 class EMHSwissMedical(PublisherParser):
     parser_name = "emh_swiss_medical"
-
-    def is_publisher_specific_parser(self):
-        return self.domain_in_meta_og_url('bullmed.ch')
+    og_url_domains = ('bullmed.ch',)
 
     def authors_found(self):
         return bool(self.soup.select('.authors'))
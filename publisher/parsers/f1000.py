@@ -5,9 +5,7 @@ from publisher.parsers.parser import PublisherParser
 
 class F1000(PublisherParser):
     parser_name = "f1000_taylor"
-
-    def is_publisher_specific_parser(self):
-        return self.substr_in_citation_journal_title('f1000')
+    citation_journal_titles = ('f1000',)
 
     def authors_found(self):
         return self.soup.select_one('.asset-authors')
@@ -6,9 +6,7 @@ from publisher.parsers.parser import PublisherParser
 
 class Frontiers(PublisherParser):
     parser_name = "frontiers"
-
-    def is_publisher_specific_parser(self):
-        return self.domain_in_meta_og_url("frontiersin.org")
+    og_url_domains = ("frontiersin.org",)
 
     def authors_found(self):
         return self.soup.find("div", class_="authors")
@@ -4,10 +4,6 @@ from publisher.parsers.parser import PublisherParser
 class GenericPublisherParser(PublisherParser):
     parser_name = "generic_publisher_parser"
 
-    def __init__(self, soup):
-        super().__init__(soup)
-        self._parse_result = None
-
     def is_publisher_specific_parser(self):
         return False
 
@@ -16,14 +12,10 @@ class GenericPublisherParser(PublisherParser):
         return parsed.get('authors') or parsed.get('abstract')
 
     def parse(self):
-        if not self._parse_result:
-            authors = self.parse_author_meta_tags()
-            self._parse_result = {
-                "authors": authors,
-                "abstract": self.parse_abstract_meta_tags(),
-            }
-
-        return self._parse_result
+        return {
+            "authors": self.parse_author_meta_tags(),
+            "abstract": self.parse_abstract_meta_tags(),
+        }
 
     test_cases = [
         {
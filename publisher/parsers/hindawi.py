@@ -1,14 +1,10 @@
-import json
-
 from publisher.parsers.parser import PublisherParser
 from publisher.parsers.utils import remove_parents
 
 
 class Hindawi(PublisherParser):
     parser_name = "hindawi"
-
-    def is_publisher_specific_parser(self):
-        return self.domain_in_canonical_link('hindawi.com')
+    canonical_domains = ('hindawi.com',)
 
     def authors_found(self):
         return bool(self.soup.select('.article_authors') or self.soup.select(
@@ -51,8 +47,7 @@ class Hindawi(PublisherParser):
 
     def parse_json(self):
         authors = []
-        data_tag = self.soup.select_one('script#__NEXT_DATA__')
-        j = json.loads(data_tag.text)
+        j = self.next_data()
         article_obj = j['props']['pageProps']['article']
         article_obj['affiliations'] = sorted(article_obj['affiliations'], key=lambda obj: obj['affId'])
         for author in article_obj['authors']:
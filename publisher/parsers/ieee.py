@@ -1,15 +1,10 @@
-import json
-import re
-
 from publisher.elements import AuthorAffiliations
 from publisher.parsers.parser import PublisherParser
 
 
 class IEEE(PublisherParser):
     parser_name = "IEEE"
-
-    def is_publisher_specific_parser(self):
-        return self.domain_in_canonical_link("ieee.org")
+    canonical_domains = ("ieee.org",)
 
     def authors_found(self):
         json_data = self.get_json_data()
@@ -33,17 +28,7 @@ class IEEE(PublisherParser):
         return {"authors": authors, "abstract": self.get_abstract()}
 
     def get_json_data(self):
-        raw_script = re.search("xplGlobal.document.metadata=.*", str(self.soup))
-
-        if raw_script:
-            raw_json = raw_script.group()
-            trimmed_json = raw_json.replace("xplGlobal.document.metadata=", "").replace(
-                "};", "}"
-            )
-            json_data = json.loads(trimmed_json)
-        else:
-            json_data = None
-        return json_data
+        return self.ieee_metadata()
 
     def get_abstract(self):
         if og_description := self.soup.find("meta", {"property": "og:description"}):
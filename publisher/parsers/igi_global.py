@@ -6,9 +6,7 @@ from publisher.parsers.utils import strip_prefix
 
 class IGIGlobal(PublisherParser):
     parser_name = "igi_global"
-
-    def is_publisher_specific_parser(self):
-        return self.domain_in_meta_og_url('igi-global.com')
+    og_url_domains = ('igi-global.com',)
 
     def authors_found(self):
         return bool(self.soup.select('span[id*=lblAffiliates]'))
@@ -3,9 +3,7 @@ from publisher.parsers.parser import PublisherParser
 
 class InderScience(PublisherParser):
     parser_name = "inderscience"
-
-    def is_publisher_specific_parser(self):
-        return self.domain_in_meta_og_url('inderscienceonline.com')
+    og_url_domains = ('inderscienceonline.com',)
 
     def authors_found(self):
         return bool(self.soup.select('div[class*=tab-mobile]'))
@@ -4,11 +4,7 @@ from publisher.parsers.utils import split_name, name_in_text
 
 class IOSPress(PublisherParser):
     parser_name = "ios_press"
-
-    def is_publisher_specific_parser(self):
-        if publisher_name_tag := self.soup.select_one('meta[name=citation_publisher]'):
-            return 'ios press' in publisher_name_tag['content'].lower()
-        return False
+    citation_publishers = ('ios press',)
 
     def authors_found(self):
         return bool(self.soup.select('p.metadata-entry a[href*=author]'))
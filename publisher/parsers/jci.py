@@ -3,9 +3,7 @@ from publisher.parsers.parser import PublisherParser
 
 class JCI(PublisherParser):
     parser_name = "jci"
-
-    def is_publisher_specific_parser(self):
-        return self.substr_in_citation_journal_title('JCI Insight')
+    citation_journal_titles = ('JCI Insight',)
 
     def authors_found(self):
         return bool(self.soup.select_one('.author-list'))
@@ -8,9 +8,7 @@ from publisher.parsers.utils import names_match
 
 class JMIR(PublisherParser):
     parser_name = "jmir"
-
-    def is_publisher_specific_parser(self):
-        return self.domain_in_meta_og_url('jmir.org')
+    og_url_domains = ('jmir.org',)
 
     def authors_found(self):
         return bool(self.soup.select('p.authors-list .authors'))
@@ -4,9 +4,7 @@ from publisher.parsers.parser import PublisherParser
 
 class JSME(PublisherParser):
     parser_name = "japan_society_of_mechanical_engineers"
-
-    def is_publisher_specific_parser(self):
-        return self.domain_in_meta_og_url('www.jstage')
+    og_url_domains = ('www.jstage',)
 
     def authors_found(self):
         return bool(self.soup.select('.global-authors-name-tags a'))
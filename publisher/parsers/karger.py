@@ -8,9 +8,7 @@ from publisher.parsers.utils import is_h_tag
 
 class Karger(PublisherParser):
     parser_name = "karger"
-
-    def is_publisher_specific_parser(self):
-        return self.domain_in_meta_og_url('karger.com')
+    og_url_domains = ('karger.com',)
 
     def authors_found(self):
         return bool(self.soup.select_one('span.autoren')) or bool(self.soup.select('.al-author-name'))
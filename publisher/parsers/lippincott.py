@@ -10,6 +10,8 @@ from publisher.parsers.utils import name_in_text, split_name, strip_prefix
 
 class Lippincott(PublisherParser):
     parser_name = "lippincott"
+    og_url_domains = ('journals.lww.com',)
+    citation_publishers = ('American Society of Anesthesiologists',)
 
     def is_publisher_specific_parser(self):
         return self.domain_in_meta_og_url(
@@ -23,17 +25,20 @@ class Lippincott(PublisherParser):
 
     @staticmethod
     def assign_affs_from_name(author_affiliations: List[AuthorAffiliations], affiliations):
+        # each name is parsed once, not once per affiliation
+        names = [(author, HumanName(author.name)) for author in
+                 author_affiliations]
         for aff in affiliations:
             matched_name = None
-            for author in author_affiliations:
-                name_parsed = HumanName(author.name)
+            matched = set()
+            for author, name_parsed in names:
                 if name_parsed.first in aff.organization and name_parsed.last in aff.organization:
                     author.affiliations.append(aff.organization)
                     matched_name = name_parsed
+                    matched.add(id(author))
             if matched_name:
                 for author in author_affiliations:
-                    name_parsed = HumanName(author.name)
-                    if name_parsed.first in aff.organization and name_parsed.last in aff.organization:
+                    if id(author) in matched:
                         continue
                     for i, _aff in enumerate(author.affiliations):
                         if aff.organization == _aff:
@@ -127,11 +132,7 @@ class Lippincott(PublisherParser):
             authors.append(Author(name=name, aff_ids=aff_ids,
                                   is_corresponding=is_corresponding))
 
-        def author_already_exists(name):
-            for author in authors:
-                if author.name.lower() == name.lower():
-                    return True
-            return False
+        known_names = {author.name.lower() for author in authors}
 
         # authors without ids
         if author_section.p:
@@ -142,8 +143,9 @@ class Lippincott(PublisherParser):
             parsed_author_names = author_names.text.split(";")
             for name in parsed_author_names:
                 name = name.replace("∗", "").strip()
-                if author_already_exists(name):
+                if name.lower() in known_names:
                     continue
+                known_names.add(name.lower())
                 authors.append(Author(name=name, aff_ids=[]))
 
         if not [author for author in authors if author.is_corresponding]:
@@ -3,9 +3,7 @@ from publisher.parsers.parser import PublisherParser
 
 class MaryAnnLiebert(PublisherParser):
     parser_name = "mary_ann_liebert"
-
-    def is_publisher_specific_parser(self):
-        return self.domain_in_meta_og_url('liebertpub.com')
+    og_url_domains = ('liebertpub.com',)
 
     def authors_found(self):
         return bool(self.soup.select('div[class*=tab-mobile]'))
@@ -4,11 +4,9 @@ from publisher.parsers.parser import PublisherParser
 
 class MDPI(PublisherParser):
     parser_name = "mdpi"
+    og_url_domains = ("mdpi.com",)
     chars_to_ignore = ["*", "†", "‡", "§"]
 
-    def is_publisher_specific_parser(self):
-        return self.domain_in_meta_og_url("mdpi.com")
-
     def authors_found(self):
         return self.soup.find("div", class_="art-authors")
 
@@ -11,7 +11,7 @@ class MedKnow(PublisherParser):
 
     def is_publisher_specific_parser(self):
         script_url = "https://www.medknow.com/ss/ftr.js"
-        return script_url in str(self.soup)
+        return script_url in self.html
 
     def authors_found(self):
         return self.soup.find("font", class_="articleAuthor")
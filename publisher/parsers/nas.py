@@ -3,9 +3,7 @@ from publisher.parsers.parser import PublisherParser
 
 class NationalAcademyOfScience(PublisherParser):
     parser_name = "national_academy_of_science"
-
-    def is_publisher_specific_parser(self):
-        return self.domain_in_meta_og_url('pnas.org')
+    og_url_domains = ('pnas.org',)
 
     def authors_found(self):
         return bool(self.soup.select(
@@ -12,9 +12,7 @@ from publisher.parsers.utils import strip_seqs, strip_prefix
 
 class NewEnglandJournalOfMedicine(PublisherParser):
     parser_name = 'nejm'
-
-    def is_publisher_specific_parser(self):
-        return self.domain_in_meta_og_url('nejm.org')
+    og_url_domains = ('nejm.org',)
 
     def authors_found(self):
         return bool(self.soup.select('ul.m-article-header__authors'))
@@ -5,9 +5,7 @@ from publisher.parsers.parser import PublisherParser
 
 class OpenEdition(PublisherParser):
     parser_name = "open_edition"
-
-    def is_publisher_specific_parser(self):
-        return self.domain_in_meta_og_url('openedition.org')
+    og_url_domains = ('openedition.org',)
 
     def authors_found(self):
         return bool(self.soup.select('.section.authors'))
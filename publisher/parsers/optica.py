@@ -4,9 +4,7 @@ from publisher.parsers.utils import EMAIL_RE
 
 class Optica(PublisherParser):
     parser_name = 'optica'
-
-    def is_publisher_specific_parser(self):
-        return self.domain_in_meta_og_url('optica.org')
+    og_url_domains = ('optica.org',)
 
     def authors_found(self):
         return bool(self.soup.select('#authorAffiliations'))
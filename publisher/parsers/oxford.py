@@ -8,13 +8,12 @@ from publisher.parsers.parser import PublisherParser
 
 class Oxford(PublisherParser):
     parser_name = "oxford university press"
+    og_url_domains = ("academic.oup.com",)
 
     def is_publisher_specific_parser(self):
         if self.soup.find(
                 "div", class_="explanation-message"
-        ) and "help us confirm that you are not a robot and we will take you to your content" in str(
-            self.soup
-        ):
+        ) and "help us confirm that you are not a robot and we will take you to your content" in self.html:
             raise UnusualTrafficError(
                 f"content blocked within {self.parser_name} parser"
             )
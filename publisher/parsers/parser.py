@@ -1,3 +1,5 @@
+import functools
+import json
 import re
 from abc import ABC, abstractmethod
 
@@ -6,7 +8,18 @@ from bs4 import BeautifulSoup
 from publisher.elements import AuthorAffiliations, Author
 from publisher.parsers.utils import remove_parents, strip_seq, strip_prefix, \
     is_h_tag
-from readability import Document
+from util.html_prune import ScriptPayloads
+from util.page_signals import PageSignals
+
+
+def memoize_result(method):
+    """Cache a parser method's result on the instance (exceptions aren't cached)."""
+    @functools.wraps(method)
+    def wrapper(self):
+        if method not in self._results:
+            self._results[method] = method(self)
+        return self._results[method]
+    return wrapper
 
 
 class Parser(ABC):
@@ -22,17 +35,93 @@ class Parser(ABC):
 
 
 class PublisherParser(Parser, ABC):
-    def __init__(self, soup):
+    # Page signals identifying the publisher. They back the default
+    # is_publisher_specific_parser and the controller's dispatch index.
+    canonical_domains = ()
+    og_url_domains = ()
+    og_site_names = ()
+    citation_publishers = ()
+    citation_journal_titles = ()
+
+    def __init__(self, soup, signals=None, payloads=None, memo=None):
         self.soup = soup
+        self.signals = signals or PageSignals.from_soup(soup)
+        # script payloads pulled out by util.html_prune, when the page was pruned
+        self.payloads = payloads
+        # page-level values shared by every parser the controller builds
+        self.memo = memo if memo is not None else {}
+        self._results = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # authors_found and parse run at most once per parser instance
+        for name in ('authors_found', 'parse'):
+            if name in cls.__dict__:
+                setattr(cls, name, memoize_result(cls.__dict__[name]))
+
+    def memoized(self, key, compute):
+        if key not in self.memo:
+            self.memo[key] = compute()
+        return self.memo[key]
+
+    @property
+    def html(self):
+        """The soup serialized to a string, once per page."""
+        return self.memoized('html', lambda: str(self.soup))
+
+    @property
+    def script_payloads(self):
+        if self.payloads is None:
+            self.payloads = self.memoized(
+                'payloads', lambda: ScriptPayloads.from_soup(self.soup))
+        return self.payloads
+
+    def decoded(self, key, body):
+        # decoded per parser instance, since some parsers modify what they load
+        if key not in self._results:
+            self._results[key] = json.loads(body)
+        return self._results[key]
+
+    def ld_json(self):
+        """Decoded ld+json scripts, in document order."""
+        return [self.decoded(('ld_json', i), body) for i, body in
+                enumerate(self.script_payloads.ld_json)]
+
+    def next_data(self):
+        """Decoded script#__NEXT_DATA__, or None if the page has none."""
+        body = self.script_payloads.next_data
+        return None if body is None else self.decoded('next_data', body)
+
+    def application_json(self):
+        """The first application/json script, decoded."""
+        return self.decoded('application_json', self.script_payloads.json[0])
+
+    def ieee_metadata(self):
+        """Decoded xplGlobal.document.metadata, or None if the page has none."""
+        raw = self.script_payloads.ieee_metadata
+        if raw is None:
+            return None
+        return self.decoded('ieee_metadata', raw.replace(
+            "xplGlobal.document.metadata=", "").replace("};", "}"))
 
     @property
     @abstractmethod
     def parser_name(self):
         pass
 
-    @abstractmethod
     def is_publisher_specific_parser(self):
-        pass
+        return (
+                any(self.domain_in_canonical_link(domain) for domain in
+                    self.canonical_domains)
+                or any(self.domain_in_meta_og_url(domain) for domain in
+                       self.og_url_domains)
+                or any(self.text_in_meta_og_site_name(txt) for txt in
+                       self.og_site_names)
+                or any(self.substr_in_citation_publisher(substr) for substr in
+                       self.citation_publishers)
+                or any(self.substr_in_citation_journal_title(substr) for substr
+                       in self.citation_journal_titles)
+        )
 
     @abstractmethod
     def authors_found(self):
@@ -44,51 +133,36 @@ class PublisherParser(Parser, ABC):
                 "genre": None}
 
     def domain_in_canonical_link(self, domain):
-        canonical_link = self.soup.find("link", {"rel": "canonical"})
-        return (
-                canonical_link
-                and canonical_link.get("href")
-                and domain in canonical_link.get("href")
-        )
+        canonical_link = self.signals.canonical_url
+        return canonical_link and domain in canonical_link
 
     def readable(self):
-        doc = Document(str(self.soup))
+        # readability is slow to import and only needed here
+        from readability import Document
+        doc = Document(self.html)
         return BeautifulSoup(doc.summary()).text
 
     def domain_in_meta_og_url(self, domain):
-        meta_og_url = self.soup.find("meta",
-                                     property="og:url") or self.soup.select_one(
-            'meta[name="og:url"]')
-        return (meta_og_url
-                and meta_og_url.get("content")
-                and domain in meta_og_url.get("content")
-                )
+        meta_og_url = self.signals.meta('og:url')
+        return meta_og_url and domain in meta_og_url
 
     def substr_in_citation_journal_title(self, substr):
-        if tag := self.soup.select_one('meta[name="citation_journal_title"]'):
-            content = tag.get('content')
+        if content := self.signals.meta('citation_journal_title', ('name',)):
             return substr.lower() in content.lower()
         return False
 
     def substr_in_citation_publisher(self, substr):
-        if tag := self.soup.select_one('meta[name="citation_publisher"]'):
-            content = tag.get('content')
+        if content := self.signals.meta('citation_publisher', ('name',)):
             return substr.lower() in content.lower()
         return False
 
     def text_in_meta_og_site_name(self, txt):
-        meta_og_site_name = self.soup.find('meta',
-                                           property='og:site_name') or self.soup.select_one(
-            'meta[name="og:site_name"]')
-        return (meta_og_site_name
-                and meta_og_site_name.get("content")
-                and txt in meta_og_site_name.get("content")
-                )
+        meta_og_site_name = self.signals.meta('og:site_name')
+        return meta_og_site_name and txt in meta_og_site_name
 
     def parse_author_meta_tags(self, corresponding_tag=None,
                                corresponding_class=None):
         results = []
-        metas = self.soup.findAll("meta")
 
         corresponding_text = None
         if corresponding_tag and corresponding_class:
@@ -99,13 +173,13 @@ class PublisherParser(Parser, ABC):
         author_meta_keys = {'citation_author', 'dc.Creator'}
 
         result = None
-        for meta in metas:
-            if 'name' in meta.attrs and meta['name'] in author_meta_keys or 'property' in meta.attrs and meta['property'] in author_meta_keys:
+        for meta in self.signals.metas:
+            if meta.name in author_meta_keys or meta.property in author_meta_keys:
                 if result:
                     # reset for next author
                     results.append(result)
                     result = None
-                if not (name := meta.get('content')):
+                if not (name := meta.content):
                     continue
                 if corresponding_text and name.lower() in corresponding_text:
                     is_corresponding = True
@@ -118,10 +192,9 @@ class PublisherParser(Parser, ABC):
                     "affiliations": [],
                     "is_corresponding": is_corresponding,
                 }
-            if meta.get("name", None) and meta[
-                "name"] == "citation_author_institution":
-                if meta.get("content") and meta["content"].strip():
-                    result["affiliations"].append(meta["content"].strip())
+            if meta.name == "citation_author_institution":
+                if meta.content and meta.content.strip():
+                    result["affiliations"].append(meta.content.strip())
 
         # append name from last loop
         if result:
@@ -140,12 +213,10 @@ class PublisherParser(Parser, ABC):
 
         for meta_tag_name in meta_tag_names:
             for meta_property_name in meta_property_names:
-                if meta_tag := self.soup.find(
-                        "meta", {
-                            meta_property_name: re.compile(f"^{meta_tag_name}$",
-                                                           re.I)}
-                ):
-                    if description := meta_tag.get("content", '').strip():
+                content = self.signals.meta_ignore_case(meta_tag_name,
+                                                        meta_property_name)
+                if content is not None:
+                    if description := content.strip():
                         if (
                                 len(description) > 200
                                 and not description.endswith("...")
@@ -166,6 +237,11 @@ class PublisherParser(Parser, ABC):
 
     @staticmethod
     def merge_authors_affiliations(authors, affiliations):
+        organizations_by_id = {}
+        for aff in affiliations:
+            organizations_by_id.setdefault(aff.aff_id, []).append(
+                str(aff.organization))
+
         results = []
         for author in authors:
             author_affiliations = []
@@ -175,16 +251,15 @@ class PublisherParser(Parser, ABC):
 
             # scenario 1 affiliations with ids
             for aff_id in author.aff_ids:
-                for aff in affiliations:
-                    if aff_id == aff.aff_id:
-                        author_affiliations.append(str(aff.organization))
+                author_affiliations.extend(organizations_by_id.get(aff_id, ()))
 
-            # scenario 2 affiliations with no ids (applied to all authors)
-            for aff in affiliations:
-                if (len(author.aff_ids) == 0 and aff.aff_id is None) or (
-                        len(affiliations) == 1 and len(
-                    author_affiliations) == 0):
-                    author_affiliations.append(str(aff.organization))
+            # scenario 2 affiliations with no ids (applied to all authors),
+            # or the page's only affiliation for authors with no match
+            if len(affiliations) == 1:
+                if not author_affiliations:
+                    author_affiliations.append(str(affiliations[0].organization))
+            elif len(author.aff_ids) == 0:
+                author_affiliations.extend(organizations_by_id.get(None, ()))
 
             results.append(
                 AuthorAffiliations(
@@ -209,19 +284,32 @@ class PublisherParser(Parser, ABC):
         return aff_ids
 
     def fallback_mark_corresponding_authors(self, authors):
-        def func(tag):
-            for attr, value in tag.attrs.items():
-                if ('author' in str(value).lower() and
-                        tag.select_one('a[href*=mailto]')):
-                    return True
-            return False
+        if not authors:
+            return authors
+
+        # ids of every tag with a mailto link somewhere inside it
+        contains_mailto = set()
+        for link in self.soup.select('a[href*=mailto]'):
+            for parent in link.parents:
+                if id(parent) in contains_mailto:
+                    break
+                contains_mailto.add(id(parent))
 
-        tags = self.soup.find_all(func)
+        tags = [tag for tag in self.soup.find_all(True)
+                if id(tag) in contains_mailto and any(
+                'author' in str(value).lower() for value in tag.attrs.values())]
 
         # Return only smallest tags, we don't want any tags with class*= authors that may contain multiple author names
         final_tags = remove_parents(tags)
 
-        for tag in final_tags:
+        # A tag's markup includes the markup of every tag inside it, so
+        # matching names against the outermost final tags marks the same
+        # authors while serializing each part of the page at most once.
+        final_ids = {id(tag) for tag in final_tags}
+        outermost_tags = [tag for tag in final_tags if not any(
+            id(parent) in final_ids for parent in tag.parents)]
+
+        for tag in outermost_tags:
             tag_str = str(tag)
             for author in authors:
                 if author['name'] in tag_str:
@@ -238,24 +326,35 @@ class PublisherParser(Parser, ABC):
                              'food funct', 'rsc publication', 'accessShare', 'ShareShare'
                              'linkShare', 'EmailFacebookTwitterLinkedInRedditWechat'}
         startswith_blacklist = {'download'}
-        for tag in self.soup.find_all():
-            for attr, value in tag.attrs.items():
-                if 'abstract' in str(value).lower() or (
-                        tag.text.lower() == 'abstract' and is_h_tag(tag)):
-                    for desc in tag.descendants:
-                        abs_txt = strip_seq('\s',
-                                            strip_prefix('abstract', desc.text,
-                                                         flags=re.IGNORECASE))
-                        if len(desc.text) > 100 and desc.name in {'p', 'div',
-                                                                  'span',
-                                                                  'section',
-                                                                  'article'} \
-                                and not any(
-                            [abs_txt.lower().startswith(word) for word in
-                             startswith_blacklist]) \
-                                and not any([word in abs_txt.lower() for word in
-                                             blacklisted_words]):
-                            return abs_txt
+
+        # Tags come in document order, so the first candidate inside any
+        # abstract-looking tag is the one a scan of each such tag's
+        # descendants, in turn, would reach first.
+        inside_abstract_tag = {}
+        for tag in self.soup.find_all(True):
+            inside = inside_abstract_tag.get(id(tag.parent), False)
+            inside_abstract_tag[id(tag)] = inside or self._is_abstract_tag(tag)
+            if not inside or tag.name not in {'p', 'div', 'span', 'section',
+                                              'article'}:
+                continue
+            text = tag.text
+            if len(text) <= 100:
+                continue
+            abs_txt = strip_seq('\s', strip_prefix('abstract', text,
+                                                    flags=re.IGNORECASE))
+            if not any([abs_txt.lower().startswith(word) for word in
+                        startswith_blacklist]) \
+                    and not any([word in abs_txt.lower() for word in
+                                 blacklisted_words]):
+                return abs_txt
         return None
 
+    @staticmethod
+    def _is_abstract_tag(tag):
+        if not tag.attrs:
+            return False
+        return any('abstract' in str(value).lower() for value in
+                   tag.attrs.values()) or (
+                is_h_tag(tag) and tag.text.lower() == 'abstract')
+
     test_cases = []
@@ -4,6 +4,8 @@ from publisher.parsers.utils import names_match
 
 class PermagonPress(PublisherParser):
     parser_name = "permagon_press"
+    canonical_domains = ('iwaponline.com',)
+    citation_publishers = ('iwa publishing',)
 
     def is_publisher_specific_parser(self):
         if publisher_meta := self.soup.select_one('meta[name=citation_publisher]'):
@@ -4,9 +4,7 @@ from publisher.parsers.parser import PublisherParser
 
 class PLOS(PublisherParser):
     parser_name = "plos"
-
-    def is_publisher_specific_parser(self):
-        return self.domain_in_meta_og_url("plos.org")
+    og_url_domains = ("plos.org",)
 
     def authors_found(self):
         return self.soup.find("div", class_="title-authors")
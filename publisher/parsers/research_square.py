@@ -4,9 +4,7 @@ from publisher.parsers.parser import PublisherParser
 
 class ResearchSquare(PublisherParser):
     parser_name = "research square"
-
-    def is_publisher_specific_parser(self):
-        return self.domain_in_meta_og_url("researchsquare.com")
+    og_url_domains = ('researchsquare.com',)
 
     def authors_found(self):
         return bool(self.soup.select('div.authors-expanded div.author'))
@@ -3,9 +3,7 @@ from publisher.parsers.parser import PublisherParser
 
 class RoyalSociety(PublisherParser):
     parser_name = "royal_society_publishing"
-
-    def is_publisher_specific_parser(self):
-        return self.domain_in_meta_og_url('royalsocietypublishing.org')
+    og_url_domains = ('royalsocietypublishing.org',)
 
     def authors_found(self):
         return bool(self.soup.select('[title="list of authors"] > div'))
@@ -6,9 +6,7 @@ from publisher.parsers.utils import is_h_tag
 
 class RSC(PublisherParser):
     parser_name = "rsc"
-
-    def is_publisher_specific_parser(self):
-        return self.domain_in_meta_og_url("pubs.rsc.org")
+    og_url_domains = ('pubs.rsc.org',)
 
     def authors_found(self):
         return bool(self.soup.select('.article__author-link'))
@@ -5,9 +5,7 @@ from publisher.parsers.parser import PublisherParser
 
 class Radiology(PublisherParser):
     parser_name = "rsna"
-
-    def is_publisher_specific_parser(self):
-        return self.domain_in_meta_og_url('rsna.org')
+    og_url_domains = ('rsna.org',)
 
     def authors_found(self):
         return bool(self.parse_abstract_meta_tags())
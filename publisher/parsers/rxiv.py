@@ -4,11 +4,7 @@ from publisher.parsers.parser import PublisherParser
 
 class RXIV(PublisherParser):
     parser_name = "RXIV (Cold Spring Harbor Laboratory)"
-
-    def is_publisher_specific_parser(self):
-        return self.domain_in_meta_og_url("medrxiv.org") or self.domain_in_meta_og_url(
-            "biorxiv.org"
-        )
+    og_url_domains = ("medrxiv.org", "biorxiv.org")
 
     def authors_found(self):
         return self.soup.find("div", class_="author-tooltip-0") or self.soup.find(
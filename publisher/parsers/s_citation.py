@@ -3,9 +3,7 @@ from publisher.parsers.parser import PublisherParser
 
 class SCitation(PublisherParser):
     parser_name = "s_citation"
-
-    def is_publisher_specific_parser(self):
-        return self.domain_in_meta_og_url("scitation.org")
+    og_url_domains = ('scitation.org',)
 
     def authors_found(self):
         return bool(self.soup.select('span.contrib-author'))
@@ -6,9 +6,7 @@ from publisher.parsers.utils import is_h_tag, remove_parents
 
 class Sage(PublisherParser):
     parser_name = "Sage"
-
-    def is_publisher_specific_parser(self):
-        return self.domain_in_meta_og_url("journals.sagepub.com")
+    og_url_domains = ('journals.sagepub.com',)
 
     def authors_found(self):
         return any([self.soup.find("div", class_="authors"),
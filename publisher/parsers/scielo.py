@@ -7,9 +7,7 @@ import unidecode
 
 class SciELO(PublisherParser):
     parser_name = "scielo"
-
-    def is_publisher_specific_parser(self):
-        return self.domain_in_meta_og_url('www.scielo.br')
+    og_url_domains = ('www.scielo.br',)
 
     def authors_found(self):
         return bool(self.soup.select('div.contribGroup span.dropdown'))
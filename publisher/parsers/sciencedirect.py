@@ -6,9 +6,7 @@ from publisher.parsers.parser import PublisherParser
 
 class ScienceDirect(PublisherParser):
     parser_name = "sciencedirect"
-
-    def is_publisher_specific_parser(self):
-        return self.domain_in_canonical_link("sciencedirect.com")
+    canonical_domains = ('sciencedirect.com',)
 
     def authors_found(self):
         return self.soup.find_all("a", class_="author") or self.soup.select(
@@ -209,8 +207,7 @@ class ScienceDirect(PublisherParser):
 
     def extract_json(self):
         """Finds and loads json that contains affiliation data."""
-        raw_json = self.soup.find("script", type="application/json").text
-        loaded_json = json.loads(raw_json)
+        loaded_json = self.application_json()
         if isinstance(loaded_json, str):
             loaded_json = json.loads(loaded_json)
         return loaded_json
@@ -1,4 +1,3 @@
-import json
 import re
 from collections import defaultdict
 from unicodedata import normalize
@@ -9,6 +8,8 @@ from publisher.parsers.parser import PublisherParser
 
 class Springer(PublisherParser):
     parser_name = "springer"
+    canonical_domains = ("link.springer.com", "springeropen.com")
+    og_url_domains = ("nature.com", "biomedcentral.com")
 
     def is_publisher_specific_parser(self):
         if (
@@ -157,9 +158,7 @@ class Springer(PublisherParser):
 
     def parse_article_metadatas(self):
         metadatas = []
-        for ld_json in self.soup.find_all("script",
-                                          {"type": "application/ld+json"}):
-            article_metadata = json.loads(ld_json.text)
+        for article_metadata in self.ld_json():
             if 'mainEntity' in article_metadata:
                 article_metadata = article_metadata['mainEntity']
             metadatas.append(article_metadata)
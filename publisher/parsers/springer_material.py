@@ -29,7 +29,7 @@ class SpringerMaterial(PublisherParser):
     def get_authors(self):
         authors = []
         section = self.soup.find("dd", {"id": "authors"})
-        if not section and "Unusual traffic from your account" in str(self.soup):
+        if not section and "Unusual traffic from your account" in self.html:
             raise UnusualTrafficError(
                 f"Unable to parse due to page returning error: Unusual traffic from your account"
             )
@@ -6,9 +6,7 @@ from publisher.parsers.parser import PublisherParser
 
 class Taylor(PublisherParser):
     parser_name = "taylor"
-
-    def is_publisher_specific_parser(self):
-        return self.domain_in_meta_og_url("tandfonline.com")
+    og_url_domains = ("tandfonline.com",)
 
     def authors_found(self):
         return self.soup.find("div", class_="publicationContentAuthors")
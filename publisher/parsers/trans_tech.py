@@ -4,6 +4,7 @@ from publisher.parsers.utils import is_h_tag, remove_parents
 
 class TransTechPub(PublisherParser):
     parser_name = "trans_tech_publications"
+    citation_publishers = ('Trans Tech',)
 
     def is_publisher_specific_parser(self):
         if meta := self.soup.select_one('meta[name=citation_publisher]'):
@@ -6,12 +6,10 @@ from publisher.parsers.utils import strip_prefix
 
 class UniversityOfCalifornia(PublisherParser):
     parser_name = 'university_of_california_press'
+    og_site_names = ('University of California Press',)
 
     AFF_PATTERN = re.compile(r'at ([a-zA-Z\d, .]+)')
 
-    def is_publisher_specific_parser(self):
-        return self.text_in_meta_og_site_name('University of California Press')
-
     def authors_found(self):
         return bool(self.soup.select('.al-author-name'))
 
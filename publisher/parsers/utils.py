@@ -1,17 +1,21 @@
 import re
 import unicodedata
+
+from bs4 import Tag
 from nameparser import HumanName
 
+from util.patterns import cached_regex
+
 EMAIL_RE = re.compile(r'\b[A-Z0-9._%+-]+@[A-Z0-9.-]+\.[A-Z]{2,}\b',
                       flags=re.IGNORECASE)
 
 
 def strip_prefix(prefix, string, flags=0):
-    return re.sub(f'^{prefix}', '', string, flags=flags)
+    return cached_regex(f'^{prefix}', flags).sub('', string)
 
 
 def strip_suffix(suffix, string, flags=0):
-    return re.sub(f'{suffix}$', '', string, flags=flags)
+    return cached_regex(f'{suffix}$', flags).sub('', string)
 
 
 def strip_seq(seq, string, flags=0):
@@ -47,18 +51,31 @@ def is_h_tag(tag):
 
 
 def remove_parents(tags):
-    final_tags = []
-    for tag1 in tags:
-        is_parent = False
-        for tag2 in tags:
-            if tag1 == tag2:
-                continue
-            tag1_children = list(tag1.children)
-            if tag2 in tag1_children:
-                is_parent = True
-        if not is_parent:
-            final_tags.append(tag1)
-    return final_tags
+    """Drop the tags with a direct child equal to another tag in tags.
+
+    Tags compare structurally, as bs4 does, so the child only has to look
+    like one of the tags. Each element's structure is numbered once, so
+    this is linear in the size of the tags rather than quadratic.
+    """
+    shapes = {}
+    shape_of = {}
+
+    def shape(element):
+        if id(element) not in shape_of:
+            if isinstance(element, Tag):
+                structure = (element.name, tuple(sorted(
+                    (name, tuple(value) if isinstance(value, list) else value)
+                    for name, value in element.attrs.items())),
+                    tuple(shape(child) for child in element.children))
+            else:
+                structure = str(element)
+            shape_of[id(element)] = shapes.setdefault(structure, len(shapes))
+        return shape_of[id(element)]
+
+    tag_shapes = {shape(tag) for tag in tags}
+    return [tag for tag in tags
+            if not any(isinstance(child, Tag) and shape(child) in tag_shapes
+                       for child in tag.children)]
 
 
 def split_name(name):
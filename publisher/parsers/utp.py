@@ -5,9 +5,7 @@ from publisher.parsers.parser import PublisherParser
 
 class UniversityOfTorontoPress(PublisherParser):
     parser_name = "university_of_toronto_press"
-
-    def is_publisher_specific_parser(self):
-        return self.domain_in_meta_og_url('utpjournals.press')
+    og_url_domains = ('utpjournals.press',)
 
     def authors_found(self):
         return bool(self.soup.select('.contribDegrees'))
@@ -8,9 +8,8 @@ from publisher.parsers.utils import is_h_tag, strip_prefix, strip_suffix
 
 class Wiley(PublisherParser):
     parser_name = "wiley"
-
-    def is_publisher_specific_parser(self):
-        return self.domain_in_meta_og_url("onlinelibrary.wiley.com") or self.text_in_meta_og_site_name('Wiley Online Library')
+    og_url_domains = ('onlinelibrary.wiley.com',)
+    og_site_names = ('Wiley Online Library',)
 
     def authors_found(self):
         return self.soup.find("div", class_="loa-authors")
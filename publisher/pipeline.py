@@ -0,0 +1,99 @@
+import contextlib
+import io
+import os
+from urllib.parse import urlencode, urljoin
+
+from exceptions import APIError, BadLandingPageError
+from publisher.controller import PublisherController
+from publisher.utils import prep_message, check_bad_landing_page, \
+    check_landing_page_bytes, find_orcids
+
+# A small page every parser can be tried on, for warm_up
+WARM_UP_DOI = '10.0000/warm-up'
+WARM_UP_PAGE = b"""<html><head><title>Warm up</title>
+<meta name="citation_title" content="Warm up">
+<meta name="citation_author" content="Ada Lovelace">
+<meta name="citation_author_institution" content="University of London">
+<meta name="citation_author_email" content="ada@example.org">
+<meta name="description" content="A page for warming up the parsers.">
+</head><body><h1>Warm up</h1><div class="authors"><span>Ada Lovelace</span>
+</div><section class="abstract"><h2>Abstract</h2><p>A page for warming up
+the parsers.</p></section></body></html>"""
+
+
+def grobid_parse_url(doi):
+    return 'https://parseland.herokuapp.com/grobid-parse?doi=' + doi
+
+
+def pdf_parser_url(doi):
+    """URL of the PDF parser that handles landing pages stored as PDFs."""
+    params = {
+        'doi': doi,
+        'api_key': os.getenv("OPENALEX_PDF_PARSER_API_KEY"),
+        'include_raw': 'false'
+    }
+    qs = urlencode(params)
+    path = urljoin(os.getenv('OPENALEX_PDF_PARSER_URL'), 'parse')
+    return f'{path}?{qs}'
+
+
+def parse_publisher_page(doi, lp_contents, fields=None):
+    """Parse an HTML landing page into the /parse-publisher response.
+
+    Raises BadLandingPageError or ParserNotFoundError when the page can't be
+    parsed. fields limits the message to some of PUBLISHER_FIELDS. Module
+    level so it can run in a worker process.
+    """
+    check_landing_page_bytes(lp_contents)
+
+    pc = PublisherController(lp_contents.decode(), doi)
+
+    if check_bad_landing_page(pc.signals):
+        raise BadLandingPageError()
+
+    if fields is not None and fields <= {'orcids'}:
+        # ORCIDs come from the page text, no parser needed
+        parser_name = None
+        message = {'all_orcids': find_orcids(pc.html)}
+    else:
+        parser, parsed_msg = pc.best_parser_msg()
+        parser_name = parser.parser_name
+        message = prep_message(parsed_msg, parser, pc.html, fields)
+
+    return {
+        "message": message,
+        "metadata": {
+            "parser": parser_name,
+            "grobid_parse_url": grobid_parse_url(doi),
+            "doi": doi,
+            "doi_url": f"https://doi.org/{doi}",
+        },
+    }
+
+
+def warm_up():
+    """Load the parsers and try every one of them on a small page.
+
+    This imports the parser modules, builds the dispatch index and fills
+    the regex and selector caches. gunicorn.conf.py runs it in the master
+    before forking, so the workers share all of it.
+    """
+    with contextlib.redirect_stdout(io.StringIO()), \
+            contextlib.redirect_stderr(io.StringIO()):
+        try:
+            parse_publisher_page(WARM_UP_DOI, WARM_UP_PAGE)
+        except APIError:
+            pass
+
+
+def error_result(doi, err):
+    """Inline result for a DOI that failed, in the batch output shape."""
+    if isinstance(err, APIError):
+        return {
+            "doi": doi,
+            "status": err.code,
+            "error": err.description,
+            "message": err.args[0] if len(err.args) > 0 else "",
+        }
+    return {"doi": doi, "status": 500, "error": "Internal error.",
+            "message": str(err)}
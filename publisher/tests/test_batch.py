@@ -0,0 +1,39 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from publisher import batch
+
+
+def test_fetched_pages_are_bounded(monkeypatch):
+    lock = threading.Lock()
+    held = 0
+    most_held = 0
+
+    def fetch(doi, s3):
+        nonlocal held, most_held
+        with lock:
+            held += 1
+            most_held = max(most_held, held)
+        return b'<html></html>'
+
+    def slow_parse(doi, lp_contents):
+        nonlocal held
+        time.sleep(0.01)
+        with lock:
+            held -= 1
+        return {'message': doi}
+
+    parse_pool = ThreadPoolExecutor(max_workers=2)
+    monkeypatch.setattr(batch, 'MAX_IN_FLIGHT', 4)
+    monkeypatch.setattr(batch, 'get_landing_page', fetch)
+    monkeypatch.setattr(batch, 'parse_publisher_page', slow_parse)
+    monkeypatch.setattr(batch, 'parse_pool', lambda: parse_pool)
+    monkeypatch.setattr(batch, 'fetch_s3', lambda: None)
+
+    dois = [f'10.1234/{i}' for i in range(50)]
+    results = list(batch.iter_batch_results(dois))
+    parse_pool.shutdown()
+
+    assert sorted(result['message'] for result in results) == sorted(dois)
+    assert most_held <= 4
@@ -0,0 +1,135 @@
+import threading
+import time
+
+import pytest
+import redis
+
+from benchmarks.standins import RedisServer
+from exceptions import BadLandingPageError, ParserNotFoundError, \
+    S3FileNotFoundError
+from publisher import cache
+from util.memory_cache import MemoryCache
+
+DOI = '10.1234/coalesce'
+RESPONSE = {'message': {'authors': []}}
+
+
+@pytest.fixture
+def stand_in(monkeypatch):
+    server = RedisServer(('127.0.0.1', 0))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    conn = redis.Redis(port=server.server_address[1])
+    monkeypatch.setattr(cache, 'redis_conn', lambda: conn)
+    monkeypatch.setattr(cache, 'MEMORY', MemoryCache('responses', 2 ** 20, ttl=60))
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+class SlowParse:
+    def __init__(self, result=RESPONSE, error=None):
+        self.result = result
+        self.error = error
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        time.sleep(0.2)
+        if self.error:
+            raise self.error
+        return self.result
+
+
+def run_concurrently(target, n=8):
+    results = []
+
+    def run():
+        try:
+            results.append(target())
+        except Exception as e:
+            results.append(e)
+
+    threads = [threading.Thread(target=run) for _ in range(n)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def test_concurrent_misses_parse_once(stand_in):
+    parse = SlowParse()
+    results = run_concurrently(
+        lambda: cache.coalesced(DOI, 'etag', parse))
+    assert parse.calls == 1
+    assert results == [RESPONSE] * 8
+    assert cache.get(DOI, 'etag') == RESPONSE
+    assert cache.redis_conn().get(f'lock:{cache.cache_key(DOI)}') is None
+
+
+def test_leader_error_is_shared(stand_in):
+    parse = SlowParse(error=BadLandingPageError())
+    results = run_concurrently(
+        lambda: cache.coalesced(DOI, 'etag', parse))
+    assert parse.calls == 1
+    assert all(isinstance(result, BadLandingPageError) for result in results)
+    with pytest.raises(BadLandingPageError):
+        cache.get(DOI, 'etag')
+
+
+def test_waits_for_other_worker(stand_in):
+    lock = f'lock:{cache.cache_key(DOI)}'
+    cache.redis_conn().set(lock, 1)
+
+    def other_worker():
+        time.sleep(0.2)
+        cache.set(DOI, 'etag', RESPONSE)
+        cache.redis_conn().delete(lock)
+
+    threading.Thread(target=other_worker).start()
+    parse = SlowParse()
+    assert cache.coalesced(DOI, 'etag', parse) == RESPONSE
+    assert parse.calls == 0
+
+
+def test_parses_itself_when_other_worker_is_too_slow(stand_in, monkeypatch):
+    monkeypatch.setattr(cache, 'COALESCE_WAIT', 0.2)
+    cache.redis_conn().set(f'lock:{cache.cache_key(DOI)}', 1)
+    parse = SlowParse()
+    assert cache.coalesced(DOI, 'etag', parse) == RESPONSE
+    assert parse.calls == 1
+
+
+def test_missing_page_is_remembered(stand_in, monkeypatch):
+    heads = []
+
+    def missing(doi):
+        heads.append(doi)
+        raise S3FileNotFoundError()
+
+    monkeypatch.setattr(cache, 'landing_page_validator', missing)
+    for _ in range(3):
+        with pytest.raises(S3FileNotFoundError):
+            cache.lookup(DOI)
+    assert heads == [DOI]
+
+
+def test_error_is_forgotten_when_page_changes(stand_in):
+    with pytest.raises(ParserNotFoundError):
+        cache.coalesced(DOI, 'etag', SlowParse(
+            error=ParserNotFoundError(f'Parser not found for {DOI}')))
+    with pytest.raises(ParserNotFoundError, match=DOI):
+        cache.get(DOI, 'etag')
+    assert cache.get(DOI, 'new-etag') is None
+
+
+def test_expired_lock_is_not_released(stand_in):
+    lock = f'lock:{cache.cache_key(DOI)}'
+
+    def slow_parse():
+        # the lock expired and another worker took it
+        cache.redis_conn().set(lock, 'other-worker')
+        return RESPONSE
+
+    assert cache.coalesced(DOI, 'etag', slow_parse) == RESPONSE
+    assert cache.redis_conn().get(lock) == b'other-worker'
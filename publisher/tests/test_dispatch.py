@@ -0,0 +1,20 @@
+from bs4 import BeautifulSoup
+
+from publisher.controller import dispatch_index
+from publisher.parsers import publisher_parsers
+from publisher.parsers.aaas import AAAS
+from publisher.parsers.ams import AmericanMathematicalSociety
+from publisher.parsers.thieme import Thieme
+from util.page_signals import PageSignals
+
+PAGE = """<html><head><title>A paper</title>
+<link rel="canonical" href="https://www.science.org/doi/10.1126/x">
+</head></html>"""
+
+
+def test_custom_checks_are_always_candidates():
+    signals = PageSignals.from_soup(BeautifulSoup(PAGE, 'lxml'))
+    candidates = dispatch_index().candidates(signals)
+    assert {AAAS, AmericanMathematicalSociety, Thieme} <= set(candidates)
+    order = publisher_parsers()
+    assert candidates == sorted(candidates, key=order.index)
@@ -0,0 +1,45 @@
+import random
+
+from bs4 import BeautifulSoup
+
+from publisher.parsers.utils import remove_parents
+
+
+def quadratic_remove_parents(tags):
+    """remove_parents as it was first written."""
+    final_tags = []
+    for tag1 in tags:
+        is_parent = False
+        for tag2 in tags:
+            if tag1 == tag2:
+                continue
+            if tag2 in list(tag1.children):
+                is_parent = True
+        if not is_parent:
+            final_tags.append(tag1)
+    return final_tags
+
+
+def random_block(rng, depth=0):
+    if depth > 2 or rng.random() < 0.3:
+        return rng.choice(['<span>a</span>', '<span class="x">a</span>',
+                           'text', '<p>b</p>'])
+    children = ''.join(random_block(rng, depth + 1)
+                       for _ in range(rng.randint(1, 3)))
+    return f'<div class="{rng.choice(["a", "b"])}">{children}</div>'
+
+
+def test_matches_structural_comparison():
+    rng = random.Random(0)
+    for _ in range(300):
+        block = random_block(rng)
+        # identical blocks in different subtrees
+        html = ''.join(f'<section>{block}{random_block(rng)}</section>'
+                       for _ in range(rng.randint(1, 3)))
+        soup = BeautifulSoup(html, 'lxml')
+        # a subset, so a tag's own child may be missing but a lookalike not
+        tags = [tag for tag in soup.find_all(['div', 'span', 'p'])
+                if rng.random() < 0.6]
+        assert remove_parents(tags) == quadratic_remove_parents(tags)
+        assert [id(tag) for tag in remove_parents(tags)] == \
+               [id(tag) for tag in quadratic_remove_parents(tags)]
@@ -0,0 +1,18 @@
+from publisher.pipeline import parse_publisher_page
+
+DOI = '10.1234/orcids'
+PAGE = b"""<html><head><title>A paper</title>
+<meta name="citation_author" content="Ada Lovelace">
+<meta name="citation_author_institution" content="University of London">
+<script>var orcid = "0000-0002-1825-0097";</script>
+</head><body><p>An article.</p></body></html>"""
+
+
+def test_orcids_in_scripts_are_found():
+    response = parse_publisher_page(DOI, PAGE)
+    assert response['message']['all_orcids'] == ['0000-0002-1825-0097']
+
+
+def test_orcids_only_request_reads_scripts():
+    response = parse_publisher_page(DOI, PAGE, frozenset({'orcids'}))
+    assert response['message'] == {'all_orcids': ['0000-0002-1825-0097']}
@@ -3,7 +3,7 @@ import requests_cache
 
 from views import app
 
-from publisher.parsers.parser import PublisherParser
+from publisher.parsers import publisher_parsers
 
 
 @pytest.fixture
@@ -32,8 +32,14 @@ def test_no_authors_found(client):
     )
 
 
+def test_batch_requires_dois(client):
+    rv = client.post("/parse-publisher/batch", json={})
+    assert rv.status_code == 400
+    assert rv.get_json()["error"] == "Invalid request."
+
+
 test_cases = []
-parsers = PublisherParser.__subclasses__()
+parsers = publisher_parsers()
 for parser in parsers:
     test_cases.extend(parser.test_cases)
 
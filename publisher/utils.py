@@ -1,9 +1,25 @@
 import re
 from dataclasses import asdict, is_dataclass
 
+from exceptions import BadLandingPageError, UnusualTrafficError, \
+    WrongFormatLandingPageError
 from publisher.parsers.utils import EMAIL_RE, strip_prefix
+from util import landing_page
+from util.metrics import timed_function
 import ftfy
 
+ORCID_RE = re.compile(r'\d{4}-\d{4}-\d{4}-[\dX]{4}')
+MULTIPLE_SPACES_RE = re.compile(r' +')
+# ASCII text that ftfy.fix_text returns unchanged: no HTML entities, no \r
+# and no control characters other than tabs and newlines.
+PLAIN_ASCII_RE = re.compile(r'[\t\n\x20-\x25\x27-\x7e]*')
+
+# fields= values for /parse-publisher, and the author key each author field
+# maps to. Authors always come with their names.
+AUTHOR_FIELDS = {'authors': 'name', 'affiliations': 'affiliations',
+                 'corresponding': 'is_corresponding'}
+PUBLISHER_FIELDS = (*AUTHOR_FIELDS, 'abstract', 'orcids')
+
 
 def has_corresponding(message):
     authors = message['authors']
@@ -16,19 +32,49 @@ def has_affiliations(message):
     return bool([author for author in authors if author['affiliations']])
 
 
-def strip_message_strs(message):
+def fix_text(text):
+    text = text.strip('\r\n ;')
+    if PLAIN_ASCII_RE.fullmatch(text):
+        return text
+    return ftfy.fix_text(text)
+
+
+def strip_message_strs(message, fixed):
+    """Strip and fix every string in message, in place.
+
+    fixed maps strings already seen to their fixed form; affiliations and
+    names repeat a lot across authors.
+    """
     if isinstance(message, list):
         for i in range(len(message)):
-            message[i] = strip_message_strs(message[i])
+            message[i] = strip_message_strs(message[i], fixed)
     if isinstance(message, dict):
         for k in message.keys():
-            message[k] = strip_message_strs(message[k])
+            message[k] = strip_message_strs(message[k], fixed)
     if isinstance(message, str):
-        return ftfy.fix_text(message.strip('\r\n ;'))
+        if message not in fixed:
+            fixed[message] = fix_text(message)
+        return fixed[message]
     return message
 
 
-def prep_message(message, parser):
+def wanted(field, fields):
+    return fields is None or field in fields
+
+
+def find_orcids(html):
+    return list(set(ORCID_RE.findall(html)))
+
+
+@timed_function('prep_message')
+def prep_message(message, parser, html, fields=None):
+    """Clean up a parser's output for the response.
+
+    html is the landing page as stored, before util.html_prune emptied its
+    scripts; ORCIDs are found in it directly rather than in the soup. If fields is
+    given, only the fallbacks and clean-up those fields need are run, and
+    only those fields are returned.
+    """
     if isinstance(message, list):
         message = {'authors': message, 'abstract': None}
 
@@ -38,11 +84,11 @@ def prep_message(message, parser):
     if not message['authors']:
         message = parser.no_authors_output()
 
-    if not has_corresponding(message):
+    if wanted('corresponding', fields) and not has_corresponding(message):
         message['authors'] = parser.fallback_mark_corresponding_authors(
             message['authors'])
 
-    if not message['abstract']:
+    if wanted('abstract', fields) and not message['abstract']:
         message['abstract'] = parser.fallback_parse_abstract()
 
     if 'abstract' in message and message['abstract']:
@@ -50,14 +96,50 @@ def prep_message(message, parser):
 
     # message['readable'] = parser.readable()
 
-    message = alter_is_corresponding(message)
-    message = sanitize_affiliations(message)
-    message = sanitize_names(message)
-    message = strip_message_strs(message)
-    message['all_orcids'] = list(set(re.findall(r'\d{4}-\d{4}-\d{4}-[\dX]{4}', str(parser.soup))))
+    if wanted('corresponding', fields):
+        message = alter_is_corresponding(message)
+    if fields is not None:
+        message = project_message(message, fields)
+    normalize_message(message)
+    if wanted('orcids', fields):
+        message['all_orcids'] = find_orcids(html)
     return message
 
 
+def project_message(message, fields):
+    """The parts of message that fields ask for."""
+    projected = {}
+    if author_keys := {key for field, key in AUTHOR_FIELDS.items() if
+                       field in fields}:
+        author_keys.add('name')
+        projected['authors'] = [
+            {key: value for key, value in author.items() if key in author_keys}
+            for author in message['authors']]
+    if 'abstract' in fields:
+        projected['abstract'] = message['abstract']
+    return projected
+
+
+def compact_response(response):
+    """response with every affiliation string listed once.
+
+    message['affiliations'] holds the distinct affiliations in order of
+    first appearance, and each author's affiliations become indexes into
+    it. response itself is left unchanged, since it may be cached.
+    """
+    message = response['message']
+    if 'authors' not in message:
+        return response
+    index = {}
+    authors = [{**author, 'affiliations': [
+        index.setdefault(aff, len(index)) for aff in author['affiliations']]}
+        if 'affiliations' in author else author
+        for author in message['authors']]
+    return {**response,
+            'message': {**message, 'authors': authors,
+                        'affiliations': list(index)}}
+
+
 def alter_is_corresponding(message):
     """If all is_corresponding are False, change them to None."""
     authors = message['authors']
@@ -84,27 +166,34 @@ def alter_is_corresponding(message):
     return message
 
 
-def sanitize_affiliations(message):
-    authors = message['authors']
-
-    for author in authors:
-        author['affiliations'] = [item.split(';') for item in
-                                  author['affiliations']]
-        author['affiliations'] = [strip_prefix(' *and', item).strip() for
-                                  sublist in author['affiliations'] for item in
-                                  sublist]
-        author['affiliations'] = [aff for aff in author['affiliations'] if
-                                  aff and
-                                  'correspond' not in aff.lower() and not EMAIL_RE.search(
-                                      aff) and not aff.startswith('http')]
-        author['affiliations'] = list(set(author['affiliations']))
-
-    if 'authors' in message:
-        message['authors'] = authors
-    else:
-        message = authors
-
-    return message
+def split_affiliation(affiliation):
+    """The affiliations in one parsed affiliation string, minus emails,
+    links and correspondence notes."""
+    parts = [strip_prefix(' *and', item).strip() for item in
+             affiliation.split(';')]
+    return [aff for aff in parts if
+            aff and 'correspond' not in aff.lower() and not EMAIL_RE.search(
+                aff) and not aff.startswith('http')]
+
+
+def normalize_message(message):
+    """Split and dedupe affiliations, collapse spaces in names, then strip
+    and fix every string, in place and in one pass over the authors."""
+    split = {}
+    fixed = {}
+    for author in message.get('authors', ()):
+        if 'affiliations' in author:
+            affiliations = []
+            for affiliation in author['affiliations']:
+                if affiliation not in split:
+                    split[affiliation] = split_affiliation(affiliation)
+                affiliations.extend(split[affiliation])
+            author['affiliations'] = list(set(affiliations))
+        author['name'] = MULTIPLE_SPACES_RE.sub(' ', author['name'])
+        strip_message_strs(author, fixed)
+    for key, value in message.items():
+        if key != 'authors':
+            message[key] = strip_message_strs(value, fixed)
 
 
 def merge_messages(publisher_msg, generic_msg):
@@ -131,22 +220,31 @@ def merge_messages(publisher_msg, generic_msg):
     return publisher_msg
 
 
-def sanitize_names(message):
-    for author in message['authors']:
-        author['name'] = re.sub(r' +', ' ', author['name'])
-    return message
+@timed_function('check_landing_page_bytes')
+def check_landing_page_bytes(contents):
+    """Raise for pages that can be rejected from their first bytes alone.
+
+    Runs before the soup is built; check_bad_landing_page still runs after.
+    """
+    kind = landing_page.sniff(contents)
+    if kind in (landing_page.PDF, landing_page.XML, landing_page.JSON):
+        raise WrongFormatLandingPageError(kind)
+    if kind == landing_page.BOT_WALL:
+        raise UnusualTrafficError('Landing page is a bot check or block page')
+    if kind == landing_page.BAD:
+        raise BadLandingPageError()
 
 
-def check_bad_landing_page(soup):
-    # s = soup.prettify()
-    if not soup.title:
+@timed_function('check_bad_landing_page')
+def check_bad_landing_page(signals):
+    if signals.title is None:
         return True
-    elif canonical := soup.select_one('link[rel=canonical]'):
-        if 'cookieAbsent' in canonical['href']:
+    elif canonical := signals.canonical_url:
+        if 'cookieAbsent' in canonical:
             return True
-    return any(['Redirecting' in soup.title.text,
-                'Just a moment' in soup.title.text,
-                soup.title.text.strip().startswith('Login |'),
+    return any(['Redirecting' in signals.title,
+                'Just a moment' in signals.title,
+                signals.title.strip().startswith('Login |'),
                 ])
 
 
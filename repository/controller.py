@@ -1,3 +1,4 @@
+import os
 from gzip import decompress
 
 import requests
@@ -5,16 +6,19 @@ from bs4 import BeautifulSoup
 
 from exceptions import ParserNotFoundError, S3FileNotFoundError
 from repository.parsers.parser import RepositoryParser
+from util.page_signals import PageSignals
+
+REPO_PAGE_ENDPOINT = os.getenv('REPO_PAGE_ENDPOINT',
+                               'https://api.unpaywall.org/repo_page/')
 
 
 class RepositoryController:
     def __init__(self, page_id):
         self.page_id = page_id
-        self.page_archive_endpoint = (
-            f"https://api.unpaywall.org/repo_page/{self.page_id}"
-        )
+        self.page_archive_endpoint = f"{REPO_PAGE_ENDPOINT}{self.page_id}"
         self.parsers = RepositoryParser.__subclasses__()
         self.soup = self.get_soup()
+        self.signals = PageSignals.from_soup(self.soup)
 
     def get_html(self):
         r = requests.get(self.page_archive_endpoint)
@@ -29,7 +33,7 @@ class RepositoryController:
 
     def find_parser(self):
         for cls in self.parsers:
-            parser = cls(self.soup)
+            parser = cls(self.soup, self.signals)
             if parser.is_correct_parser():
                 return parser
         raise ParserNotFoundError(f"Parser not found for {self.page_id}")
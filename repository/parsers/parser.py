@@ -1,11 +1,13 @@
 from abc import ABC, abstractmethod
 
 from repository.elements import AuthorAffiliations
+from util.page_signals import PageSignals
 
 
 class RepositoryParser(ABC):
-    def __init__(self, soup):
+    def __init__(self, soup, signals=None):
         self.soup = soup
+        self.signals = signals or PageSignals.from_soup(soup)
 
     @property
     @abstractmethod
@@ -29,41 +31,32 @@ class RepositoryParser(ABC):
         pass
 
     def domain_in_canonical_link(self, domain):
-        canonical_link = self.soup.find("link", {"rel": "canonical"})
-        if (
-            canonical_link
-            and canonical_link.get("href")
-            and domain in canonical_link.get("href")
-        ):
+        canonical_link = self.signals.canonical_url
+        if canonical_link and domain in canonical_link:
             return True
 
     def domain_in_meta_og_url(self, domain):
-        meta_og_url = self.soup.find("meta", property="og:url")
-        if (
-            meta_og_url
-            and meta_og_url.get("content")
-            and domain in meta_og_url.get("content")
-        ):
+        meta_og_url = self.signals.meta("og:url", ("property",))
+        if meta_og_url and domain in meta_og_url:
             return True
 
     def parse_meta_tags(self):
         results = []
-        metas = self.soup.findAll("meta")
 
         result = None
-        for meta in metas:
-            if meta.get("name") == "citation_author":
+        for meta in self.signals.metas:
+            if meta.name == "citation_author":
                 if result:
                     # reset for next author
                     results.append(result)
-                name = meta["content"].strip()
+                name = meta.content.strip()
                 result = {
                     "name": name,
                     "affiliations": [],
                     "is_corresponding": None,
                 }
-            if result and meta.get("name") == "citation_author_institution":
-                result["affiliations"].append(meta["content"].strip())
+            if result and meta.name == "citation_author_institution":
+                result["affiliations"].append(meta.content.strip())
 
         # append name from last loop
         if result:
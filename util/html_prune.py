@@ -0,0 +1,105 @@
+import re
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+SCRIPT_PATTERN = re.compile(r'<script\b([^>]*)>(.*?)</script\s*>',
+                            re.IGNORECASE | re.DOTALL)
+STYLE_PATTERN = re.compile(r'<style\b[^>]*>.*?</style\s*>',
+                           re.IGNORECASE | re.DOTALL)
+SVG_PATTERN = re.compile(r'<svg\b.*?</svg\s*>', re.IGNORECASE | re.DOTALL)
+DATA_URI_PATTERN = re.compile(r'''(\b(?:src|href)\s*=\s*)(["'])data:[^"']*\2''',
+                              re.IGNORECASE)
+TYPE_PATTERN = re.compile(r'''\btype\s*=\s*["']?([^"'\s>]+)''', re.IGNORECASE)
+NEXT_DATA_PATTERN = re.compile(r'''\bid\s*=\s*["']?__NEXT_DATA__\b''')
+IEEE_METADATA_PATTERN = re.compile('xplGlobal.document.metadata=.*')
+
+
+@dataclass(frozen=True)
+class ScriptPayloads:
+    """Bodies of the script tags parsers read data from, in document order."""
+    next_data: Optional[str] = None
+    json: Tuple[str, ...] = ()
+    ld_json: Tuple[str, ...] = ()
+    ieee_metadata: Optional[str] = None
+
+    @classmethod
+    def from_soup(cls, soup):
+        """Same payloads, read from a soup that wasn't pruned."""
+        next_data = None
+        json_scripts = []
+        ld_json_scripts = []
+        ieee_metadata = None
+        for script in soup.find_all('script'):
+            body = script.text
+            script_type = (script.get('type') or '').lower()
+            if script.get('id') == '__NEXT_DATA__' and next_data is None:
+                next_data = body
+            if script_type == 'application/ld+json':
+                ld_json_scripts.append(body)
+            elif script_type == 'application/json':
+                json_scripts.append(body)
+            elif ieee_metadata is None and (
+                    ieee_match := IEEE_METADATA_PATTERN.search(body)):
+                ieee_metadata = ieee_match.group()
+        return cls(next_data=next_data,
+                   json=tuple(json_scripts),
+                   ld_json=tuple(ld_json_scripts),
+                   ieee_metadata=ieee_metadata)
+
+
+def prune_markup(html):
+    html = STYLE_PATTERN.sub('', html)
+    html = SVG_PATTERN.sub('', html)
+    return DATA_URI_PATTERN.sub(r'\1\2data:\2', html)
+
+
+def prune_html(html):
+    """Drop the parts of a landing page no parser reads, before it's parsed.
+
+    Script bodies are emptied (the tags and their src stay) except JSON
+    scripts and IEEE's metadata script; <style> and <svg> elements are
+    removed; inline data: URIs in src/href are cut to "data:". Text searches
+    over the whole page, like the ORCID scan, must use the original html.
+
+    Returns (pruned_html, ScriptPayloads).
+    """
+    next_data = None
+    json_scripts = []
+    ld_json_scripts = []
+    ieee_metadata = None
+
+    def prune_script(match):
+        nonlocal next_data, ieee_metadata
+        attrs, body = match.groups()
+        script_type = TYPE_PATTERN.search(attrs)
+        script_type = script_type.group(1).lower() if script_type else ''
+        keep = not body or 'json' in script_type
+        if NEXT_DATA_PATTERN.search(attrs):
+            keep = True
+            if next_data is None:
+                next_data = body
+        if script_type == 'application/ld+json':
+            ld_json_scripts.append(body)
+        elif script_type == 'application/json':
+            json_scripts.append(body)
+        elif ieee_match := IEEE_METADATA_PATTERN.search(body):
+            keep = True
+            if ieee_metadata is None:
+                ieee_metadata = ieee_match.group()
+        return match.group() if keep else f'<script{attrs}></script>'
+
+    # style/svg/data: URIs are only stripped outside scripts, so the JSON
+    # payloads that are kept reach the parsers byte for byte.
+    parts = []
+    last = 0
+    for match in SCRIPT_PATTERN.finditer(html):
+        parts.append(prune_markup(html[last:match.start()]))
+        parts.append(prune_script(match))
+        last = match.end()
+    parts.append(prune_markup(html[last:]))
+    html = ''.join(parts)
+
+    return html, ScriptPayloads(next_data=next_data,
+                                json=tuple(json_scripts),
+                                ld_json=tuple(ld_json_scripts),
+                                ieee_metadata=ieee_metadata)
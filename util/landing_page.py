@@ -0,0 +1,183 @@
+import html
+import os
+import re
+import time
+import zlib
+
+from util import metrics
+
+CHUNK_SIZE = 64 * 1024
+MAX_LANDING_PAGE_BYTES = int(
+    os.getenv('MAX_LANDING_PAGE_BYTES', 32 * 1024 * 1024))
+MAX_INLINE_PAYLOAD_BYTES = int(
+    os.getenv('MAX_INLINE_PAYLOAD_BYTES', 512 * 1024))
+
+INLINE_PAYLOAD_PATTERN = re.compile(
+    rb'(<(script|style)\b[^>]*>)(.*?)(</\2\s*>)', re.DOTALL | re.IGNORECASE)
+# Data read from inline scripts that aren't typed as JSON: IEEE's metadata
+# (ScriptPayloads), the PDF links get_pdf_from_javascript looks for, and
+# ORCIDs (find_orcids).
+METADATA_PAYLOAD_PATTERN = re.compile(
+    rb'xplGlobal\.document\.metadata='
+    rb'|"(?:pdfUrl|exportPdfDownloadUrl|downloadPdfUrl|fullTextPdfUrl)":'
+    rb'|\d{4}-\d{4}-\d{4}-[\dX]{4}')
+
+# sniff() only looks this far into a page
+SNIFF_BYTES = int(os.getenv('LANDING_PAGE_SNIFF_BYTES', 8 * 1024))
+# Challenge and block pages are small and carry no article metadata;
+# captcha widgets on other pages are usually a login or comment form on a
+# real article.
+SMALL_PAGE_BYTES = 64 * 1024
+ARTICLE_META = re.compile(
+    rb'<meta\b[^>]*\bname\s*=\s*["\']?(?:citation_|dc\.)', re.IGNORECASE)
+
+PDF = 'pdf'
+XML = 'xml'
+JSON = 'json'
+BOT_WALL = 'bot-wall'
+BAD = 'bad'
+
+PDF_START = re.compile(rb'(?:\xef\xbb\xbf)?\s*%PDF-')
+LEADING_SPACE = re.compile(rb'(?:\xef\xbb\xbf)?\s*')
+TITLE = re.compile(rb'<title\b[^>]*>([^<]*)</title', re.IGNORECASE)
+CANONICAL_LINK = re.compile(rb'<link\b[^>]*\bcanonical\b[^>]*>', re.IGNORECASE)
+HTML_START = re.compile(rb'<!doctype\s+html|<html\b', re.IGNORECASE)
+
+# Phrases only block pages use, matched against the lowercased start of
+# the page. The first four are the ones the ACS, SpringerMaterial, Oxford
+# and IOP parsers look for in the full tree.
+BOT_WALL_PHRASES = re.compile(b'|'.join(map(re.escape, [
+    b'request forbidden by administrative rules',
+    b'unusual traffic from your account',
+    b'help us confirm that you are not a robot',
+    b'made us think that you are a bot',
+    b'<title>attention required! | cloudflare</title>',
+])))
+# Challenge scripts and widgets that bot-protection services also inject
+# into ordinary pages, so they only count on small pages with no article
+# metadata.
+CHALLENGE_MARKERS = re.compile(b'|'.join(map(re.escape, [
+    b'/cdn-cgi/challenge-platform/',
+    b'_incapsula_resource',
+    b'captcha-delivery.com',
+    b'g-recaptcha',
+    b'h-captcha',
+    b'px-captcha',
+])))
+# Block page titles, alone or followed by the site's name
+BLOCKED_TITLE = re.compile(
+    r'(?:Access Denied|Are you a robot\??|Captcha)(?: [|-] .*)?', re.DOTALL)
+
+
+def is_pdf(contents):
+    """True for PDF bytes, allowing a BOM or whitespace before the header."""
+    return PDF_START.match(contents, 0, 1024) is not None
+
+
+def iter_chunks(body, chunk_size=CHUNK_SIZE):
+    return iter(lambda: body.read(chunk_size), b'')
+
+
+def decompress_stream(chunks, max_bytes=MAX_LANDING_PAGE_BYTES):
+    """Gunzip an iterable of byte chunks, stopping once max_bytes are out.
+
+    Only HTML is capped; a PDF (which the caller hands on whole) is always
+    decompressed in full.
+    """
+    decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    out = bytearray()
+    limit = None
+    # chunks may be read off the network, so only time zlib itself
+    elapsed = 0
+    try:
+        for chunk in chunks:
+            start = time.perf_counter()
+            out += decompressor.decompress(chunk)
+            elapsed += time.perf_counter() - start
+            if limit is None and len(out) >= 5:
+                limit = None if is_pdf(out) else max_bytes
+            if limit is not None and len(out) >= limit:
+                del out[limit:]
+                print(f'Landing page truncated at {limit} bytes')
+                return bytes(out)
+        start = time.perf_counter()
+        out += decompressor.flush()
+        elapsed += time.perf_counter() - start
+        return bytes(out)
+    finally:
+        metrics.observe('decompress', elapsed)
+
+
+def strip_oversized_payloads(html, max_payload=MAX_INLINE_PAYLOAD_BYTES):
+    """Empty inline <script>/<style> bodies larger than max_payload bytes.
+
+    JSON scripts and payloads matching METADATA_PAYLOAD_PATTERN are kept
+    whole since parsers read metadata from them.
+    Returns html unchanged (not copied) when nothing is oversized.
+    """
+    if len(html) <= max_payload or is_pdf(html):
+        return html
+
+    parts = []
+    last = 0
+    for match in INLINE_PAYLOAD_PATTERN.finditer(html):
+        open_tag, _, payload, _ = match.groups()
+        if (len(payload) <= max_payload or b'json' in open_tag.lower()
+                or METADATA_PAYLOAD_PATTERN.search(payload)):
+            continue
+        parts.append(html[last:match.start(3)])
+        last = match.end(3)
+    if not parts:
+        return html
+    parts.append(html[last:])
+    return b''.join(parts)
+
+
+def read_landing_page(chunks):
+    """Decompressed landing page bytes with size caps applied."""
+    return strip_oversized_payloads(decompress_stream(chunks))
+
+
+def sniff(contents):
+    """Classify a landing page from its first SNIFF_BYTES, without parsing it.
+
+    Returns PDF, XML or JSON for pages in another format, BOT_WALL for bot,
+    captcha and block pages, BAD for what check_bad_landing_page would
+    reject, and None for anything that should go on to the full parse.
+    """
+    head = contents[:SNIFF_BYTES]
+    if is_pdf(head):
+        return PDF
+
+    start = LEADING_SPACE.match(head).end()
+    if start == len(head):
+        return BAD
+    first = head[start:start + 1]
+    if first in (b'{', b'['):
+        return JSON
+    if head.startswith(b'<?xml', start) and not HTML_START.search(head):
+        return XML
+
+    lowered = head.lower()
+    if BOT_WALL_PHRASES.search(lowered):
+        return BOT_WALL
+    may_be_wall = (len(contents) <= SMALL_PAGE_BYTES
+                   and not ARTICLE_META.search(head))
+    if may_be_wall and CHALLENGE_MARKERS.search(lowered):
+        return BOT_WALL
+
+    if title_match := TITLE.search(head):
+        title = html.unescape(title_match.group(1).decode('utf-8', 'replace'))
+        if may_be_wall and BLOCKED_TITLE.fullmatch(title.strip()):
+            return BOT_WALL
+        if ('Redirecting' in title or 'Just a moment' in title
+                or title.strip().startswith('Login |')):
+            return BAD
+    elif len(contents) <= SNIFF_BYTES and b'<title' not in lowered:
+        # the whole page was read and has no title at all
+        return BAD
+
+    if canonical := CANONICAL_LINK.search(head):
+        if b'cookieAbsent' in canonical.group(0):
+            return BAD
+    return None
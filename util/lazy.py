@@ -0,0 +1,34 @@
+import functools
+import os
+import threading
+
+
+def per_process(factory):
+    """Turn a no-argument factory into a function returning one shared
+    instance per process, created the first time it is called.
+
+    Nothing is built at import time, and a forked worker makes its own
+    instance instead of sharing the connections of its parent.
+    """
+    lock = threading.Lock()
+    pid = None
+    instance = None
+
+    def reset_lock():
+        # the parent may have been holding it when it forked
+        nonlocal lock
+        lock = threading.Lock()
+
+    os.register_at_fork(after_in_child=reset_lock)
+
+    @functools.wraps(factory)
+    def get():
+        nonlocal pid, instance
+        if pid != os.getpid():
+            with lock:
+                if pid != os.getpid():
+                    instance = factory()
+                    pid = os.getpid()
+        return instance
+
+    return get
@@ -0,0 +1,80 @@
+import json
+import threading
+import time
+from collections import OrderedDict
+
+from util import metrics
+
+
+def sizeof(value):
+    if isinstance(value, (bytes, bytearray)):
+        return len(value)
+    if isinstance(value, str):
+        return len(value.encode())
+    return len(json.dumps(value, default=str))
+
+
+class MemoryCache:
+    """Thread-safe in-process LRU cache bounded by total bytes, with a TTL.
+
+    Entries expire ttl seconds after being set, and the least recently used
+    entries are evicted once the stored values exceed max_bytes. Hits,
+    misses, evictions and size are exported by util.metrics under name.
+    """
+
+    def __init__(self, name, max_bytes, ttl):
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.entries = OrderedDict()
+        self.total_bytes = 0
+        self.hits = metrics.MEMORY_CACHE_EVENTS.labels(name, 'hit')
+        self.misses = metrics.MEMORY_CACHE_EVENTS.labels(name, 'miss')
+        self.evictions = metrics.MEMORY_CACHE_EVENTS.labels(name, 'eviction')
+        self.bytes_gauge = metrics.MEMORY_CACHE_BYTES.labels(name)
+        self.entries_gauge = metrics.MEMORY_CACHE_ENTRIES.labels(name)
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                self.misses.inc()
+                return None
+            expires, size, value = entry
+            if expires < time.monotonic():
+                self._remove(key)
+                self._update_size()
+                self.misses.inc()
+                return None
+            self.entries.move_to_end(key)
+            self.hits.inc()
+            return value
+
+    def set(self, key, value, size=None):
+        if size is None:
+            size = sizeof(value)
+        if size > self.max_bytes:
+            return
+        with self.lock:
+            if key in self.entries:
+                self._remove(key)
+            self.entries[key] = (time.monotonic() + self.ttl, size, value)
+            self.total_bytes += size
+            while self.total_bytes > self.max_bytes:
+                self._remove(next(iter(self.entries)))
+                self.evictions.inc()
+            self._update_size()
+
+    def _remove(self, key):
+        _, size, _ = self.entries.pop(key)
+        self.total_bytes -= size
+
+    def _update_size(self):
+        self.bytes_gauge.set(self.total_bytes)
+        self.entries_gauge.set(len(self.entries))
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.total_bytes = 0
+            self._update_size()
@@ -0,0 +1,103 @@
+import contextvars
+import os
+import time
+from functools import wraps
+
+from prometheus_client import CONTENT_TYPE_LATEST, CollectorRegistry, \
+    Counter, Gauge, Histogram, generate_latest, multiprocess
+
+STAGE_SECONDS = Histogram(
+    'parseland_stage_seconds',
+    'Time spent in one stage of handling a request.',
+    ['endpoint', 'stage', 'parser'],
+    buckets=(.0005, .001, .0025, .005, .01, .025, .05, .1, .25, .5, 1, 2.5,
+             5, 10, 30))
+
+# util.memory_cache.MemoryCache instances, labelled by the cache's name
+MEMORY_CACHE_EVENTS = Counter(
+    'parseland_memory_cache_events',
+    'Hits, misses and evictions of an in-process cache.',
+    ['cache', 'event'])
+MEMORY_CACHE_BYTES = Gauge(
+    'parseland_memory_cache_bytes',
+    'Bytes held by an in-process cache.',
+    ['cache'], multiprocess_mode='livesum')
+MEMORY_CACHE_ENTRIES = Gauge(
+    'parseland_memory_cache_entries',
+    'Entries held by an in-process cache.',
+    ['cache'], multiprocess_mode='livesum')
+
+# Set per request; work done outside a request (or in a pool thread) is
+# labelled 'none' and never reported in Server-Timing.
+_endpoint = contextvars.ContextVar('endpoint', default='none')
+_timings = contextvars.ContextVar('timings', default=None)
+
+# labels() takes a lock and builds a tuple on every call; parsers hit it a
+# few hundred times per request, so keep the children.
+_children = {}
+
+
+def start_request(endpoint, collect_timings=False):
+    """Label later stages with endpoint, keeping totals if collect_timings."""
+    _endpoint.set(endpoint or 'none')
+    _timings.set({} if collect_timings else None)
+
+
+def observe(stage, seconds, parser=''):
+    key = (_endpoint.get(), stage, parser)
+    child = _children.get(key)
+    if child is None:
+        child = _children.setdefault(key, STAGE_SECONDS.labels(*key))
+    child.observe(seconds)
+    timings = _timings.get()
+    if timings is not None:
+        name = f'{stage}.{parser}' if parser else stage
+        timings[name] = timings.get(name, 0) + seconds
+
+
+class timed:
+    """Context manager recording the time spent inside it as stage."""
+    __slots__ = ('stage', 'parser', 'start')
+
+    def __init__(self, stage, parser=''):
+        self.stage = stage
+        self.parser = parser
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc_info):
+        observe(self.stage, time.perf_counter() - self.start, self.parser)
+
+
+def timed_function(stage):
+    """Decorator recording every call of the function as stage."""
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with timed(stage):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def server_timing():
+    """Server-Timing header value for the current request, or None."""
+    timings = _timings.get()
+    if not timings:
+        return None
+    return ', '.join(f'{name};dur={seconds * 1000:.2f}' for name, seconds in
+                     timings.items())
+
+
+def exposition():
+    """(body, content type) for /metrics.
+
+    Under gunicorn with PROMETHEUS_MULTIPROC_DIR set, samples from every
+    worker process are merged.
+    """
+    if os.getenv('PROMETHEUS_MULTIPROC_DIR'):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry), CONTENT_TYPE_LATEST
+    return generate_latest(), CONTENT_TYPE_LATEST
@@ -0,0 +1,119 @@
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Mapping, Optional, Tuple
+from urllib.parse import urlparse
+
+
+@dataclass(frozen=True)
+class MetaTag:
+    name: Optional[str]
+    property: Optional[str]
+    content: Optional[str]
+
+
+@dataclass(frozen=True)
+class PageSignals:
+    """Head-level facts about a landing page, extracted in one traversal.
+
+    Parsers and OA detectors read canonical links, og:* and citation_* metas
+    from here instead of querying the soup again.
+    """
+    metas: Tuple[MetaTag, ...]
+    by_name: Mapping[str, Tuple[Optional[str], ...]]
+    by_property: Mapping[str, Tuple[Optional[str], ...]]
+    canonical_url: Optional[str]
+    base_url: Optional[str]
+    title: Optional[str]
+
+    @classmethod
+    def from_soup(cls, soup):
+        metas = []
+        by_name = {}
+        by_property = {}
+        canonical_url = None
+        canonical_href = None
+        base_href = None
+        title = None
+
+        for tag in soup.find_all(['meta', 'link', 'base', 'title']):
+            if tag.name == 'meta':
+                meta = MetaTag(name=tag.get('name'),
+                               property=tag.get('property'),
+                               content=tag.get('content'))
+                metas.append(meta)
+                if meta.name is not None:
+                    by_name.setdefault(meta.name, []).append(meta.content)
+                if meta.property is not None:
+                    by_property.setdefault(meta.property, []).append(
+                        meta.content)
+            elif tag.name == 'link':
+                if 'canonical' in (tag.get('rel') or []):
+                    if canonical_url is None:
+                        canonical_url = tag.get('href') or ''
+                    if canonical_href is None and tag.get('href') is not None:
+                        canonical_href = tag['href']
+            elif tag.name == 'base':
+                if base_href is None and tag.get('href') is not None:
+                    base_href = tag['href']
+            elif title is None:
+                title = tag.text
+
+        metas = tuple(metas)
+        return cls(
+            metas=metas,
+            by_name=MappingProxyType(
+                {k: tuple(v) for k, v in by_name.items()}),
+            by_property=MappingProxyType(
+                {k: tuple(v) for k, v in by_property.items()}),
+            canonical_url=canonical_url,
+            base_url=cls._find_base_url(metas, base_href, canonical_href),
+            title=title,
+        )
+
+    @staticmethod
+    def _find_base_url(metas, base_href, canonical_href):
+        if base_href is not None:
+            return base_href
+
+        if canonical_href is not None:
+            return canonical_href
+
+        meta_url_tags = [
+            ('property', 'og:url'),
+            ('name', 'citation_url'),
+            ('name', 'dc.identifier'),
+            ('property', 'al:web:url'),
+        ]
+        for attr, key in meta_url_tags:
+            for meta in metas:
+                if getattr(meta, attr) == key and meta.content is not None:
+                    return meta.content
+
+        for meta in metas:
+            if meta.content and meta.content.startswith(
+                    ('http://', 'https://')):
+                parsed = urlparse(meta.content)
+                return f"{parsed.scheme}://{parsed.netloc}"
+
+        return None
+
+    def meta(self, key, attrs=('property', 'name')):
+        """Content of the first meta whose name/property is key, trying attrs in order."""
+        for attr in attrs:
+            lookup = self.by_property if attr == 'property' else self.by_name
+            if key in lookup:
+                return lookup[key][0]
+        return None
+
+    def meta_all(self, key, attr='name'):
+        lookup = self.by_property if attr == 'property' else self.by_name
+        return lookup.get(key, ())
+
+    def meta_ignore_case(self, key, attr='name'):
+        """Content of the first meta whose attr equals key case-insensitively."""
+        key = key.lower()
+        for meta in self.metas:
+            value = getattr(meta, attr)
+            if value is not None and value.lower() == key:
+                return meta.content
+        return None
@@ -0,0 +1,98 @@
+import copy
+import re
+
+from bs4 import BeautifulSoup
+
+from util.metrics import timed
+from util.page_signals import PageSignals
+
+# The head ends at the first </head> outside comments and raw-text elements.
+HEAD_SCAN = re.compile(r'<(script|style|title|textarea)\b|<!--|</head\s*>',
+                       re.I)
+RAW_TEXT_END = {
+    'script': re.compile(r'</script\s*>', re.I),
+    'style': re.compile(r'</style\s*>', re.I),
+    'title': re.compile(r'</title\s*>', re.I),
+    'textarea': re.compile(r'</textarea\s*>', re.I),
+    '--': re.compile(r'-->'),
+}
+# Tags PageSignals reads. After the head, they mean the head alone doesn't
+# give the page's signals.
+LATE_SIGNAL_TAG = re.compile(r'<(?:meta|base)\b|<link\b[^<]*canonical', re.I)
+LATE_TITLE = re.compile(r'<title\b', re.I)
+
+
+def head_end(html):
+    """Index of the page's </head>, or None if it has no clear one."""
+    pos = 0
+    while match := HEAD_SCAN.search(html, pos):
+        if match.group().startswith('</'):
+            # not inside another tag's attribute value
+            if html.rfind('<', 0, match.start()) > html.rfind(
+                    '>', 0, match.start()):
+                return None
+            return match.start()
+        end = RAW_TEXT_END[(match.group(1) or '--').lower()].search(
+            html, match.end())
+        if end is None:
+            return None
+        pos = end.end()
+    return None
+
+
+class ParsedPage:
+    """A landing page decoded and parsed once, shared by the OA detectors
+    and the publisher parsers.
+
+    Only the <head> is parsed up front, for the page signals; the whole page
+    is parsed the first time soup is used, so pages rejected on their
+    signals never parse the body. Pages with meta, base or canonical link
+    tags after the head are parsed whole straight away.
+    """
+
+    def __init__(self, html):
+        self.html = html
+        self._soup = None
+        head = None
+        end = head_end(html)
+        if end is not None and not LATE_SIGNAL_TAG.search(html, end):
+            with timed('head_soup'):
+                head = BeautifulSoup(html[:end], 'lxml')
+            with timed('page_signals'):
+                self.signals = PageSignals.from_soup(head)
+            if self.signals.title is None and LATE_TITLE.search(html, end):
+                head = None
+        if head is None:
+            with timed('page_signals'):
+                self.signals = PageSignals.from_soup(self.soup)
+        self._pruned = {}
+
+    @classmethod
+    def from_bytes(cls, contents):
+        return cls(contents.decode())
+
+    @property
+    def soup(self):
+        """The whole page's soup."""
+        if self._soup is None:
+            with timed('soup'):
+                self._soup = BeautifulSoup(self.html, 'lxml')
+        return self._soup
+
+    def soup_without(self, selectors):
+        """Soup with the sections matching selectors decomposed.
+
+        The shared soup is never modified: it is copied the first time a
+        selector list actually matches something, and the copy is reused
+        for later calls with the same selectors.
+        """
+        selector = ', '.join(selectors)
+        if selector not in self._pruned:
+            if self.soup.select_one(selector) is None:
+                pruned = self.soup
+            else:
+                pruned = copy.copy(self.soup)
+                for section in pruned.select(selector):
+                    section.decompose()
+            self._pruned[selector] = pruned
+        return self._pruned[selector]
@@ -0,0 +1,54 @@
+import functools
+import re
+from urllib.parse import urlparse
+
+
+@functools.lru_cache(maxsize=None)
+def cached_regex(pattern, flags=0):
+    """re.compile, memoized for patterns built at runtime."""
+    return re.compile(pattern, flags)
+
+
+def any_word(words, flags=0):
+    """One regex matching any of the literal words."""
+    return re.compile('|'.join(re.escape(word) for word in words), flags)
+
+
+def any_pattern(patterns, flags=0):
+    """One regex matching wherever any of the patterns would match."""
+    return re.compile('|'.join(f'(?:{pattern})' for pattern in patterns),
+                      flags)
+
+
+def url_host(url):
+    """Lowercased hostname without a leading www."""
+    try:
+        host = urlparse(url).hostname or ''
+    except ValueError:
+        return ''
+    return host[4:] if host.startswith('www.') else host
+
+
+class HostRules:
+    """URL rewrite rules looked up by hostname.
+
+    Each rule is (hosts, pattern, rewrite): when a URL's host is one of
+    hosts and pattern matches the URL, rewrite(url) replaces it. At most
+    one rule per host, so applying the table costs one dictionary lookup
+    and one regex match.
+    """
+
+    def __init__(self, rules):
+        self.rules = {}
+        for hosts, pattern, rewrite in rules:
+            for host in hosts:
+                if host in self.rules:
+                    raise ValueError(f'More than one rule for {host}')
+                self.rules[host] = (re.compile(pattern), rewrite)
+
+    def apply(self, url):
+        rule = self.rules.get(url_host(url))
+        if rule is None:
+            return url
+        pattern, rewrite = rule
+        return rewrite(url) if pattern.match(url) else url
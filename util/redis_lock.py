@@ -0,0 +1,23 @@
+import uuid
+
+# Deletes the lock only if it still holds the caller's token, so a holder
+# whose lock expired can't release the next holder's.
+RELEASE_SCRIPT = """if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0"""
+
+
+def acquire(conn, name, ttl):
+    """Lock name for ttl seconds. Returns the token to release it with, or
+    None if someone else holds it.
+    """
+    token = uuid.uuid4().hex
+    if conn.set(name, token, nx=True, px=int(ttl * 1000)):
+        return token
+    return None
+
+
+def release(conn, name, token):
+    """Unlock name if token still holds it; returns whether it did."""
+    return bool(conn.eval(RELEASE_SCRIPT, 1, name, token))
@@ -4,31 +4,86 @@ from urllib.parse import quote
 
 import boto3
 import botocore
+from botocore.config import Config
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, \
+    wait_random_exponential
+from urllib3.exceptions import ProtocolError
 
 from exceptions import S3FileNotFoundError
 from publisher.utils import normalize_doi
+from util import metrics
+from util.landing_page import is_pdf, iter_chunks, read_landing_page
+from util.lazy import per_process
+from util.memory_cache import MemoryCache
 
 S3_LANDING_PAGE_BUCKET = os.getenv('AWS_S3_LANDING_PAGE_BUCKET')
+S3_PDF_BUCKET = os.getenv('AWS_S3_PDF_BUCKET')
+S3_MAX_ATTEMPTS = int(os.getenv('S3_MAX_ATTEMPTS', 5))
+# Points the client at an S3 stand-in, e.g. benchmarks.standins
+S3_ENDPOINT_URL = os.getenv('AWS_S3_ENDPOINT_URL')
 
+# Errors while streaming a body, which botocore's own retries don't cover.
+TRANSIENT_ERRORS = (botocore.exceptions.HTTPClientError,
+                    botocore.exceptions.ConnectionError,
+                    botocore.exceptions.IncompleteReadError,
+                    ProtocolError)
 
-def make_s3():
+
+def make_s3(max_pool_connections=10):
     session = boto3.session.Session()
     return session.client('s3',
                           aws_access_key_id=os.getenv('AWS_ACCESS_KEY_ID'),
                           aws_secret_access_key=os.getenv(
                               'AWS_SECRET_ACCESS_KEY'),
-                          region_name=os.getenv('AWS_DEFAULT_REGION'))
+                          region_name=os.getenv('AWS_DEFAULT_REGION'),
+                          endpoint_url=S3_ENDPOINT_URL,
+                          config=Config(
+                              max_pool_connections=max_pool_connections,
+                              retries={'max_attempts': S3_MAX_ATTEMPTS,
+                                       'mode': 'standard'},
+                              s3={'addressing_style': 'path'} if S3_ENDPOINT_URL else None))
+
 
+@per_process
+def default_s3():
+    """This process's client, made on first use rather than at import."""
+    return make_s3()
 
-DEFAULT_S3 = make_s3()
+# Decompressed landing pages recently fetched by this process.
+LANDING_PAGES = MemoryCache(
+    'landing_pages',
+    max_bytes=int(os.getenv('LANDING_PAGE_MEMORY_CACHE_BYTES', 64 * 1024 * 1024)),
+    ttl=int(os.getenv('LANDING_PAGE_MEMORY_CACHE_TTL', 60)))
 
 
-def s3_last_modified(doi, s3=DEFAULT_S3):
-    return get_obj(S3_LANDING_PAGE_BUCKET, doi_to_lp_key(doi), s3)[
+def s3_last_modified(doi, s3=None):
+    return head_obj(S3_LANDING_PAGE_BUCKET, doi_to_lp_key(doi), s3)[
         'LastModified']
 
 
-def get_obj(bucket, key, s3=DEFAULT_S3):
+@metrics.timed_function('s3_head')
+def landing_page_validator(doi, s3=None):
+    """ETag of the stored landing page (LastModified if it has none).
+
+    Uses a HEAD request, so it's cheap to call before deciding whether a
+    cached parse is still valid.
+    """
+    obj = head_obj(S3_LANDING_PAGE_BUCKET, doi_to_lp_key(doi), s3)
+    return obj.get('ETag') or obj['LastModified'].isoformat()
+
+
+def head_obj(bucket, key, s3=None):
+    s3 = s3 or default_s3()
+    try:
+        return s3.head_object(Bucket=bucket, Key=key)
+    except botocore.exceptions.ClientError as e:
+        if e.response['Error']['Code'] in {"404", "NoSuchKey"}:
+            raise S3FileNotFoundError()
+        raise
+
+
+def get_obj(bucket, key, s3=None):
+    s3 = s3 or default_s3()
     try:
         obj = s3.get_object(Bucket=bucket,
                             Key=key)
@@ -36,6 +91,26 @@ def get_obj(bucket, key, s3=DEFAULT_S3):
     except botocore.exceptions.ClientError as e:
         if e.response['Error']['Code'] in {"404", "NoSuchKey"}:
             raise S3FileNotFoundError()
+        raise
+
+
+@retry(retry=retry_if_exception_type(TRANSIENT_ERRORS),
+       stop=stop_after_attempt(S3_MAX_ATTEMPTS),
+       wait=wait_random_exponential(multiplier=0.2, max=5),
+       reraise=True)
+def get_body(bucket, key, s3=None):
+    return get_obj(bucket, key, s3)['Body'].read()
+
+
+@retry(retry=retry_if_exception_type(TRANSIENT_ERRORS),
+       stop=stop_after_attempt(S3_MAX_ATTEMPTS),
+       wait=wait_random_exponential(multiplier=0.2, max=5),
+       reraise=True)
+@metrics.timed_function('s3_fetch')
+def fetch_landing_page(key, s3=None):
+    """Stream a landing page out of S3, decompressing as it arrives."""
+    body = get_obj(S3_LANDING_PAGE_BUCKET, key, s3)['Body']
+    return read_landing_page(iter_chunks(body))
 
 
 def doi_to_lp_key(doi: str):
@@ -43,12 +118,18 @@ def doi_to_lp_key(doi: str):
     return quote(doi.lower(), safe='')
 
 
-def get_landing_page(doi, s3=DEFAULT_S3):
+def get_landing_page(doi, s3=None):
     key = doi_to_lp_key(doi)
-    obj = get_obj(S3_LANDING_PAGE_BUCKET, key, s3)
-    contents = decompress(obj['Body'].read())
+    contents = LANDING_PAGES.get(key)
+    if contents is None:
+        contents = fetch_landing_page(key, s3)
+        LANDING_PAGES.set(key, contents)
     return contents
 
 
-def is_pdf(contents: bytes):
-    return contents.startswith(b"%PDF-")
+def get_pdf(doi, s3=None):
+    key = f'{quote(normalize_doi(doi), safe="")}.pdf'
+    body = get_body(S3_PDF_BUCKET, key, s3)
+    if body[:3] == b'\x1f\x8b\x08':
+        body = decompress(body)
+    return body
@@ -0,0 +1,135 @@
+import gzip
+
+from util import landing_page
+from util.landing_page import decompress_stream, sniff, \
+    strip_oversized_payloads
+
+
+def chunked(contents, size=100):
+    compressed = gzip.compress(contents)
+    return [compressed[i:i + size] for i in range(0, len(compressed), size)]
+
+
+def test_decompress_stream():
+    page = b'<html><body>' + b'<p>text</p>' * 1000 + b'</body></html>'
+    assert decompress_stream(chunked(page)) == page
+
+
+def test_decompress_stream_caps_html():
+    page = b'<html><body>' + b'<p>text</p>' * 1000 + b'</body></html>'
+    assert decompress_stream(chunked(page), max_bytes=500) == page[:500]
+
+
+def test_decompress_stream_keeps_whole_pdfs():
+    pdf = b'%PDF-1.7\n' + b'0' * 10000
+    assert decompress_stream(chunked(pdf), max_bytes=500) == pdf
+
+
+def script(body, open_tag=b'<script>'):
+    return open_tag + body + b'</script>'
+
+
+def test_small_pages_are_unchanged():
+    page = b'<html><head>' + script(b'x' * 50) + b'</head></html>'
+    assert strip_oversized_payloads(page, max_payload=100) is page
+
+
+def test_oversized_payloads_are_emptied():
+    page = (b'<html><head>' + script(b'var a = 1;') +
+            b'<style>' + b'p {}' * 50 + b'</style>' +
+            script(b'x' * 200, b'<script src="">') + b'</head></html>')
+    assert strip_oversized_payloads(page, max_payload=100) == (
+            b'<html><head>' + script(b'var a = 1;') + b'<style></style>' +
+            script(b'', b'<script src="">') + b'</head></html>')
+
+
+def test_metadata_payloads_are_kept():
+    payloads = [
+        script(b'{"a": "' + b'x' * 200 + b'"}',
+               b'<script type="application/ld+json">'),
+        script(b'xplGlobal.document.metadata={"authors": "' + b'x' * 200 +
+               b'"};'),
+        script(b'var state = {"pdfUrl":"/a.pdf", "b": "' + b'x' * 200 +
+               b'"};'),
+        script(b'var authors = ["0000-0002-1825-0097", "' + b'x' * 200 +
+               b'"];'),
+    ]
+    for payload in payloads:
+        page = b'<html><head>' + payload + b'</head></html>'
+        assert strip_oversized_payloads(page, max_payload=100) == page
+
+
+ARTICLE = (b'<!DOCTYPE html><html><head><title>%s</title>'
+           b'<meta name="citation_title" content="A paper">'
+           b'<meta name="citation_author" content="Ada Lovelace">%s</head>'
+           b'<body><p>Full text</p></body></html>')
+
+
+def article(title=b'A paper', head=b'', size=0):
+    page = ARTICLE % (title, head)
+    return page + b' ' * (size - len(page))
+
+
+def test_sniff_other_formats():
+    assert sniff(b'\xef\xbb\xbf %PDF-1.4\n') == landing_page.PDF
+    assert sniff(b' {"doi": "10.1/a"}') == landing_page.JSON
+    assert sniff(b'[1, 2]') == landing_page.JSON
+    assert sniff(b'<?xml version="1.0"?><article></article>') == \
+           landing_page.XML
+    assert sniff(b'') == landing_page.BAD
+    assert sniff(b' \n ') == landing_page.BAD
+
+
+def test_sniff_xhtml_is_html():
+    page = b'<?xml version="1.0" encoding="UTF-8"?>' + article()
+    assert sniff(page) is None
+
+
+def test_sniff_bot_walls():
+    walls = [
+        b'<html><head><title>Error</title></head><body>Request forbidden '
+        b'by administrative rules.</body></html>',
+        b'<html><head><title>Attention Required! | Cloudflare</title>'
+        b'</head></html>',
+        b'<html><head><title>Verify</title><script src="/cdn-cgi/'
+        b'challenge-platform/h/b/orchestrate/jsch/v1"></script></head>'
+        b'</html>',
+        b'<html><head><title>Access Denied</title></head><body>You '
+        b'don\'t have permission.</body></html>',
+        b'<html><head><title>Captcha | Example Press</title></head>'
+        b'<body><div class="g-recaptcha"></div></body></html>',
+    ]
+    for wall in walls:
+        assert sniff(wall) == landing_page.BOT_WALL
+
+
+def test_sniff_bad_pages():
+    assert sniff(b'<html><head><title>Just a moment...</title></head>'
+                 b'</html>') == landing_page.BAD
+    assert sniff(b'<html><head><title>Redirecting</title></head>'
+                 b'</html>') == landing_page.BAD
+    assert sniff(b'<html><head><title>Login | Example Press</title></head>'
+                 b'</html>') == landing_page.BAD
+    assert sniff(b'<html><body><p>No title</p></body></html>') == \
+           landing_page.BAD
+    assert sniff(article(head=b'<link rel="canonical" href="https://'
+                              b'example.org/?cookieAbsent=1">')) == \
+           landing_page.BAD
+
+
+def test_sniff_articles():
+    assert sniff(article()) is None
+    # a captcha on a comment form, or a paper about captchas
+    assert sniff(article(
+        title=b'Captcha: using hard AI problems for security',
+        head=b'<div class="g-recaptcha"></div>')) is None
+    assert sniff(article(title=b'Access Denied | Example Press')) is None
+    # pages without article metadata
+    page = (b'<html><head><title>Comments</title></head><body>'
+            b'<div class="g-recaptcha"></div>')
+    assert sniff(page + b' ' * (100 * 1024)) is None
+    assert sniff(b'<html><head><title>Are you a robot? Telling bots from '
+                 b'people</title></head></html>') is None
+    # titles are only searched for in the first SNIFF_BYTES
+    assert sniff(b'<html><head>' + b' ' * landing_page.SNIFF_BYTES +
+                 b'<title>A paper</title></head></html>') is None
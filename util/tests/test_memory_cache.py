@@ -0,0 +1,26 @@
+from prometheus_client import REGISTRY
+
+from util.memory_cache import MemoryCache
+
+
+def sample(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0
+
+
+def test_stats_are_exported():
+    cache = MemoryCache('test', max_bytes=10, ttl=60)
+    events = 'parseland_memory_cache_events_total'
+    before = {event: sample(events, cache='test', event=event)
+              for event in ('hit', 'miss', 'eviction')}
+
+    cache.set('a', b'12345')
+    assert cache.get('a') == b'12345'
+    assert cache.get('b') is None
+    cache.set('b', b'123456')
+
+    assert sample(events, cache='test', event='hit') == before['hit'] + 1
+    assert sample(events, cache='test', event='miss') == before['miss'] + 1
+    assert sample(events, cache='test',
+                  event='eviction') == before['eviction'] + 1
+    assert sample('parseland_memory_cache_bytes', cache='test') == 6
+    assert sample('parseland_memory_cache_entries', cache='test') == 1
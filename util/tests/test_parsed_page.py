@@ -0,0 +1,53 @@
+from util.parsed_page import ParsedPage, head_end
+
+BODY = '<body><p>Full text</p></body></html>'
+
+
+def test_head_end():
+    html = '<html><head><title>T</title></head>' + BODY
+    assert head_end(html) == html.index('</head>')
+
+
+def test_head_end_skips_comments_and_raw_text():
+    head = ('<html><head><!-- </head> -->'
+            '<script>document.write("</head>")</script>'
+            '<style>p::after { content: "</head>" }</style>'
+            '<title>On </head> tags</title>')
+    assert head_end(head + '</head>' + BODY) == len(head)
+
+
+def test_head_end_in_attribute_is_unclear():
+    html = '<html><head><meta content="a </head> b"></head>' + BODY
+    assert head_end(html) is None
+
+
+def test_head_end_unclear_pages():
+    assert head_end('<html><body><p>No head</p></body></html>') is None
+    assert head_end('<html><head><script>var a = 1;</head>' + BODY) is None
+    assert head_end('<html><head><!-- open </head>' + BODY) is None
+
+
+def test_signals_come_from_the_head():
+    page = ParsedPage('<html><head><title>T</title>'
+                      '<meta name="citation_publisher" content="P">'
+                      '<link rel="canonical" href="https://example.org/a">'
+                      '</head>' + BODY)
+    assert page.signals.title == 'T'
+    assert page.signals.meta('citation_publisher', ('name',)) == 'P'
+    assert page.signals.canonical_url == 'https://example.org/a'
+    assert page._soup is None
+
+    assert page.soup.p.text == 'Full text'
+
+
+def test_signal_tags_after_the_head_parse_the_page():
+    page = ParsedPage('<html><head><title>T</title></head><body>'
+                      '<meta name="citation_publisher" content="P">'
+                      '</body></html>')
+    assert page._soup is not None
+    assert page.signals.meta('citation_publisher', ('name',)) == 'P'
+
+    page = ParsedPage('<html><head></head><body><title>T</title></body>'
+                      '</html>')
+    assert page._soup is not None
+    assert page.signals.title == 'T'
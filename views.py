@@ -1,27 +1,46 @@
 import json
 import os
-from datetime import datetime, timedelta, timezone
+import time
 from io import BytesIO
 from urllib.parse import urljoin, urlencode
 
 from bs4 import BeautifulSoup
-from dateutil.parser import parse
-from flask import jsonify, request, redirect, send_file
+from flask import g, jsonify, request, redirect, send_file, Response, \
+    stream_with_context
 
 from app import app
-from exceptions import APIError, BadLandingPageError
+from exceptions import APIError, BadLandingPageError, InvalidRequestError
 from find_pdf import find_pdf_link
 from find_license import find_license_in_html
 from find_bronze_hybrid import check_access_type
-from publisher import cache
-from publisher.controller import PublisherController
-from publisher.utils import prep_message, check_bad_landing_page
+from publisher import batch, cache
+from publisher.pipeline import parse_publisher_page, pdf_parser_url
+from publisher.utils import PUBLISHER_FIELDS, check_bad_landing_page, \
+    check_landing_page_bytes, compact_response, wanted
 from repository.controller import RepositoryController
-from util import s3
+from util import metrics, s3
 from util.grobid import clean_soup
+from util.parsed_page import ParsedPage
 from util.s3 import get_landing_page, is_pdf
 
 
+@app.before_request
+def start_timing():
+    g.start_time = time.perf_counter()
+    metrics.start_request(
+        request.endpoint,
+        request.args.get('server_timing', default=False, type=is_true))
+
+
+@app.after_request
+def add_server_timing(response):
+    if request.endpoint != 'prometheus_metrics':
+        metrics.observe('total', time.perf_counter() - g.start_time)
+    if timing := metrics.server_timing():
+        response.headers['Server-Timing'] = timing
+    return response
+
+
 @app.route("/")
 def home():
     return jsonify(
@@ -50,16 +69,42 @@ def grobid_parse():
     return redirect(url)
 
 
+# fields= values for /parse-oa; oa_status is the bronze_hybrid check
+OA_FIELDS = ('pdf', 'license', 'oa_status')
+
+
 def is_true(value: str):
     return value.lower().startswith('t') or value == '1'
 
 
+def requested_fields(allowed):
+    """The fields= parameter as a frozenset, or None to return everything."""
+    value = request.args.get('fields')
+    if not value:
+        return None
+    fields = frozenset(
+        field.strip() for field in value.split(',') if field.strip())
+    if unknown := fields - set(allowed):
+        raise InvalidRequestError(
+            f"Unknown fields: {', '.join(sorted(unknown))}. "
+            f"Choose from: {', '.join(allowed)}")
+    return fields or None
+
+
 @app.route('/view')
 def view():
     doi = request.args.get("doi")
     try_stylize = request.args.get('try_stylize', default=False, type=is_true)
+    check_cache = request.args.get('check_cache', default=True, type=is_true)
     if doi.startswith('http'):
         doi = doi.split('doi.org/')[1]
+    namespace = 'view-stylized' if try_stylize else 'view'
+
+    if check_cache:
+        cached_response, validator = cache.lookup(doi, namespace)
+        if cached_response is not None:
+            return cached_response
+
     lp_contents = s3.get_landing_page(doi)
     if is_pdf(lp_contents):
         # Specify the mimetype as 'application/pdf' and set as_attachment to False
@@ -67,7 +112,12 @@ def view():
                          as_attachment=False)
     soup = BeautifulSoup(lp_contents.decode(), features='lxml', parser='lxml')
     cleaned, _ = clean_soup(soup, try_stylize)
-    return str(cleaned)
+    response = str(cleaned)
+
+    if check_cache:
+        cache.store(doi, validator, response, namespace)
+
+    return response
 
 
 @app.route("/parse-publisher")
@@ -77,100 +127,116 @@ def parse_publisher():
         doi = doi.split('doi.org/')[-1]
     check_cache = request.args.get('check_cache', 't')
     check_cache = check_cache.lower().startswith('t') or check_cache == '1'
-    update_cache = False
+    # list each affiliation once, for papers with thousands of authors
+    compact = request.args.get('compact', default=False, type=is_true)
+    fields = requested_fields(PUBLISHER_FIELDS)
+    namespace = cache.projected('parse-publisher', fields)
 
     if check_cache:
-        cached = cache.get(doi)
-        if cached:
-            cached_obj = json.loads(cached)
-            five_min_ago = datetime.now(timezone.utc) - timedelta(minutes=5)
-
-            last_updated, _, cached_response = cached_obj
-            last_updated = parse(last_updated)
-
-            if last_updated >= five_min_ago:
-                print(f'Cache hit - {doi}')
-                return jsonify(cached_response)
-            else:
-                update_cache = True
-        else:
-            update_cache = True
+        cached_response, validator = cache.lookup(doi, namespace)
+        if cached_response is not None:
+            print(f'Cache hit - {doi}')
+            return jsonify(compact_response(cached_response) if compact
+                           else cached_response)
+        response = cache.coalesced(doi, validator,
+                                   lambda: publisher_response(doi, fields),
+                                   namespace)
+    else:
+        response = publisher_response(doi, fields)
 
+    if response is None:
+        return redirect(pdf_parser_url(doi))
+    return jsonify(compact_response(response) if compact else response)
+
+
+def publisher_response(doi, fields=None):
+    """The /parse-publisher response, or None if the landing page is a PDF."""
     lp_contents = get_landing_page(doi)
-    grobid_parse_url = 'https://parseland.herokuapp.com/grobid-parse?doi=' + doi
 
     if is_pdf(lp_contents):
-        params = {
-            'doi': doi,
-            'api_key': os.getenv("OPENALEX_PDF_PARSER_API_KEY"),
-            'include_raw': 'false'
-        }
-        qs = urlencode(params)
-        path = urljoin(os.getenv('OPENALEX_PDF_PARSER_URL'), 'parse')
-        url = f'{path}?{qs}'
-        return redirect(url)
-    pc = PublisherController(lp_contents.decode(), doi)
-
-    if check_bad_landing_page(pc.soup):
-        raise BadLandingPageError()
+        return None
 
-    parser, parsed_msg = pc.best_parser_msg()
+    return parse_publisher_page(doi, lp_contents, fields)
 
-    message = prep_message(parsed_msg, parser)
 
-    response = {
-        "message": message,
-        "metadata": {
-            "parser": parser.parser_name,
-            "grobid_parse_url": grobid_parse_url,
-            "doi": doi,
-            "doi_url": f"https://doi.org/{doi}",
-        },
-    }
+@app.route("/parse-publisher/batch", methods=["POST"])
+def parse_publisher_batch():
+    body = request.get_json(silent=True) or {}
+    dois = body.get("dois")
+    if not isinstance(dois, list) or not dois or not all(
+            isinstance(doi, str) for doi in dois):
+        raise InvalidRequestError('Expected a JSON body like {"dois": [...]}')
+    if len(dois) > batch.MAX_DOIS:
+        raise InvalidRequestError(
+            f"At most {batch.MAX_DOIS} DOIs per batch, got {len(dois)}")
+    dois = [doi.split('doi.org/')[-1] if doi.startswith('http') else doi for
+            doi in dois]
+    compact = body.get("compact") is True
 
-    if check_cache and update_cache:
-        cache.set(doi, None,
-                  response)  # Setting current_s3_last_modified to None when updating the cache
+    def generate():
+        for result in batch.iter_batch_results(dois):
+            if compact and result["status"] == 200:
+                result = compact_response(result)
+            yield json.dumps(result) + "\n"
 
-    return jsonify(response)
+    return Response(stream_with_context(generate()),
+                    mimetype="application/x-ndjson")
 
 
 @app.route("/parse-oa")
 def parse_oa():
     doi = request.args.get("doi")
+    check_cache = request.args.get('check_cache', default=True, type=is_true)
     if doi.startswith('http'):
         doi = doi.split('doi.org/')[-1]
+    fields = requested_fields(OA_FIELDS)
+    namespace = cache.projected('parse-oa', fields)
+
+    if check_cache:
+        cached_response, validator = cache.lookup(doi, namespace)
+        if cached_response is not None:
+            return jsonify(cached_response)
+        response = cache.coalesced(doi, validator,
+                                   lambda: oa_response(doi, fields),
+                                   namespace)
+    else:
+        response = oa_response(doi, fields)
 
+    return jsonify(response)
+
+
+def oa_response(doi, fields=None):
+    """The /parse-oa response, running only the detectors fields ask for."""
     lp_contents = get_landing_page(doi)
-    soup = BeautifulSoup(lp_contents.decode(), features='lxml', parser='lxml')
+    check_landing_page_bytes(lp_contents)
+    page = ParsedPage.from_bytes(lp_contents)
 
-    if check_bad_landing_page(soup):
+    if check_bad_landing_page(page.signals):
         raise BadLandingPageError()
 
-    pdf_link = find_pdf_link(soup)
-    oa_license = find_license_in_html(lp_contents.decode())
+    response = {}
 
-    bronze_hybrid = check_access_type(lp_contents.decode(), soup)
+    if wanted('pdf', fields):
+        pdf_link = find_pdf_link(page)
+        response["pdf"] = {
+            "href": pdf_link.href,
+            "anchor": pdf_link.anchor,
+            "source": pdf_link.source,
+        } if pdf_link else None
+        print(f"PDF link: {pdf_link}")
 
-    pdf = {
-        "href": pdf_link.href,
-        "anchor": pdf_link.anchor,
-        "source": pdf_link.source,
-    } if pdf_link else None
+    if wanted('license', fields):
+        response["license"] = find_license_in_html(page)
 
-    print(f"PDF link: {pdf_link}")
+    if wanted('oa_status', fields):
+        response["bronze_hybrid"] = check_access_type(page)
 
-    response = {
-        "pdf": pdf,
-        "license": oa_license,
-        "bronze_hybrid": bronze_hybrid,
-        "metadata": {
-            "doi": doi,
-            "doi_url": f"https://doi.org/{doi}",
-        },
+    response["metadata"] = {
+        "doi": doi,
+        "doi_url": f"https://doi.org/{doi}",
     }
 
-    return jsonify(response)
+    return response
 
 
 @app.route("/parse-repository")
@@ -203,6 +269,12 @@ def handle_exception(err):
     return jsonify(response), err.code
 
 
+@app.route('/metrics')
+def prometheus_metrics():
+    body, content_type = metrics.exposition()
+    return Response(body, content_type=content_type)
+
+
 @app.route('/debug-sentry')
 def trigger_error():
     division_by_zero = 1 / 0